@@ -0,0 +1 @@
+"""오프라인/로봇용 성능 측정 스크립트. 각 모듈은 `python -m bench.<이름>` 으로 실행."""
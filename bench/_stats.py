@@ -0,0 +1,30 @@
+"""벤치마크 공용: 표본 요약(평균/백분위)과 표 출력."""
+from __future__ import annotations
+
+import math
+
+
+def summarize(samples: list[float], scale: float = 1e3) -> dict:
+    """초 단위 표본을 scale(기본 ms) 단위 요약 dict로."""
+    if not samples:
+        return {"n": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "std": 0.0}
+    s = sorted(x * scale for x in samples)
+    n = len(s)
+    mean = sum(s) / n
+    std = math.sqrt(sum((x - mean) ** 2 for x in s) / n)
+
+    def pct(p: float) -> float:
+        return s[min(n - 1, int(round(p / 100.0 * (n - 1))))]
+
+    return {"n": n, "mean": mean, "p50": pct(50), "p95": pct(95), "p99": pct(99), "max": s[-1], "std": std}
+
+
+def print_table(rows: list[dict], columns: list[str]) -> None:
+    """dict 목록을 고정폭 표로 출력."""
+    def fmt(v) -> str:
+        return f"{v:.3f}" if isinstance(v, float) else str(v)
+
+    widths = {c: max(len(c), *(len(fmt(r.get(c, ""))) for r in rows)) if rows else len(c) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for r in rows:
+        print("  ".join(fmt(r.get(c, "")).ljust(widths[c]) for c in columns))
@@ -0,0 +1,92 @@
+"""마커 검출 fps: 매 프레임 전체 화면 검사 대 직전 마커 주변 ROI 우선 검사, 자세 계산 비용 포함.
+
+    python -m bench.aruco --frames 200
+    python -m bench.aruco --dictionary DICT_APRILTAG_36h11 --markers 2
+
+합성 시퀀스(640x480): 질감 배경 위에 마커 --markers개가 천천히 움직이며 원근 변형된다.
+일치율은 전체 화면 검사로 찾은 (id 집합)과 같은 프레임 비율.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+
+
+def _marker_image(dictionary, marker_id: int, px: int) -> np.ndarray:
+    aruco = cv2.aruco
+    if hasattr(aruco, "generateImageMarker"):
+        img = aruco.generateImageMarker(dictionary, marker_id, px)
+    else:
+        img = aruco.drawMarker(dictionary, marker_id, px)
+    return cv2.copyMakeBorder(img, px // 8, px // 8, px // 8, px // 8, cv2.BORDER_CONSTANT, value=255)
+
+
+def _sequence(dictionary, count: int, markers: int, size: tuple[int, int]) -> list[np.ndarray]:
+    w, h = size
+    rng = np.random.default_rng(3)
+    background = cv2.GaussianBlur(rng.integers(40, 200, (h, w, 3), dtype=np.uint8), (5, 5), 0)
+    tiles = [cv2.cvtColor(_marker_image(dictionary, i, 80), cv2.COLOR_GRAY2BGR) for i in range(markers)]
+    frames = []
+    for n in range(count):
+        img = background.copy()
+        for i, tile in enumerate(tiles):
+            t = n / 30.0 + i * 2.1
+            cx = w * (0.3 + 0.4 * i / max(1, markers - 1)) + 40 * math.sin(t)
+            cy = h * 0.5 + 60 * math.cos(t * 0.7)
+            s = tile.shape[0] * (0.9 + 0.2 * math.sin(t * 1.3)) / 2
+            skew = 0.15 * s * math.sin(t)
+            dst = np.float32([[cx - s, cy - s + skew], [cx + s, cy - s - skew],
+                              [cx + s, cy + s + skew], [cx - s, cy + s - skew]])
+            src = np.float32([[0, 0], [tile.shape[1], 0], [tile.shape[1], tile.shape[0]], [0, tile.shape[0]]])
+            warped = cv2.warpPerspective(tile, cv2.getPerspectiveTransform(src, dst), (w, h),
+                                         borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0))
+            mask = cv2.warpPerspective(np.full(tile.shape[:2], 255, np.uint8), cv2.getPerspectiveTransform(src, dst), (w, h))
+            img[mask > 0] = warped[mask > 0]
+        frames.append(img)
+    return frames
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames", type=int, default=150)
+    ap.add_argument("--markers", type=int, default=1)
+    ap.add_argument("--dictionary", default="DICT_4X4_50")
+    ap.add_argument("--full-every", type=int, default=15)
+    args = ap.parse_args()
+
+    from findee._aruco import _Intrinsics, _MarkerDetector, _dictionary, detect_markers
+    from findee._frame import _Frame
+
+    frames = _sequence(_dictionary(args.dictionary), args.frames, args.markers, (640, 480))
+    intrinsics = _Intrinsics.approximate((640, 480))
+    truth = None
+    rows = []
+    for label, full_every, length in (("full_scan", 1, None), ("roi_guided", args.full_every, None),
+                                      ("roi_guided+pose", args.full_every, 0.05)):
+        detector = _MarkerDetector(args.dictionary, full_every=full_every)
+        samples, ids = [], []
+        for img in frames:
+            frame = _Frame(img, 1, None)
+            t0 = time.perf_counter()
+            found = detect_markers(detector, frame, length, intrinsics)
+            samples.append(time.perf_counter() - t0)
+            ids.append(frozenset(m.id for m in found))
+        if truth is None:
+            truth = ids
+        s = summarize(samples)
+        st = detector.get_stats()
+        rows.append({"mode": label, "fps": 1000.0 / s["mean"] if s["mean"] else 0.0, "p50_ms": s["p50"],
+                     "p95_ms": s["p95"], "full_scans": st["full_scans"], "roi_hits": st["roi_hits"],
+                     "agree": f"{sum(a == b for a, b in zip(ids, truth))}/{len(frames)}",
+                     "found": sum(bool(x) for x in ids)})
+    print_table(rows, ["mode", "fps", "p50_ms", "p95_ms", "full_scans", "roi_hits", "found", "agree"])
+
+
+if __name__ == "__main__":
+    main()
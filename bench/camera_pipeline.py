@@ -0,0 +1,107 @@
+"""카메라 소비 경로별 처리량/지연 측정 (하드웨어 없이 synthetic 또는 video 백엔드로 재현 가능).
+
+    python -m bench.camera_pipeline --backend synthetic --profile vga_qvga --seconds 3
+    python -m bench.camera_pipeline --backend video:/data/run1.mp4
+
+각 경로는 wait_next로 새 프레임마다 한 번씩 처리한다:
+  copy     get_frame 사본 + cvtColor(HSV)
+  ref      get_frame_ref 읽기 전용 뷰 + cvtColor(HSV)
+  jpeg     get_frame_ref + encode_jpeg (캐시 경유)
+  mjpeg    mjpeg_gen 파트 수신
+  shared   mjpeg_gen 클라이언트 스레드와 jpeg 경로를 동시에 (같은 프레임 인코딩 공유 -> 캐시 적중)
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+import cv2
+
+from bench._stats import print_table, summarize
+
+
+def _consume(camera, mode: str, stream: str, seconds: float) -> dict:
+    samples = []
+    frames = 0
+    last_seq = None
+    end = time.monotonic() + seconds
+    if mode == "shared":
+        stop = threading.Event()
+
+        def client():
+            gen = camera.mjpeg_gen(stream=stream)
+            while not stop.is_set():
+                next(gen)
+            gen.close()
+
+        t = threading.Thread(target=client, daemon=True)
+        t.start()
+        try:
+            row = _consume(camera, "jpeg", stream, seconds)
+        finally:
+            stop.set()
+            t.join(2.0)
+        row["path"] = "shared"
+        return row
+    if mode == "mjpeg":
+        gen = camera.mjpeg_gen(stream=stream)
+        while time.monotonic() < end:
+            t0 = time.perf_counter()
+            next(gen)
+            samples.append(time.perf_counter() - t0)
+            frames += 1
+        gen.close()
+    else:
+        while time.monotonic() < end:
+            ref = camera.wait_next_ref(last_seq, timeout=1.0, stream=stream)
+            if ref is None:
+                continue
+            with ref:
+                last_seq = ref.seq
+                t0 = time.perf_counter()
+                if mode == "copy":
+                    cv2.cvtColor(ref.writable(), cv2.COLOR_BGR2HSV)
+                elif mode == "ref":
+                    cv2.cvtColor(ref.array, cv2.COLOR_BGR2HSV)
+                else:
+                    camera.encode_jpeg(ref.array)
+                samples.append(time.perf_counter() - t0)
+            frames += 1
+    s = summarize(samples)
+    return {"path": mode, "stream": stream, "frames": frames, "fps": frames / seconds,
+            "p50_ms": s["p50"], "p95_ms": s["p95"], "max_ms": s["max"]}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--backend", default="synthetic", help="synthetic | video:<경로> | picamera2")
+    ap.add_argument("--profile", default="vga_qvga")
+    ap.add_argument("--seconds", type=float, default=3.0)
+    args = ap.parse_args()
+
+    from findee._camera import _Camera
+
+    camera = _Camera()
+    camera.init(args.profile, backend=args.backend)
+    if camera.camera is None:
+        raise SystemExit(f"카메라 백엔드를 열 수 없습니다: {args.backend}")
+    streams = ("main", "lores") if "lores" in camera._streams else ("main",)
+    rows = []
+    try:
+        for stream in streams:
+            for mode in ("copy", "ref", "jpeg", "mjpeg", "shared"):
+                rows.append(_consume(camera, mode, stream, args.seconds))
+        pool = camera.get_pool_stats()
+        jpeg = camera.jpeg_cache.get_stats()
+    finally:
+        camera.cleanup()
+    print_table(rows, ["path", "stream", "frames", "fps", "p50_ms", "p95_ms", "max_ms"])
+    print()
+    for stream, stats in pool.items():
+        print(f"pool[{stream}]: slots={stats['slots']} reuses={stats['reuses']} copies={stats['copies']} dropped={stats['dropped']}")
+    print(f"jpeg cache: hits={jpeg['hits']} misses={jpeg['misses']} hit_rate={jpeg['hit_rate']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""고정 주기 제어 루프의 주기/지터를 CPU 부하 유무로 비교.
+
+    python -m bench.control_loop --rate 100 --seconds 5 --load-threads 3
+
+하드웨어 없이 실행 가능 (IMU 대신 고정 값 사용). 부하는 영상 처리 + 순수 파이썬 연산 스레드.
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+
+from bench._stats import print_table
+from bench.motion_latency import _vision_load
+
+
+class _FixedIMU:
+    def get_rpy(self):
+        return 0.0, 0.0, 0.0
+
+
+def _run(rate: float, seconds: float, overrun: str) -> dict:
+    from findee._control_loop import _ControlLoop
+
+    acc = [0.0]
+
+    def step(snap):
+        # 가벼운 PID 한 번 분량
+        acc[0] = acc[0] * 0.9 + snap.yaw * 0.1
+
+    stats = _ControlLoop(step, rate, imu=_FixedIMU(), overrun=overrun).run(duration=seconds)
+    return {
+        "ticks": stats["ticks"],
+        "overruns": stats["overruns"],
+        "skipped": stats["skipped"],
+        "period_mean_ms": stats["period"].get("mean_ms", 0.0),
+        "period_max_ms": stats["period"].get("max_ms", 0.0),
+        "jitter_p50_ms": stats["jitter"].get("p50_ms", 0.0),
+        "jitter_p99_ms": stats["jitter"].get("p99_ms", 0.0),
+        "jitter_max_ms": stats["jitter"].get("max_ms", 0.0),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rate", type=float, default=100.0)
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--load-threads", type=int, default=3)
+    ap.add_argument("--overrun", default="skip", choices=("skip", "delay"))
+    args = ap.parse_args()
+
+    rows = [{"condition": "idle", **_run(args.rate, args.seconds, args.overrun)}]
+    stop = threading.Event()
+    workers = [threading.Thread(target=_vision_load, args=(stop,), daemon=True) for _ in range(args.load_threads)]
+    for w in workers:
+        w.start()
+    rows.append({"condition": f"load x{args.load_threads}", **_run(args.rate, args.seconds, args.overrun)})
+    stop.set()
+    for w in workers:
+        w.join()
+    print_table(rows, ["condition", "ticks", "overruns", "skipped", "period_mean_ms", "period_max_ms",
+                       "jitter_p50_ms", "jitter_p99_ms", "jitter_max_ms"])
+
+
+if __name__ == "__main__":
+    main()
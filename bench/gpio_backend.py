@@ -0,0 +1,110 @@
+"""GPIO 백엔드별 PWM CPU 비용과 타이밍 지터 비교.
+
+    python -m bench.gpio_backend --backends rpi lgpio sim --seconds 5
+    python -m bench.gpio_backend --backends rpi lgpio --loopback 18:17   # PWM 출력 18 → 입력 17 연결 시 주기 지터 측정
+
+백엔드마다 별도 프로세스에서 모터 핀 4개에 1 kHz PWM(duty 50%)을 켜고,
+프로세스 CPU 시간/벽시계 비율, ChangeDutyCycle 호출 지연, (루프백 시) 에지 주기 지터를 잰다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from bench._stats import print_table, summarize
+
+_MOTOR_PINS = (24, 23, 27, 22)
+_PWM_FREQ = 1000
+
+
+def _measure(backend: str, seconds: float, loopback: str | None) -> dict:
+    from findee._gpio import select_backend
+
+    gpio = select_backend(backend)
+    gpio.setwarnings(False)
+    gpio.setmode(gpio.BCM)
+    gpio.setup(_MOTOR_PINS, gpio.OUT, initial=gpio.LOW)
+
+    # 기준: PWM 없이 유휴 CPU
+    w0, c0 = time.monotonic(), time.process_time()
+    time.sleep(seconds / 2)
+    idle_cpu = (time.process_time() - c0) / (time.monotonic() - w0) * 100.0
+
+    pwms = [gpio.PWM(p, _PWM_FREQ) for p in _MOTOR_PINS]
+    for p in pwms:
+        p.start(50)
+
+    edges: list[float] = []
+    if loopback:
+        out_pin, in_pin = (int(x) for x in loopback.split(":"))
+        gpio.setup(out_pin, gpio.OUT, initial=gpio.LOW)
+        gpio.setup(in_pin, gpio.IN, pull_up_down=gpio.PUD_DOWN)
+        probe = gpio.PWM(out_pin, _PWM_FREQ)
+        probe.start(50)
+        pwms.append(probe)
+        gpio.add_event_detect(in_pin, gpio.RISING, callback=lambda ch: edges.append(time.perf_counter()))
+
+    w0, c0 = time.monotonic(), time.process_time()
+    time.sleep(seconds)
+    pwm_cpu = (time.process_time() - c0) / (time.monotonic() - w0) * 100.0
+
+    call_lat = []
+    for i in range(2000):
+        t0 = time.perf_counter()
+        pwms[i % 4].ChangeDutyCycle(20 + (i % 80))
+        call_lat.append(time.perf_counter() - t0)
+
+    if loopback:
+        gpio.remove_event_detect(in_pin)
+    for p in pwms:
+        p.stop()
+    gpio.cleanup()
+
+    period = 1.0 / _PWM_FREQ
+    jitter = [abs((b - a) - period) for a, b in zip(edges, edges[1:])]
+    j = summarize(jitter, scale=1e6)
+    c = summarize(call_lat, scale=1e6)
+    return {
+        "backend": backend,
+        "idle_cpu_%": idle_cpu,
+        "pwm_cpu_%": pwm_cpu,
+        "duty_call_us_p50": c["p50"],
+        "duty_call_us_p99": c["p99"],
+        "edges": len(edges),
+        "jitter_us_p50": j["p50"],
+        "jitter_us_p99": j["p99"],
+        "jitter_us_max": j["max"],
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--backends", nargs="+", default=["rpi", "lgpio", "sim"])
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--loopback", default=None, help="OUT:IN BCM 핀 (점퍼로 연결)")
+    ap.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(_measure(args.child, args.seconds, args.loopback)))
+        return
+
+    rows = []
+    for name in args.backends:
+        cmd = [sys.executable, "-m", "bench.gpio_backend", "--child", name, "--seconds", str(args.seconds)]
+        if args.loopback:
+            cmd += ["--loopback", args.loopback]
+        r = subprocess.run(cmd, capture_output=True, text=True)
+        if r.returncode != 0:
+            print(f"[{name}] 실패: {r.stderr.strip().splitlines()[-1] if r.stderr.strip() else r.returncode}")
+            continue
+        rows.append(json.loads(r.stdout.strip().splitlines()[-1]))
+    print_table(rows, ["backend", "idle_cpu_%", "pwm_cpu_%", "duty_call_us_p50", "duty_call_us_p99",
+                       "edges", "jitter_us_p50", "jitter_us_p99", "jitter_us_max"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""JPEG 인코더 백엔드 x 프리셋별 인코딩 시간과 크기 비교.
+
+    python -m bench.jpeg_presets --repeat 50
+    python -m bench.jpeg_presets --images "/data/run1/*.jpg"
+
+기준 프레임: synthetic 카메라 패턴, 부드러운 그라디언트, 잡음(최악의 경우). --images를 주면 해당 이미지들도 추가.
+PyTurboJPEG가 설치되어 있으면 turbojpeg 백엔드도 함께 측정한다.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+
+
+def _reference_frames(size: tuple[int, int], images: str | None) -> dict[str, np.ndarray]:
+    from findee._camera_backends import _SyntheticBackend
+
+    w, h = size
+    synth = _SyntheticBackend()
+    synth.configure(size, None, 30)
+    with synth.capture(("main",)) as (arrays, _):
+        pattern = arrays["main"].copy()
+    x = np.linspace(0, 255, w, dtype=np.float32)
+    y = np.linspace(0, 255, h, dtype=np.float32)[:, None]
+    gradient = np.dstack([np.broadcast_to(x, (h, w)), np.broadcast_to(y, (h, w)), (x + y) / 2]).astype(np.uint8)
+    noise = np.random.default_rng(0).integers(0, 256, (h, w, 3), dtype=np.uint8)
+    frames = {"pattern": pattern, "gradient": gradient, "noise": noise}
+    for path in sorted(glob.glob(images))[:8] if images else []:
+        img = cv2.imread(path)
+        if img is not None:
+            frames[path.rsplit("/", 1)[-1]] = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+    return frames
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=30)
+    ap.add_argument("--width", type=int, default=640)
+    ap.add_argument("--height", type=int, default=480)
+    ap.add_argument("--images", default=None, help="추가 기준 이미지 glob")
+    args = ap.parse_args()
+
+    from findee._jpeg import JPEG_PRESETS, _JpegEncoder
+
+    encoders = [_JpegEncoder("opencv")]
+    try:
+        encoders.append(_JpegEncoder("turbojpeg"))
+    except Exception:
+        print("turbojpeg 미설치: opencv만 측정")
+    frames = _reference_frames((args.width, args.height), args.images)
+    rows = []
+    for enc in encoders:
+        for preset in JPEG_PRESETS:
+            for name, frame in frames.items():
+                enc.encode(frame, preset)  # 중간 버퍼 할당 제외
+                samples = []
+                size = 0
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    data = enc.encode(frame, preset)
+                    samples.append(time.perf_counter() - t0)
+                    size = len(data)
+                s = summarize(samples)
+                rows.append({"backend": enc.backend, "preset": preset, "frame": name,
+                             "p50_ms": s["p50"], "p95_ms": s["p95"], "kb": size / 1024.0})
+    print_table(rows, ["backend", "preset", "frame", "p50_ms", "p95_ms", "kb"])
+
+
+if __name__ == "__main__":
+    main()
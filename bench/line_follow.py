@@ -0,0 +1,87 @@
+"""라인 트레이싱: 전체 프레임 mask + moments(지금의 사용자 코드) 대 스캔라인 띠(follow_line) 비용과 오프셋 차이.
+
+    python -m bench.line_follow --frames 200
+    python -m bench.line_follow --images "/data/line/*.jpg" --bands 0.6,0.8,0.95
+
+합성 프레임(640x480): 밝은 바닥 질감 위에 폭 40px 검은 곡선. 오프셋 차이는 -1~1 정규화 값의 평균 절대 차.
+전체 프레임 방식의 오프셋은 화면 아래 절반 마스크의 무게중심(moments) 기준.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+
+
+def _frames(count: int, size: tuple[int, int], images: str | None) -> list[np.ndarray]:
+    w, h = size
+    rng = np.random.default_rng(4)
+    floor = cv2.GaussianBlur(rng.integers(150, 230, (h, w, 3), dtype=np.uint8), (7, 7), 0)
+    frames = []
+    for i in range(count):
+        img = floor.copy()
+        bend = 120 * np.sin(i / 25.0)
+        shift = 100 * np.sin(i / 40.0)
+        ys = np.arange(h // 3, h, 4)
+        xs = w / 2 + shift + bend * ((h - ys) / h) ** 2
+        pts = np.stack([xs, ys], axis=1).astype(np.int32)
+        cv2.polylines(img, [pts], False, (25, 25, 25), 40)
+        frames.append(img)
+    for path in sorted(glob.glob(images)) if images else []:
+        img = cv2.imread(path)
+        if img is not None:
+            frames.append(cv2.resize(img, size, interpolation=cv2.INTER_AREA))
+    return frames
+
+
+def _full_frame(bgr: np.ndarray) -> float | None:
+    """흔한 사용자 코드: 전체 gray -> Otsu -> 아래 절반 moments."""
+    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    _, mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+    m = cv2.moments(mask[mask.shape[0] // 2:], binaryImage=True)
+    if m["m00"] == 0:
+        return None
+    half = (bgr.shape[1] - 1) / 2.0
+    return (m["m10"] / m["m00"] - half) / half
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames", type=int, default=150)
+    ap.add_argument("--bands", default="0.55,0.7,0.85,0.95")
+    ap.add_argument("--band-height", type=int, default=6)
+    ap.add_argument("--images", default=None, help="추가 녹화 프레임 glob")
+    args = ap.parse_args()
+
+    from findee._line_follow import follow_line
+
+    bands = [float(b) for b in args.bands.split(",")]
+    frames = _frames(args.frames, (640, 480), args.images)
+    full_t, scan_t, diffs, angles = [], [], [], 0
+    for bgr in frames:
+        t0 = time.perf_counter()
+        ref = _full_frame(bgr)
+        full_t.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        res = follow_line(bgr, bands, args.band_height)
+        scan_t.append(time.perf_counter() - t0)
+        if ref is not None and res.found:
+            diffs.append(abs(res.offset - ref))
+        angles += res.angle is not None
+    rows = []
+    for label, samples in (("full_frame_moments", full_t), ("scanline_bands", scan_t)):
+        s = summarize(samples)
+        rows.append({"method": label, "mean_ms": s["mean"], "p50_ms": s["p50"], "p95_ms": s["p95"]})
+    print_table(rows, ["method", "mean_ms", "p50_ms", "p95_ms"])
+    ratio = summarize(scan_t)["mean"] / max(1e-9, summarize(full_t)["mean"])
+    print(f"\n스캔라인/전체 비용 비율: {ratio:.2f}  오프셋 평균 절대 차: {np.mean(diffs) if diffs else 0.0:.3f}"
+          f"  각도 계산 프레임: {angles}/{len(frames)}")
+
+
+if __name__ == "__main__":
+    main()
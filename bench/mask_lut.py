@@ -0,0 +1,84 @@
+"""mask_image: 매 프레임 cvtColor(HSV) + 경계 배열 생성 + inRange 대 BGR565 색 조회표(from_bgr=True) 비교.
+
+    python -m bench.mask_lut --repeat 200
+    python -m bench.mask_lut --images "/data/run1/*.jpg" --bound 0,10,100,255,100,255
+
+한 프레임 비용(p50/p95), 슬라이더 값이 바뀌어 표를 다시 만들 때의 비용, HSV 경로와 마스크가 다른 픽셀 비율을 출력한다.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+
+
+def _hsv_path(bgr: np.ndarray, v: list[int]) -> np.ndarray:
+    """이전 사용자 코드 흐름 그대로: cvtColor 후 mask_image."""
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    lower = np.array([int(v[0]), int(v[2]), int(v[4])])
+    upper = np.array([int(v[1]), int(v[3]), int(v[5])])
+    return cv2.inRange(hsv, lower, upper)
+
+
+def _frames(size: tuple[int, int], images: str | None) -> dict[str, np.ndarray]:
+    from findee._camera_backends import _SyntheticBackend
+
+    w, h = size
+    synth = _SyntheticBackend()
+    synth.configure(size, None, 30)
+    with synth.capture(("main",)) as (arrays, _):
+        frames = {"pattern": arrays["main"].copy()}
+    rng = np.random.default_rng(0)
+    frames["smooth"] = cv2.GaussianBlur(rng.integers(0, 256, (h, w, 3), dtype=np.uint8), (31, 31), 0) * 3
+    frames["noise"] = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+    for path in sorted(glob.glob(images))[:8] if images else []:
+        img = cv2.imread(path)
+        if img is not None:
+            frames[path.rsplit("/", 1)[-1]] = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+    return frames
+
+
+def _time(fn, repeat: int) -> list[float]:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=100)
+    ap.add_argument("--width", type=int, default=640)
+    ap.add_argument("--height", type=int, default=480)
+    ap.add_argument("--bound", default="30,80,60,255,60,255", help="h_lo,h_hi,s_lo,s_hi,v_lo,v_hi")
+    ap.add_argument("--images", default=None, help="추가 녹화 프레임 glob")
+    args = ap.parse_args()
+
+    from findee._color_lut import _BgrMaskLut
+
+    bound = [int(v) for v in args.bound.split(",")]
+    lut = _BgrMaskLut(bound)
+    rows = []
+    for name, bgr in _frames((args.width, args.height), args.images).items():
+        ref = _hsv_path(bgr, bound)
+        got = lut.mask(bgr)
+        diff = cv2.countNonZero(cv2.compare(ref, got, cv2.CMP_NE)) / float(ref.size) * 100.0
+        for label, fn in (("hsv+inRange", lambda: _hsv_path(bgr, bound)), ("bgr565_lut", lambda: lut.mask(bgr))):
+            s = summarize(_time(fn, args.repeat))
+            rows.append({"frame": name, "path": label, "p50_ms": s["p50"], "p95_ms": s["p95"],
+                         "diff_pct": diff if label == "bgr565_lut" else 0.0})
+    print_table(rows, ["frame", "path", "p50_ms", "p95_ms", "diff_pct"])
+    build = summarize(_time(lambda: _BgrMaskLut(bound), max(5, args.repeat // 10)))
+    print(f"\n표 재생성(슬라이더 변경 시 1회): p50 {build['p50']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
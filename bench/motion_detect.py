@@ -0,0 +1,120 @@
+"""움직임 감지: 원본 해상도 프레임 차분(지금의 사용자 코드) 대 저해상도 누적 배경(create_motion_detector) 비용과 감지 일치.
+
+    python -m bench.motion_detect --frames 300
+    python -m bench.motion_detect --video /data/hallway.mp4 --width 64 --alpha 0.1
+
+합성 프레임(640x480): 질감 있는 정지 배경 + 센서 잡음, 중간중간 물체가 지나가는 구간이 있다.
+정답은 물체가 화면에 있는 프레임. --video를 주면 그 영상 프레임을 추가로 돌려 비용과 trigger 비율만 본다.
+  full_diff   직전 프레임 gray와 absdiff -> threshold -> dilate -> findContours (640x480)
+  low_res     _MotionDetector.update (기본 80x60, accumulateWeighted 배경)
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+
+
+def _synthetic(count: int, size: tuple[int, int]) -> tuple[list[np.ndarray], list[bool]]:
+    w, h = size
+    rng = np.random.default_rng(7)
+    background = cv2.GaussianBlur(rng.integers(40, 210, (h, w, 3), dtype=np.uint8), (9, 9), 0)
+    frames, truth = [], []
+    for i in range(count):
+        img = background.copy()
+        phase = i % 60
+        present = 20 <= phase < 40  # 60프레임마다 20프레임 동안 물체 통과
+        if present:
+            x = int((phase - 20) / 20.0 * (w - 80))
+            cv2.circle(img, (x + 40, h // 2 + int(30 * np.sin(i / 5.0))), 35, (230, 230, 230), -1)
+        noise = rng.integers(-6, 7, img.shape, dtype=np.int16)
+        frames.append(np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8))
+        truth.append(present)
+    return frames, truth
+
+
+def _video(path: str, limit: int, size: tuple[int, int]) -> list[np.ndarray]:
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < limit:
+        ok, img = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.resize(img, size, interpolation=cv2.INTER_AREA))
+    cap.release()
+    return frames
+
+
+class _FullDiff:
+    """흔한 사용자 코드: 원본 gray 직전 프레임 차분 + 윤곽선."""
+    def __init__(self, threshold: int, min_area: int):
+        self.prev = None
+        self.threshold = threshold
+        self.min_area = min_area
+
+    def update(self, bgr: np.ndarray) -> bool:
+        gray = cv2.GaussianBlur(cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY), (5, 5), 0)
+        prev, self.prev = self.prev, gray
+        if prev is None:
+            return False
+        _, mask = cv2.threshold(cv2.absdiff(gray, prev), self.threshold, 255, cv2.THRESH_BINARY)
+        mask = cv2.dilate(mask, None, iterations=2)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        return any(cv2.contourArea(c) >= self.min_area for c in contours)
+
+
+def _run(method, frames: list[np.ndarray], truth: list[bool] | None) -> tuple[list[float], dict]:
+    times, hits = [], {"tp": 0, "fp": 0, "fn": 0, "triggered": 0}
+    for i, bgr in enumerate(frames):
+        t0 = time.perf_counter()
+        moving = method(bgr)
+        times.append(time.perf_counter() - t0)
+        hits["triggered"] += moving
+        if truth is not None and i < len(truth):
+            hits["tp"] += moving and truth[i]
+            hits["fp"] += moving and not truth[i]
+            hits["fn"] += truth[i] and not moving
+    return times, hits
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames", type=int, default=240)
+    ap.add_argument("--video", default=None, help="추가 녹화 영상 (비용/trigger 비율만)")
+    ap.add_argument("--width", type=int, default=80)
+    ap.add_argument("--alpha", type=float, default=0.05)
+    ap.add_argument("--threshold", type=int, default=25)
+    args = ap.parse_args()
+
+    from findee._frame import _Frame
+    from findee._motion_detect import _MotionDetector
+
+    size = (640, 480)
+    frames, truth = _synthetic(args.frames, size)
+    sets = [("synthetic", frames, truth)]
+    if args.video:
+        sets.append(("video", _video(args.video, args.frames, size), None))
+    rows = []
+    for label, data, gt in sets:
+        full = _FullDiff(args.threshold, 500)
+        # 저해상도 쪽은 hold=0으로 맞춰 프레임 단위 판정끼리 비교
+        low = _MotionDetector(args.width, args.alpha, args.threshold, trigger=0.005, hold=0)
+        for name, fn in (("full_diff", full.update),
+                         ("low_res", lambda bgr: low.update(_Frame(bgr, seq=1)).moving)):
+            times, hits = _run(fn, data, gt)
+            s = summarize(times)
+            row = {"frames": label, "method": name, "mean_ms": s["mean"], "p95_ms": s["p95"],
+                   "triggered": hits["triggered"]}
+            if gt is not None:
+                row.update(tp=hits["tp"], fp=hits["fp"], fn=hits["fn"])
+            rows.append(row)
+    print_table(rows, ["frames", "method", "mean_ms", "p95_ms", "triggered", "tp", "fp", "fn"])
+    print(f"\n정답(synthetic) 물체 프레임: {sum(truth)}/{len(truth)}  저해상도 비교 크기: {args.width}px 폭")
+
+
+if __name__ == "__main__":
+    main()
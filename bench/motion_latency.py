@@ -0,0 +1,65 @@
+"""비동기 시간 제한 이동의 종료 지연 측정 (영상 처리 부하 유무 비교).
+
+    PF_GPIO_BACKEND=sim python -m bench.motion_latency --moves 200 --duration 0.05
+
+부하 조건에서는 별도 스레드가 640x480 프레임에 cvtColor/inRange/findContours를 반복 실행한다.
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table
+
+
+def _vision_load(stop: threading.Event) -> None:
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    while not stop.is_set():
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        mask = cv2.inRange(hsv, np.array([30, 20, 100]), np.array([80, 255, 255]))
+        cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # 순수 파이썬 부하도 섞어 GIL 경합을 재현
+        sum(i * i for i in range(2000))
+
+
+def _run(motor, moves: int, duration: float) -> dict:
+    motor._motion.latency.reset()
+    for i in range(moves):
+        h = motor.move_forward(50, duration, wait=False) if i % 2 == 0 else motor.turn_left(50, duration, wait=False)
+        h.wait()
+    return motor.get_motion_stats()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--moves", type=int, default=200)
+    ap.add_argument("--duration", type=float, default=0.05)
+    ap.add_argument("--load-threads", type=int, default=2)
+    args = ap.parse_args()
+
+    from findee._motor_ultrasonic import _MotorUltrasonic
+
+    motor = _MotorUltrasonic()
+    motor.gpio_init()
+    rows = []
+    try:
+        rows.append({"condition": "idle", **_run(motor, args.moves, args.duration)})
+        stop = threading.Event()
+        workers = [threading.Thread(target=_vision_load, args=(stop,), daemon=True) for _ in range(args.load_threads)]
+        for w in workers:
+            w.start()
+        rows.append({"condition": f"vision x{args.load_threads}", **_run(motor, args.moves, args.duration)})
+        stop.set()
+        for w in workers:
+            w.join()
+    finally:
+        motor.cleanup()
+    print_table(rows, ["condition", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""시뮬레이션 GPIO로 초음파 측정/모터 PWM 경로/에지 인터럽트를 일반 Linux에서 측정.
+
+    python -m bench.sim_gpio --samples 200
+
+- ranging: 스크립트 거리(10~200cm)에 대한 get_distance 오차와 호출 지연
+- motor: control_motors 처리량과 PWM duty 변경 기록 간격
+- interrupt: 100Hz 에지 소스(IMU Data Ready 대역)의 예정 대비 발생 지연과 콜백 수
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from bench._stats import print_table, summarize
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--samples", type=int, default=200)
+    ap.add_argument("--irq-rate", type=float, default=100.0)
+    ap.add_argument("--irq-seconds", type=float, default=2.0)
+    args = ap.parse_args()
+
+    os.environ["PF_GPIO_BACKEND"] = "sim"
+    from findee._gpio import select_backend
+    from findee._motor_ultrasonic import _MotorUltrasonic
+
+    gpio = select_backend("sim")
+    motor = _MotorUltrasonic()
+    motor.gpio_init()
+    rows = []
+
+    distances = [10.0 + (i * 7.3) % 190.0 for i in range(args.samples)]
+    gpio.attach_ultrasonic(motor.TRIG, motor.ECHO, distances)
+    errors, lat = [], []
+    for d in distances:
+        t0 = time.perf_counter()
+        measured = motor.get_distance()
+        lat.append(time.perf_counter() - t0)
+        errors.append(abs(measured - d))
+    e, l = summarize(errors, scale=1.0), summarize(lat)
+    rows.append({"path": "ranging", "n": len(distances), "p50": l["p50"], "p99": l["p99"], "max": l["max"],
+                 "extra": f"abs err cm p50={e['p50']:.2f} max={e['max']:.2f}"})
+
+    gpio.clear_pwm_log()
+    n = args.samples * 20
+    t0 = time.perf_counter()
+    for i in range(n):
+        motor.control_motors(20 + i % 80, -(20 + i % 80))
+    elapsed = time.perf_counter() - t0
+    ev = gpio.pwm_events()
+    gaps = [b[0] - a[0] for a, b in zip(ev, ev[1:])]
+    g = summarize(gaps)
+    rows.append({"path": "motor", "n": n, "p50": g["p50"], "p99": g["p99"], "max": g["max"],
+                 "extra": f"{n / elapsed:.0f} calls/s, {len(ev)} pwm events"})
+
+    callbacks = []
+    irq_pin = 4
+    gpio.setup(irq_pin, gpio.IN, pull_up_down=gpio.PUD_UP)
+    gpio.add_event_detect(irq_pin, gpio.FALLING, callback=lambda ch: callbacks.append(time.monotonic()))
+    src = gpio.add_edge_source(irq_pin, args.irq_rate)
+    time.sleep(args.irq_seconds)
+    gpio.remove_edge_source(irq_pin)
+    gpio.remove_event_detect(irq_pin)
+    s = summarize(list(src.lateness))
+    rows.append({"path": "interrupt", "n": src.fired, "p50": s["p50"], "p99": s["p99"], "max": s["max"],
+                 "extra": f"expected {int(args.irq_rate * args.irq_seconds)}, callbacks {len(callbacks)}"})
+
+    motor.cleanup()
+    print("지연 단위: ms")
+    print_table(rows, ["path", "n", "p50", "p99", "max", "extra"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""검출-후-추적(create_tracker) 대 매 프레임 검출: 프레임당 처리 시간과 위치 오차.
+
+    python -m bench.tracker --frames 300 --every 10
+    python -m bench.tracker --every 5 --heavy 4
+
+합성 시퀀스(640x480): 질감 있는 배경 위에서 빨간 원이 곡선을 그리며 움직이고, 중간에 잠깐 가려진다.
+--heavy는 실제 검출기(예: 모델 추론)를 흉내 내기 위해 검출 함수에 얹는 추가 블러 횟수.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+
+RED = [160, 180, 90, 255, 150, 255]
+
+
+def _sequence(count: int, size: tuple[int, int]):
+    """(BGR 프레임, 정답 중심 또는 None) 목록."""
+    from findee._frame import _Frame
+
+    w, h = size
+    rng = np.random.default_rng(2)
+    background = cv2.GaussianBlur(rng.integers(0, 160, (h, w, 3), dtype=np.uint8), (3, 3), 0)
+    out = []
+    for i in range(count):
+        img = background.copy()
+        cx = int(w / 2 + w / 3 * math.sin(i / 40.0))
+        cy = int(h / 2 + h / 4 * math.sin(i / 23.0))
+        hidden = count // 2 <= i < count // 2 + 10
+        if not hidden:
+            cv2.circle(img, (cx, cy), 22, (30, 20, 240), -1)
+            cv2.circle(img, (cx - 6, cy - 6), 6, (200, 200, 255), -1)  # 하이라이트: 템플릿 매칭에 질감 제공
+        out.append((_Frame(img, i + 1, None), None if hidden else (cx, cy)))
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames", type=int, default=300)
+    ap.add_argument("--every", type=int, default=10)
+    ap.add_argument("--min-score", type=float, default=0.6)
+    ap.add_argument("--heavy", type=int, default=0)
+    args = ap.parse_args()
+
+    from findee._color_lut import get_classifier
+    from findee._tracker import _DetectTracker
+
+    classifier = get_classifier({"red": RED})
+
+    def detect(frame):
+        for _ in range(args.heavy):
+            cv2.GaussianBlur(frame, (15, 15), 0)
+        blob = classifier.classify(frame.hsv, 100).get("red")
+        return (blob.x, blob.y, blob.w, blob.h) if blob is not None else None
+
+    seq = _sequence(args.frames, (640, 480))
+    rows = []
+    for label, every in (("detect_every_frame", 1), (f"track_every_{args.every}", args.every)):
+        tracker = _DetectTracker(detect, every=every, min_score=args.min_score)
+        samples, errors, found, false_pos = [], [], 0, 0
+        for frame, truth in seq:
+            frame = frame.copy_frame()  # 파생 이미지 캐시 초기화 (실제 카메라처럼 매 프레임 새 배열)
+            t0 = time.perf_counter()
+            result = tracker.update(frame)
+            samples.append(time.perf_counter() - t0)
+            if result is not None and truth is not None:
+                found += 1
+                errors.append(math.hypot(result.cx - truth[0], result.cy - truth[1]))
+            elif result is not None:
+                false_pos += 1
+        s = summarize(samples)
+        st = tracker.get_stats()
+        rows.append({"mode": label, "mean_ms": s["mean"], "p95_ms": s["p95"],
+                     "detect_ratio": st["detect_ratio"], "found": found, "false_pos": false_pos,
+                     "err_px": sum(errors) / len(errors) if errors else 0.0})
+    print_table(rows, ["mode", "mean_ms", "p95_ms", "detect_ratio", "found", "false_pos", "err_px"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""신호등 인식: 이전 구현(inRange 2회 + findContours) 대 지금의 detect_traffic_light, LUT 분류기(detect_colors) 지연과 결과 일치율.
+
+    python -m bench.traffic_light --repeat 200
+    python -m bench.traffic_light --images "/data/run1/*.jpg"
+
+기준 프레임(640x480): 빨간 불, 초록 불, 불 없음, 둘 다(빨간색 우선), 잡음, synthetic 카메라 패턴. --images로 녹화 프레임 추가.
+"traffic_light"는 detect_traffic_light 경로(LUT 한 번으로 두 색 라벨링 + 같은 외곽선 면적 판정, 빨강을 찾으면 초록 생략),
+"lut"는 detect_colors로 같은 판정
+(연결 영역 픽셀 수라 잡음 프레임에서 결과가 다를 수 있다). "lut_n"은 같은 패스에 색을 더 얹었을 때(빨강 2범위 + 노랑 + 파랑) 비용이 얼마나 느는지 보여준다.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+
+GREEN = [30, 80, 20, 255, 100, 255]
+RED = [160, 180, 90, 255, 200, 255]
+
+
+def legacy_detect(hsv_image: np.ndarray, green_bound=GREEN, red_bound=RED) -> int:
+    """Findee.detect_traffic_light의 이전 구현 그대로."""
+    green_lower = np.array([green_bound[0], green_bound[2], green_bound[4]])
+    green_upper = np.array([green_bound[1], green_bound[3], green_bound[5]])
+    green_mask = cv2.inRange(hsv_image, green_lower, green_upper)
+    red_lower = np.array([red_bound[0], red_bound[2], red_bound[4]])
+    red_upper = np.array([red_bound[1], red_bound[3], red_bound[5]])
+    red_mask = cv2.inRange(hsv_image, red_lower, red_upper)
+
+    def largest(mask):
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            return 0
+        return cv2.contourArea(max(contours, key=cv2.contourArea))
+
+    if largest(red_mask) >= 100:
+        return 2
+    if largest(green_mask) >= 100:
+        return 1
+    return 0
+
+
+def _scenes(size: tuple[int, int], images: str | None) -> dict[str, np.ndarray]:
+    """BGR 기준 프레임."""
+    from findee._camera_backends import _SyntheticBackend
+
+    w, h = size
+    rng = np.random.default_rng(0)
+    base = (rng.integers(30, 90, (h, w, 3), dtype=np.uint8))
+    red_bgr, green_bgr = (40, 20, 250), (60, 230, 40)
+    frames = {}
+    frames["none"] = base.copy()
+    frames["red"] = base.copy()
+    cv2.circle(frames["red"], (w // 2, h // 3), h // 16, red_bgr, -1)
+    frames["green"] = base.copy()
+    cv2.circle(frames["green"], (w // 2, h // 3), h // 16, green_bgr, -1)
+    frames["both"] = frames["red"].copy()
+    cv2.circle(frames["both"], (w // 2, h // 2), h // 16, green_bgr, -1)
+    frames["noise"] = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+    synth = _SyntheticBackend()
+    synth.configure(size, None, 30)
+    with synth.capture(("main",)) as (arrays, _):
+        frames["pattern"] = arrays["main"].copy()
+    for path in sorted(glob.glob(images))[:16] if images else []:
+        img = cv2.imread(path)
+        if img is not None:
+            frames[path.rsplit("/", 1)[-1]] = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+    return frames
+
+
+def _time(fn, hsv: np.ndarray, repeat: int) -> tuple[list[float], object]:
+    result = fn(hsv)  # 첫 호출(LUT 생성/버퍼 할당) 제외
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(hsv)
+        samples.append(time.perf_counter() - t0)
+    return samples, result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=100)
+    ap.add_argument("--width", type=int, default=640)
+    ap.add_argument("--height", type=int, default=480)
+    ap.add_argument("--images", default=None, help="추가 녹화 프레임 glob")
+    args = ap.parse_args()
+
+    from findee._color_lut import get_classifier, traffic_light
+
+    pair = get_classifier({"red": RED, "green": GREEN})
+    many = get_classifier({"red": [[0, 10, 90, 255, 200, 255], RED], "green": GREEN,
+                           "yellow": [20, 35, 90, 255, 150, 255], "blue": [100, 130, 90, 255, 80, 255]})
+
+    def lut_detect(hsv):
+        found = pair.classify(hsv, 100)
+        return 2 if "red" in found else 1 if "green" in found else 0
+
+    methods = {"legacy": legacy_detect, "traffic_light": lambda hsv: traffic_light(hsv, GREEN, RED), "lut": lut_detect, "lut_n": lambda hsv: many.classify(hsv, 100)}
+    rows = []
+    totals = {name: [] for name in methods}
+    agree = agree_lut = 0
+    frames = _scenes((args.width, args.height), args.images)
+    for scene, bgr in frames.items():
+        hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+        results = {}
+        for name, fn in methods.items():
+            samples, results[name] = _time(fn, hsv, args.repeat)
+            totals[name] += samples
+            s = summarize(samples)
+            rows.append({"frame": scene, "method": name, "p50_ms": s["p50"], "p95_ms": s["p95"],
+                         "result": results[name] if name != "lut_n" else ",".join(sorted(results[name])) or "-"})
+        agree += results["legacy"] == results["traffic_light"]
+        agree_lut += results["legacy"] == results["lut"]
+    print_table(rows, ["frame", "method", "p50_ms", "p95_ms", "result"])
+    print()
+    summary = [{"method": name, **{k: summarize(v)[k] for k in ("mean", "p50", "p95")}} for name, v in totals.items()]
+    print_table(summary, ["method", "mean", "p50", "p95"])
+    print(f"\nlegacy/traffic_light 결과 일치: {agree}/{len(frames)}  legacy/lut(detect_colors): {agree_lut}/{len(frames)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""같은 프레임 처리(변환 -> 검출 -> JPEG)를 한 스레드에서 순서대로 돌릴 때와 파이프라인 단계로 나눌 때의 처리량/지연 비교.
+
+    python -m bench.vision_pipeline --backend synthetic --seconds 5 --work 6
+    python -m bench.vision_pipeline --backend video:/data/run1.mp4 --detect-workers 3
+
+--work는 검출 단계의 무게(블러+에지 반복 횟수). 한 프레임 처리 시간이 프레임 간격보다 길어야 차이가 드러난다.
+  inline    wait_next -> 세 단계를 순서대로 (지금의 사용자 코드 방식)
+  threads   단계별 워커 스레드, 검출은 --detect-workers개
+  process   검출 단계만 프로세스 풀 (--detect-workers개)
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import time
+
+import cv2
+
+from bench._stats import print_table, summarize
+
+GREEN = [30, 80, 20, 255, 100, 255]
+RED = [160, 180, 90, 255, 200, 255]
+
+
+def _detect(hsv, work: int):
+    from findee._color_lut import get_classifier
+
+    for _ in range(work):
+        edges = cv2.Canny(cv2.GaussianBlur(hsv[:, :, 2], (9, 9), 0), 50, 150)
+    found = get_classifier({"red": RED, "green": GREEN}).classify(hsv, 100)
+    return hsv, found, int(edges.mean()) if work else 0
+
+
+def _encode(result):
+    from findee._jpeg import encode_jpeg
+
+    return encode_jpeg(cv2.cvtColor(result[0], cv2.COLOR_HSV2BGR), 60)
+
+
+def _inline(camera, seconds: float, work: int) -> dict:
+    samples = []
+    frames = 0
+    last = None
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        frame = camera.wait_next(last, 1.0)
+        if frame is None:
+            continue
+        last = frame.seq
+        _encode(_detect(frame.hsv, work))
+        samples.append(time.monotonic() - frame.timestamp)
+        frames += 1
+    s = summarize(samples)
+    return {"mode": "inline", "fps": frames / seconds, "p50_ms": s["p50"], "p95_ms": s["p95"], "dropped": "-"}
+
+
+def _piped(camera, seconds: float, work: int, workers: int, processes: bool) -> dict:
+    from findee._pipeline import _Pipeline
+
+    pipe = _Pipeline(lambda after, timeout: camera.wait_next(after, timeout))
+    pipe.stage("convert", lambda f: f.hsv)
+    if processes:
+        # 프로세스 단계 함수는 자식이 import할 수 있어야 하므로 lambda 대신 partial
+        pipe.stage("detect", functools.partial(_detect, work=work), processes=workers)
+    else:
+        pipe.stage("detect", lambda hsv: _detect(hsv, work), workers=workers)
+    pipe.stage("encode", _encode)
+    with pipe:
+        time.sleep(seconds)
+    stats = pipe.get_stats()["stages"]
+    last = stats["encode"]
+    return {"mode": "process" if processes else "threads", "fps": last["processed"] / seconds,
+            "p50_ms": last["latency"].get("p50_ms", 0.0), "p95_ms": last["latency"].get("p95_ms", 0.0),
+            "dropped": sum(s["dropped"] + s["stale"] for s in stats.values())}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--backend", default="synthetic", help="synthetic | video:<경로> | picamera2")
+    ap.add_argument("--profile", default="vga")
+    ap.add_argument("--seconds", type=float, default=4.0)
+    ap.add_argument("--work", type=int, default=6)
+    ap.add_argument("--detect-workers", type=int, default=3)
+    args = ap.parse_args()
+
+    from findee._camera import _Camera
+
+    camera = _Camera()
+    camera.init(args.profile, backend=args.backend)
+    if camera.camera is None:
+        raise SystemExit(f"카메라 백엔드를 열 수 없습니다: {args.backend}")
+    try:
+        rows = [
+            _inline(camera, args.seconds, args.work),
+            _piped(camera, args.seconds, args.work, args.detect_workers, False),
+            _piped(camera, args.seconds, args.work, args.detect_workers, True),
+        ]
+    finally:
+        camera.cleanup()
+    print(f"cv2 threads={cv2.getNumThreads()}  (p50/p95: 노출 시각 -> 인코딩 완료)")
+    print_table(rows, ["mode", "fps", "p50_ms", "p95_ms", "dropped"])
+
+
+if __name__ == "__main__":
+    main()
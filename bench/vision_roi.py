@@ -0,0 +1,103 @@
+"""ROI/축소 배율별 신호등 인식 지연과 정확도 (전체 프레임 원본 해상도 결과 대비).
+
+    python -m bench.vision_roi                                  # 합성 녹화 클립
+    python -m bench.vision_roi --source "video:/data/run1.mp4" --roi 0,0,640,240
+    python -m bench.vision_roi --source "video:/data/run1/*.jpg" --scales 1,0.5,0.33
+
+녹화 프레임은 video 카메라 백엔드로 읽는다. --source가 없으면 위쪽 띠에 크기가 다른 빨강/초록 불이 나오는
+클립을 임시 폴더에 만들어 쓴다. 일치율은 detect_colors 빨강/초록 판정(0/1/2), 중심 오차는 둘 다 찾은 프레임의 평균 픽셀 거리.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+from bench.traffic_light import GREEN, RED
+
+
+def _record_clip(folder: str, size: tuple[int, int], count: int) -> str:
+    """신호등이 위쪽 절반에서 움직이며 작아졌다 커지는 합성 클립을 PNG로 저장."""
+    w, h = size
+    rng = np.random.default_rng(1)
+    for i in range(count):
+        img = cv2.GaussianBlur(rng.integers(20, 110, (h, w, 3), dtype=np.uint8), (5, 5), 0)
+        cv2.rectangle(img, (0, h * 2 // 3), (w, h), (90, 90, 90), -1)  # 바닥
+        phase = i % 3
+        if phase != 2:
+            r = 4 + (i * 7) % 22
+            x = int(w * (0.2 + 0.6 * ((i * 37) % 100) / 100.0))
+            y = int(h * (0.1 + 0.3 * ((i * 53) % 100) / 100.0))
+            cv2.circle(img, (x, y), r, (40, 20, 250) if phase == 0 else (60, 230, 40), -1)
+        cv2.imwrite(os.path.join(folder, f"{i:04d}.png"), img)
+    return f"video:{folder}"
+
+
+def _frames(source: str, size: tuple[int, int], count: int) -> list[np.ndarray]:
+    from findee._camera_backends import create_backend
+
+    backend = create_backend(source)
+    backend.configure(size, None, 1000.0)
+    backend.start()
+    frames = []
+    for _ in range(count):
+        with backend.capture(("main",)) as (arrays, _):
+            frames.append(cv2.cvtColor(arrays["main"], cv2.COLOR_BGR2HSV))
+    backend.close()
+    return frames
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--source", default=None, help="video:<경로> (없으면 합성 클립)")
+    ap.add_argument("--frames", type=int, default=120)
+    ap.add_argument("--width", type=int, default=640)
+    ap.add_argument("--height", type=int, default=480)
+    ap.add_argument("--roi", default=None, help="x,y,w,h (기본: 위쪽 절반)")
+    ap.add_argument("--scales", default="1,0.5,0.25")
+    args = ap.parse_args()
+
+    from findee._color_lut import get_classifier
+
+    size = (args.width, args.height)
+    roi = tuple(int(v) for v in args.roi.split(",")) if args.roi else (0, 0, args.width, args.height // 2)
+    scales = [float(v) for v in args.scales.split(",")]
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.source or _record_clip(tmp, size, args.frames)
+        frames = _frames(source, size, args.frames)
+
+    clf = get_classifier({"red": RED, "green": GREEN})
+
+    def detect(hsv, r, s):
+        found = clf.classify(hsv, 100, r, s)
+        blob = found.get("red") or found.get("green")
+        return (2 if "red" in found else 1 if "green" in found else 0), blob
+
+    baseline = [detect(hsv, None, 1.0) for hsv in frames]
+    rows = []
+    for r in (None, roi):
+        for s in scales:
+            samples, agree, errors = [], 0, []
+            for hsv, (want, want_blob) in zip(frames, baseline):
+                t0 = time.perf_counter()
+                got, blob = detect(hsv, r, s)
+                samples.append(time.perf_counter() - t0)
+                agree += got == want
+                if blob is not None and want_blob is not None and got == want:
+                    errors.append(math.hypot(blob.cx - want_blob.cx, blob.cy - want_blob.cy))
+            st = summarize(samples)
+            rows.append({"roi": "full" if r is None else ",".join(map(str, r)), "scale": s,
+                         "p50_ms": st["p50"], "p95_ms": st["p95"],
+                         "agree": f"{agree}/{len(frames)}",
+                         "center_err_px": sum(errors) / len(errors) if errors else 0.0})
+    print_table(rows, ["roi", "scale", "p50_ms", "p95_ms", "agree", "center_err_px"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""희소 광류 시각 주행거리계(create_visual_odometry): 설정별 프레임당 비용과 궤적 오차.
+
+    python -m bench.visual_odometry --frames 300
+    python -m bench.visual_odometry --save /tmp/vo_run                     # 합성 시퀀스를 이미지 + yaw.csv로 저장
+    python -m bench.visual_odometry --sequence "/tmp/vo_run/*.png" --yaw-csv /tmp/vo_run/yaw.csv
+
+합성 시퀀스: 질감 있는 바닥(2mm/px)을 카메라 높이 --height(m), 아래로 --tilt도 기울인 카메라로 640x480 렌더링.
+로봇은 직진 -> 제자리 회전 -> 곡선 주행을 하고, IMU yaw는 참값에 잡음(0.3도)과 드리프트(0.5도/분)를 더해 넣는다.
+--sequence를 주면 녹화 시퀀스(동영상, 이미지 폴더, glob; video 백엔드와 같은 형식)를 돌린다.
+--yaw-csv는 프레임마다 yaw(도) 한 줄. 없으면 회전도 영상으로 추정하고, 참값이 없으므로 비용과 누적 거리만 본다.
+
+설정은 "max_points/levels/width". 오차는 최종 위치 오차를 이동 거리로 나눈 값(%)과 위치 오차 최대값.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import time
+
+import cv2
+import numpy as np
+
+from bench._stats import print_table, summarize
+
+CONFIGS = ("40/1/120", "80/2/160", "150/3/160", "80/2/240")
+_RES = 0.002  # 바닥 텍스처 m/px
+_FLOOR_M = 8.0
+
+
+def _floor(rng) -> np.ndarray:
+    n = int(_FLOOR_M / _RES)
+    tex = np.zeros((n, n), np.float32)
+    for cell, weight in ((64, 0.5), (16, 0.3), (4, 0.2)):
+        small = rng.random((n // cell + 1, n // cell + 1)).astype(np.float32)
+        tex += weight * cv2.resize(small, (n, n), interpolation=cv2.INTER_CUBIC)[:n, :n]
+    tex = cv2.normalize(tex, None, 40, 220, cv2.NORM_MINMAX)
+    return cv2.cvtColor(tex.astype(np.uint8), cv2.COLOR_GRAY2BGR)
+
+
+def _trajectory(count: int, fps: float) -> list[tuple[float, float, float]]:
+    """(x, y, yaw 라디안). 0.15 m/s 직진, 90도/s 제자리 회전, 0.15 m/s + 20도/s 곡선을 차례로 반복."""
+    x = y = yaw = 0.0
+    poses = []
+    dt = 1.0 / fps
+    for i in range(count):
+        phase = (i / fps) % 6.0
+        v, w = (0.15, 0.0) if phase < 2.0 else (0.0, math.radians(90)) if phase < 3.0 else (0.15, math.radians(20))
+        x += v * dt * math.cos(yaw)
+        y += v * dt * math.sin(yaw)
+        yaw += w * dt
+        poses.append((x, y, yaw))
+    return poses
+
+
+def _render(count: int, fps: float, height: float, tilt: float, seed: int):
+    from findee._aruco import _Intrinsics
+
+    rng = np.random.default_rng(seed)
+    floor = _floor(rng)
+    w, h = 640, 480
+    k = _Intrinsics.approximate((w, h)).camera_matrix
+    u, v = np.meshgrid(np.arange(w, dtype=np.float64), np.arange(h, dtype=np.float64))
+    a, b = (u - k[0, 2]) / k[0, 0], (v - k[1, 2]) / k[1, 1]
+    s, c = math.sin(math.radians(tilt)), math.cos(math.radians(tilt))
+    down = s + b * c
+    sky = down <= 1e-3
+    t = height / np.where(sky, 1.0, down)
+    gx, gy = t * (c - b * s), -t * a
+    frames, poses = [], _trajectory(count, fps)
+    for px, py, yaw in poses:
+        cs, sn = math.cos(yaw), math.sin(yaw)
+        wx, wy = px + cs * gx - sn * gy, py + sn * gx + cs * gy
+        map_x = (wx / _RES + floor.shape[1] / 2).astype(np.float32)
+        map_y = (floor.shape[0] / 2 - wy / _RES).astype(np.float32)
+        map_x[sky] = -1
+        img = cv2.remap(floor, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=(170, 170, 170))
+        noise = rng.integers(-3, 4, img.shape, dtype=np.int16)
+        frames.append(np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8))
+    drift = math.radians(0.5) / 60.0 / fps
+    yaws = [math.degrees(yaw + i * drift) + rng.normal(0, 0.3) for i, (_, _, yaw) in enumerate(poses)]
+    return frames, yaws, poses
+
+
+def _load(spec: str, limit: int) -> list[np.ndarray]:
+    from findee._camera_backends import _VideoBackend
+
+    src = _VideoBackend(spec)
+    total = len(src._files) if src._files else int(src._cap.get(cv2.CAP_PROP_FRAME_COUNT)) or limit
+    frames = []
+    for _ in range(min(limit, total)):
+        img = src._read()
+        if img is None:
+            break
+        frames.append(cv2.resize(img, (640, 480), interpolation=cv2.INTER_AREA) if img.shape[:2] != (480, 640) else img)
+    return frames
+
+
+def _run(config: str, frames, yaws, truth, height: float, tilt: float) -> dict:
+    from findee._frame import _Frame
+    from findee._visual_odometry import _FlowOdometry
+
+    points, levels, width = (int(v) for v in config.split("/"))
+    vo = _FlowOdometry(None, None, height, tilt, width, points, max(3, points // 3), levels)
+    times, worst, path = [], 0.0, 0.0
+    for i, bgr in enumerate(frames):
+        t0 = time.perf_counter()
+        pose = vo.update(_Frame(bgr, seq=i + 1), yaws[i] if yaws else None)
+        times.append(time.perf_counter() - t0)
+        path += math.hypot(pose.dx, pose.dy)
+        if truth:
+            worst = max(worst, math.hypot(pose.x - truth[i][0], pose.y - truth[i][1]))
+    s = summarize(times)
+    row = {"config": config, "mean_ms": s["mean"], "p95_ms": s["p95"], "tracked": vo.get_stats()["mean_tracked"],
+           "lost": vo.lost, "path_m": path}
+    if truth:
+        true_path = sum(math.hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(truth, truth[1:]))
+        final = math.hypot(vo.x - truth[-1][0], vo.y - truth[-1][1])
+        row.update(true_m=true_path, final_err_pct=100.0 * final / max(1e-9, true_path), max_err_m=worst,
+                   heading_err=abs((vo.heading - math.degrees(truth[-1][2]) + 180.0) % 360.0 - 180.0))
+    return row
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames", type=int, default=240)
+    ap.add_argument("--fps", type=float, default=30.0)
+    ap.add_argument("--height", type=float, default=0.1, help="카메라 높이 (m)")
+    ap.add_argument("--tilt", type=float, default=30.0, help="카메라 아래 기울기 (도)")
+    ap.add_argument("--configs", default=",".join(CONFIGS), help="max_points/levels/width 목록")
+    ap.add_argument("--sequence", default=None, help="녹화 시퀀스 (동영상, 이미지 폴더 또는 glob)")
+    ap.add_argument("--yaw-csv", default=None, help="프레임별 yaw(도) 한 줄씩")
+    ap.add_argument("--no-imu", action="store_true", help="합성 시퀀스에서도 yaw를 주지 않고 영상으로 회전 추정")
+    ap.add_argument("--save", default=None, help="합성 시퀀스를 이 폴더에 저장만 하고 종료")
+    args = ap.parse_args()
+
+    if args.sequence:
+        frames, truth = _load(args.sequence, args.frames), None
+        yaws = [float(line) for line in open(args.yaw_csv) if line.strip()][:len(frames)] if args.yaw_csv else None
+        if yaws is not None and len(yaws) < len(frames):
+            raise SystemExit(f"yaw 줄 수({len(yaws)})가 프레임 수({len(frames)})보다 적습니다.")
+    else:
+        frames, yaws, truth = _render(args.frames, args.fps, args.height, args.tilt, 3)
+        if args.save:
+            os.makedirs(args.save, exist_ok=True)
+            for i, img in enumerate(frames):
+                cv2.imwrite(os.path.join(args.save, f"{i:05d}.png"), img)
+            with open(os.path.join(args.save, "yaw.csv"), "w") as f:
+                f.writelines(f"{y:.4f}\n" for y in yaws)
+            print(f"{len(frames)}프레임 저장: {args.save}")
+            return
+        if args.no_imu:
+            yaws = None
+    rows = [_run(c, frames, yaws, truth, args.height, args.tilt) for c in args.configs.split(",")]
+    columns = ["config", "mean_ms", "p95_ms", "tracked", "lost", "path_m"]
+    if truth:
+        columns += ["true_m", "final_err_pct", "max_err_m", "heading_err"]
+    print(f"{len(frames)}프레임, yaw: {'IMU(csv/합성)' if yaws else '영상 추정'}, 카메라 {args.height}m / {args.tilt}도")
+    print_table(rows, columns)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,15 @@ import threading
 import time
 from traceback import format_exc
 
-import cv2
-
 from findee import Findee
+from findee._frame import _Frame
+from findee._jpeg import encode_jpeg
+from findee._metrics import frame_trace
 from client.errors import ErrCode
 from client.state import state
 from client import widget_data
 from client import webrtc
+from client import image_encoder
 
 
 class ThreadManager:
@@ -62,12 +64,29 @@ def _queue_webrtc_or_emit_socket(session_id: str, widget_id: str, task_type: str
         sio.emit(sio_event, sio_payload)
 
 
+def _encode_image(image) -> bytes | None:
+    """인코더 워커에서 실행. 읽기 전용 카메라 프레임은 Findee JPEG 캐시를 거친다."""
+    findee = state.findee
+    if findee is not None:
+        return findee.encode_jpeg(image, 60)
+    return encode_jpeg(image, 60)
+
+
+def _frame_meta(image) -> tuple[int, float, float] | None:
+    """카메라 프레임이면 그 메타, 처리 결과 이미지면 이 스레드가 마지막으로 가져온 프레임의 메타."""
+    if isinstance(image, _Frame) and image.seq:
+        return image.meta()
+    findee = state.findee
+    return findee.last_frame_meta() if findee is not None else None
+
+
 def exec_code(code, session_id):
     if session_id in session_threads:
         session_threads[session_id].stop_flag = False
     findee = state.findee
     if findee:
         findee.set_code_running(True)
+    image_encoder.encoder.clear_stats(session_id)
     _check = check_stop_flag(session_id)
 
     @_check
@@ -82,19 +101,20 @@ def exec_code(code, session_id):
             if not hasattr(image, "shape"):
                 print(ErrCode.IMG_NOT_NUMPY)
                 raise Exception(str(ErrCode.IMG_NOT_NUMPY))
-            ok, buffer = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), 60])
-            if not ok:
-                return
-            image_bytes = buffer.tobytes()
-            _queue_webrtc_or_emit_socket(
-                session_id,
-                widget_id,
-                "send_image",
-                {"session_id": session_id, "image_bytes": image_bytes, "widget_id": widget_id},
-                "robot_emit_image",
-                {"session_id": session_id, "image_data": image_bytes, "widget_id": widget_id},
-                ErrCode.WRTC_IMAGE_IO,
-            )
+
+            def deliver(image_bytes, trace):
+                _queue_webrtc_or_emit_socket(
+                    session_id,
+                    widget_id,
+                    "send_image",
+                    {"session_id": session_id, "image_bytes": image_bytes, "widget_id": widget_id, "trace": trace},
+                    "robot_emit_image",
+                    {"session_id": session_id, "image_data": image_bytes, "widget_id": widget_id},
+                    ErrCode.WRTC_IMAGE_IO,
+                )
+
+            # 인코딩은 워커 풀에서. 밀리면 위젯별로 최신 프레임만 남긴다
+            image_encoder.encoder.submit(session_id, widget_id, image, _encode_image, deliver, _frame_meta(image))
 
         @_check
         def emit_text(text, widget_id):
@@ -160,6 +180,8 @@ def exec_code(code, session_id):
             "predict_dl": predict_dl,
             "get_dl_inference_result": lambda: widget_data.get_dl_inference_result(session_id),
             "get_dl_class_extremes": lambda: widget_data.get_dl_class_extremes(session_id),
+            "get_image_stats": lambda: image_encoder.encoder.get_stats(session_id),
+            "get_latency_trace": frame_trace.to_dict,
         }
         compiled_code = compile(code, "<string>", "exec")
         exec(compiled_code, exec_namespace)
@@ -168,6 +190,10 @@ def exec_code(code, session_id):
             for line in format_exc().splitlines():
                 state.sio.emit("robot_stderr", {"session_id": session_id, "output": line})
     finally:
+        if findee:
+            # 파이프라인 워커가 emit_image를 더 넣지 않도록 인코더 정리보다 먼저
+            findee.stop_pipelines()
+        image_encoder.encoder.cancel(session_id)
         if findee:
             findee.set_code_running(False)
         if session_id in session_threads:
@@ -0,0 +1,173 @@
+"""emit_image용 JPEG 인코더 워커 풀. 사용자 코드 스레드는 프레임만 넘기고 바로 돌아간다.
+
+위젯마다 대기 슬롯은 하나뿐이라 워커가 밀리면 새 프레임이 이전 대기 프레임을 대체한다 (newest-wins, dropped로 집계).
+같은 위젯의 프레임은 한 번에 하나만 인코딩하므로 전송 순서가 뒤바뀌지 않는다.
+원본 카메라 프레임 메타(seq, 노출 시각, 도착 시각)를 주면 process/encode 단계를 frame_trace에 기록하고 deliver에 trace로 넘긴다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+from findee._frame import _Frame
+from findee._metrics import _LatencyHistogram, frame_trace
+
+_DEFAULT_WORKERS = 2
+
+
+class _WidgetStats:
+    def __init__(self):
+        self.submitted = 0
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self.encode = _LatencyHistogram()
+        self.latency = _LatencyHistogram()
+
+    def to_dict(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "encode": self.encode.to_dict(),
+            "latency": self.latency.to_dict(),
+        }
+
+
+class _ImageEncoder:
+    """(session_id, widget_id)별 대기 슬롯 1개 + 공용 워커 스레드. 워커는 첫 submit 때 시작."""
+    def __init__(self, workers: int = _DEFAULT_WORKERS):
+        self._workers = workers
+        self._cond = threading.Condition()
+        self._pending: OrderedDict[tuple[str, str], tuple] = OrderedDict()
+        self._busy: set[tuple[str, str]] = set()
+        self._stats: dict[tuple[str, str], _WidgetStats] = {}
+        self._threads: list[threading.Thread] = []
+
+    @staticmethod
+    def _snapshot(image: np.ndarray) -> tuple[np.ndarray, object]:
+        """호출자가 배열을 계속 수정/반납해도 되도록 (인코딩할 배열, 인코딩 뒤 release할 참조 또는 None).
+
+        읽기 전용 카메라 프레임(FrameRef.array와 그 슬라이스)은 복사하지 않고 슬롯 참조를 하나 더 잡아 둔다.
+        캡처는 참조가 남은 슬롯에 쓰지 않으므로 호출자가 with 블록을 빠져나가도 내용이 그대로다.
+        자기 메모리를 가진 읽기 전용 배열(frame.hsv 같은 파생 이미지)도 바뀌지 않으므로 그대로 쓴다.
+        """
+        if not image.flags.writeable:
+            owner = getattr(image, "_ref", None)
+            ref = owner() if owner is not None else None
+            if ref is not None and not ref.released:
+                return image, ref.share()
+            if image.flags.owndata:
+                return image, None
+        if isinstance(image, _Frame) and image.seq and not image.flags.writeable:
+            # 이미 반납된 슬롯의 뷰: 지금 내용이라도 사본으로 (메타는 JPEG 캐시 키로 유지)
+            snap = image.copy_frame()
+            snap.flags.writeable = False
+            return snap, None
+        return np.array(image, copy=True), None
+
+    @staticmethod
+    def _release(hold) -> None:
+        if hold is not None:
+            hold.release()
+
+    def submit(self, session_id: str, widget_id: str, image: np.ndarray,
+               encode: Callable[[np.ndarray], bytes | None], deliver: Callable[[bytes, dict | None], None],
+               meta: tuple[int, float, float] | None = None) -> None:
+        """비블로킹. 같은 위젯에 아직 인코딩 전인 프레임이 있으면 그것을 버리고 이 프레임으로 교체."""
+        key = (session_id, widget_id)
+        submitted_at = time.monotonic()
+        if meta is not None:
+            frame_trace.record("process", submitted_at - meta[2])
+        snap, hold = self._snapshot(image)
+        job = (snap, hold, encode, deliver, submitted_at, meta)
+        replaced = None
+        with self._cond:
+            stats = self._stats.setdefault(key, _WidgetStats())
+            stats.submitted += 1
+            if key in self._pending:
+                stats.dropped += 1
+                replaced = self._pending[key]
+            self._pending[key] = job
+            self._cond.notify()
+            if not self._threads:
+                self._start()
+        if replaced is not None:
+            self._release(replaced[1])
+
+    def _start(self) -> None:
+        for _ in range(self._workers):
+            t = threading.Thread(target=self._worker, daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def _next_job(self):
+        """인코딩 중이 아닌 위젯 중 가장 오래 기다린 작업."""
+        for key in self._pending:
+            if key not in self._busy:
+                return key, self._pending.pop(key)
+        return None
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                item = self._next_job()
+                while item is None:
+                    self._cond.wait()
+                    item = self._next_job()
+                key, (image, hold, encode, deliver, submitted_at, meta) = item
+                self._busy.add(key)
+                stats = self._stats[key]
+            try:
+                t0 = time.monotonic()
+                data = encode(image)
+                t1 = time.monotonic()
+                stats.encode.record(t1 - t0)
+                trace = None
+                if meta is not None:
+                    frame_trace.record("encode", t1 - t0)
+                    trace = {"seq": meta[0], "timestamp": meta[1], "queued_at": t1}
+                if data is not None:
+                    deliver(data, trace)
+            except Exception:
+                data = None
+            finally:
+                self._release(hold)
+            with self._cond:
+                self._busy.discard(key)
+                if data is None:
+                    stats.failed += 1
+                else:
+                    stats.sent += 1
+                    stats.latency.record(time.monotonic() - submitted_at)
+                if self._pending:
+                    self._cond.notify()
+
+    def cancel(self, session_id: str) -> None:
+        """세션 종료 시 아직 시작하지 않은 작업 버림 (인코딩 중인 것은 그대로 전송)."""
+        dropped = []
+        with self._cond:
+            for key in [k for k in self._pending if k[0] == session_id]:
+                dropped.append(self._pending.pop(key))
+                self._stats[key].dropped += 1
+        for job in dropped:
+            self._release(job[1])
+
+    def get_stats(self, session_id: str) -> dict:
+        """widget_id -> 제출/전송/드롭/실패 수와 인코딩·전체 지연 히스토그램."""
+        with self._cond:
+            items = [(k[1], s) for k, s in self._stats.items() if k[0] == session_id]
+        return {widget_id: s.to_dict() for widget_id, s in items}
+
+    def clear_stats(self, session_id: str) -> None:
+        with self._cond:
+            for key in [k for k in self._stats if k[0] == session_id and k not in self._pending and k not in self._busy]:
+                del self._stats[key]
+
+
+encoder = _ImageEncoder()
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import json
 import struct
+import time
 from asyncio import Queue
 
 try:
@@ -32,6 +33,7 @@ except ImportError:
     subprocess.run(["sudo", "pip", "install", "psutil", "--break-system-packages"], capture_output=True, text=True)
     import psutil
 
+from findee._metrics import frame_trace
 from client.errors import ErrCode
 from client.state import state
 from client import widget_data
@@ -62,7 +64,7 @@ def _webrtc_parse_candidate(d):
 
 
 def _webrtc_parse_send_image(d):
-    return (d.get("session_id"), d.get("image_bytes"), d.get("widget_id")) if (d.get("session_id") and d.get("image_bytes") and d.get("widget_id")) else None
+    return (d.get("session_id"), d.get("image_bytes"), d.get("widget_id"), d.get("trace")) if (d.get("session_id") and d.get("image_bytes") and d.get("widget_id")) else None
 
 
 def _webrtc_parse_send_text(d):
@@ -86,12 +88,19 @@ def _webrtc_header(type_byte: int, widget_id: str) -> bytes:
     return bytes([type_byte, len(widget_id_bytes)]) + widget_id_bytes
 
 
-async def send_image_via_webrtc(session_id, image_bytes, widget_id):
+async def send_image_via_webrtc(session_id, image_bytes, widget_id, trace=None):
+    """trace(seq, 노출 시각, 큐 투입 시각)가 있으면 queue/send/total 단계를 기록. 전송 형식은 그대로."""
     try:
         channel = get_open_data_channel(session_id)
         if not channel:
             return
+        t0 = time.monotonic()
         channel.send(_webrtc_header(0x01, widget_id) + image_bytes)
+        if trace:
+            t1 = time.monotonic()
+            frame_trace.record("queue", t0 - trace["queued_at"])
+            frame_trace.record("send", t1 - t0)
+            frame_trace.record("total", t1 - trace["timestamp"])
     except Exception:
         pass
 
@@ -1,3 +1,4 @@
 from findee.v1 import Findee
+from findee._frame_bus import FrameBusReader
 
-__all__ = ["Findee"]
+__all__ = ["Findee", "FrameBusReader"]
@@ -0,0 +1,185 @@
+"""ArUco/AprilTag 마커 검출. 사전·검출기 객체는 사전별로 한 번만 만든다.
+
+직전 프레임에서 마커를 찾았으면 그 마커들을 감싼 상자를 마커 크기의 pad배만큼 넓힌 영역(ROI)만 먼저 검사하고,
+거기서 못 찾거나 full_every 프레임이 지나면 전체 화면을 검사한다 (새로 나타난 마커를 놓치지 않도록).
+자세(pose)는 카메라 내부 파라미터가 있을 때만 solvePnP(IPPE_SQUARE)로 계산한다.
+
+OpenCV 4.7+의 cv2.aruco.ArucoDetector를 쓰고, 그 전 버전(opencv-contrib)은 cv2.aruco.detectMarkers로 대체한다.
+"""
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from findee._frame import _Frame
+from findee._metrics import _LatencyHistogram
+
+DEFAULT_DICTIONARY = "DICT_4X4_50"
+# Raspberry Pi Camera Module v2 수평 화각. 보정값이 없을 때 근사 내부 파라미터에 사용
+_DEFAULT_HFOV_DEG = 62.2
+
+
+@dataclass
+class Marker:
+    """corners: (4, 2) 원본 프레임 좌표 (좌상단부터 시계 방향). rvec/tvec/distance는 자세를 계산했을 때만."""
+    id: int
+    corners: np.ndarray
+    cx: float
+    cy: float
+    rvec: np.ndarray | None = None
+    tvec: np.ndarray | None = None
+    distance: float | None = None
+
+
+class _Intrinsics:
+    """기준 해상도의 카메라 행렬/왜곡 계수. 다른 해상도 프레임에는 비율만큼 환산해 쓴다 (같은 화각 가정)."""
+    def __init__(self, camera_matrix, dist_coeffs=None, size: tuple[int, int] = (640, 480)):
+        self.camera_matrix = np.asarray(camera_matrix, np.float64).reshape(3, 3)
+        self.dist = np.zeros(5) if dist_coeffs is None else np.asarray(dist_coeffs, np.float64).reshape(-1)
+        self.size = tuple(int(v) for v in size)
+        self._scaled: dict[tuple[int, int], np.ndarray] = {}
+
+    @classmethod
+    def approximate(cls, size: tuple[int, int], hfov_deg: float = _DEFAULT_HFOV_DEG) -> "_Intrinsics":
+        w, h = size
+        f = (w / 2.0) / math.tan(math.radians(hfov_deg) / 2.0)
+        return cls([[f, 0, w / 2.0], [0, f, h / 2.0], [0, 0, 1]], None, size)
+
+    def for_size(self, size: tuple[int, int]) -> np.ndarray:
+        size = tuple(size)
+        m = self._scaled.get(size)
+        if m is None:
+            sx, sy = size[0] / self.size[0], size[1] / self.size[1]
+            m = self.camera_matrix.copy()
+            m[0] *= sx
+            m[1] *= sy
+            self._scaled[size] = m
+        return m
+
+
+def _dictionary(name: str):
+    aruco = getattr(cv2, "aruco", None)
+    if aruco is None:
+        raise RuntimeError("OpenCV aruco 모듈이 없습니다 (opencv-python 4.7+ 또는 opencv-contrib-python 필요).")
+    key = getattr(aruco, name, None)
+    if key is None:
+        raise ValueError(f"알 수 없는 마커 사전: {name}")
+    if hasattr(aruco, "getPredefinedDictionary"):
+        return aruco.getPredefinedDictionary(key)
+    return aruco.Dictionary_get(key)
+
+
+class _MarkerDetector:
+    """사전 하나에 대한 검출기 + 직전 검출 위치 기억."""
+    def __init__(self, dictionary: str = DEFAULT_DICTIONARY, pad: float = 0.4, full_every: int = 15):
+        aruco = cv2.aruco
+        self.dictionary_name = dictionary
+        self._dict = _dictionary(dictionary)
+        if hasattr(aruco, "ArucoDetector"):
+            self._params = aruco.DetectorParameters()
+            self._detector = aruco.ArucoDetector(self._dict, self._params)
+        else:
+            self._params = aruco.DetectorParameters_create()
+            self._detector = None
+        self.pad = float(pad)
+        self.full_every = max(1, int(full_every))
+        self._last: list[Marker] = []
+        self._since_full = 0
+        self.frames = 0
+        self.roi_scans = 0
+        self.roi_hits = 0
+        self.full_scans = 0
+        self.detect_hist = _LatencyHistogram()
+        self.pose_hist = _LatencyHistogram()
+
+    def _raw(self, gray: np.ndarray):
+        if self._detector is not None:
+            corners, ids, _ = self._detector.detectMarkers(gray)
+        else:
+            corners, ids, _ = cv2.aruco.detectMarkers(gray, self._dict, parameters=self._params)
+        if ids is None:
+            return []
+        return [(int(i), c.reshape(4, 2)) for i, c in zip(ids.reshape(-1), corners)]
+
+    def _roi(self, shape: tuple) -> tuple[int, int, int, int] | None:
+        if not self._last:
+            return None
+        pts = np.concatenate([m.corners for m in self._last])
+        x0, y0 = pts.min(axis=0)
+        x1, y1 = pts.max(axis=0)
+        size = max(x1 - x0, y1 - y0) / max(1, len(self._last)) ** 0.5
+        pad = size * self.pad
+        h, w = shape[:2]
+        x0, y0 = max(0, int(x0 - pad)), max(0, int(y0 - pad))
+        x1, y1 = min(w, int(x1 + pad) + 1), min(h, int(y1 + pad) + 1)
+        if (x1 - x0) * (y1 - y0) >= 0.6 * w * h:
+            return None  # 거의 전체 화면이면 ROI 이득이 없다
+        return x0, y0, x1, y1
+
+    def detect(self, frame: np.ndarray) -> list[tuple[int, np.ndarray]]:
+        """(id, corners) 목록. ROI 우선 검사 후 필요하면 전체 화면."""
+        gray = frame.gray if isinstance(frame, _Frame) and frame.derivable else \
+            (frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+        self.frames += 1
+        t0 = time.monotonic()
+        found = []
+        roi = self._roi(gray.shape) if self._since_full < self.full_every else None
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            self.roi_scans += 1
+            found = [(i, c + (x0, y0)) for i, c in self._raw(gray[y0:y1, x0:x1])]
+            if found:
+                self.roi_hits += 1
+                self._since_full += 1
+        if not found:
+            self.full_scans += 1
+            self._since_full = 1
+            found = self._raw(gray)
+        self.detect_hist.record(time.monotonic() - t0)
+        return found
+
+    def remember(self, markers: list[Marker]) -> None:
+        self._last = markers
+
+    def get_stats(self) -> dict:
+        return {
+            "dictionary": self.dictionary_name,
+            "frames": self.frames,
+            "roi_scans": self.roi_scans,
+            "roi_hits": self.roi_hits,
+            "full_scans": self.full_scans,
+            "detect": self.detect_hist.to_dict(),
+            "pose": self.pose_hist.to_dict(),
+        }
+
+
+def _object_points(length: float) -> np.ndarray:
+    half = length / 2.0
+    return np.array([[-half, half, 0], [half, half, 0], [half, -half, 0], [-half, -half, 0]], np.float64)
+
+
+def detect_markers(detector: _MarkerDetector, frame: np.ndarray, marker_length: float | None = None,
+                   intrinsics: _Intrinsics | None = None) -> list[Marker]:
+    """마커 검출 + (marker_length와 intrinsics가 있으면) 마커별 자세. tvec/distance 단위는 marker_length 단위."""
+    markers = []
+    for marker_id, corners in detector.detect(frame):
+        c = corners.astype(np.float32)
+        cx, cy = c.mean(axis=0)
+        markers.append(Marker(marker_id, c, float(cx), float(cy)))
+    detector.remember(markers)
+    if markers and marker_length and intrinsics is not None:
+        t0 = time.monotonic()
+        k = intrinsics.for_size((frame.shape[1], frame.shape[0]))
+        obj = _object_points(marker_length)
+        for m in markers:
+            ok, rvec, tvec = cv2.solvePnP(obj, m.corners.astype(np.float64), k, intrinsics.dist,
+                                          flags=cv2.SOLVEPNP_IPPE_SQUARE)
+            if ok:
+                m.rvec, m.tvec = rvec.reshape(3), tvec.reshape(3)
+                m.distance = float(np.linalg.norm(m.tvec))
+        detector.pose_hist.record(time.monotonic() - t0)
+    return markers
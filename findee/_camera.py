@@ -1,64 +1,389 @@
-"""Picamera2 캡처 및 MJPEG 스트림. Findee에서 위임용."""
+"""카메라 캡처 및 MJPEG 스트림. Findee에서 위임용.
+
+캡처 스레드 하나가 계속 프레임을 받아 링 버퍼에 넣고, get_frame/mjpeg_gen/AP 플레이 루프는 링에서 최신 프레임을 읽는다.
+프레임은 미리 할당한 풀 슬롯에 한 번만 복사되고, 소비자는 FrameRef(읽기 전용 뷰)로 공유한다.
+프로필에 lores가 있으면 ISP가 같은 요청에서 축소 스트림을 함께 만들고, 스트림마다 링/풀을 따로 둔다.
+프레임 공급원은 _camera_backends에서 고른다 (picamera2 / synthetic / video:<경로>).
+"""
 from __future__ import annotations
 
+import threading
 import time
 
 import cv2
-from picamera2 import Picamera2
+import numpy as np
+
+from findee._camera_backends import create_backend
+from findee._frame_bus import DEFAULT_BUS_NAME, _FrameBusWriter
+from findee._frame_pool import FrameRef, _FramePool
+from findee._frame_ring import _FrameRing
+from findee._jpeg import JPEG_PRESETS, encode_jpeg
+from findee._jpeg_cache import _JpegCache, frame_key
+from findee._metrics import _LatencyHistogram, frame_trace
+
+_RING_SIZE = 4
+# 링 보관분 + 소비자 동시 보유분. 부족하면 _FramePool이 최대 _POOL_MAX까지 늘림
+_POOL_SIZE = 6
+_POOL_MAX = 12
+_FIRST_FRAME_TIMEOUT_S = 1.0
+
+# main/lores: (width, height). lores 폭은 stride 패딩이 없도록 64의 배수로 둔다.
+CAMERA_PROFILES = {
+    "vga": {"main": (640, 480), "lores": None, "fps": 30},
+    "vga_qvga": {"main": (640, 480), "lores": (320, 240), "fps": 30},
+    "hd_vga": {"main": (1280, 720), "lores": (640, 360), "fps": 30},
+    "qvga": {"main": (320, 240), "lores": None, "fps": 30},
+}
+DEFAULT_PROFILE = "vga"
+STREAMS = ("main", "lores")
+_MJPEG_PART_HEAD = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: "
 
 
 class _Camera:
-    """Picamera2 래퍼: init, get_frame, mjpeg_gen, cleanup."""
+    """카메라 래퍼: init, set_profile, get_frame, wait_next, mjpeg_gen, cleanup. camera는 열린 백엔드 (없으면 None)."""
     def __init__(self):
         self.camera = None
         self.config = None
+        self.profile: str | None = None
+        self._rings = {name: _FrameRing(_RING_SIZE) for name in STREAMS}
+        self._pools: dict[str, _FramePool] = {}
+        self._streams: tuple[str, ...] = ("main",)
+        self._seq = 0
+        self.jpeg_cache = _JpegCache()
+        self._stream_lock = threading.Lock()
+        self._stream_stats = {"clients": 0, "sent": 0, "paced": 0, "dropped": 0, "bytes": 0}
+        self.stream_client_wait = _LatencyHistogram()
+        self.stream_frame_age = _LatencyHistogram()
+        self._bus_lock = threading.Lock()
+        self._bus: _FrameBusWriter | None = None
+        self._bus_spec: tuple[str, str, int] | None = None
+        self._fetched = threading.local()
+        self._capture_thread = None
+        self._capturing = False
 
-    def init(self) -> None:
-        """이미 열린 카메라가 있으면 재초기화하지 않는다. 중복 Picamera2()는 장치 점유 실패로 camera=None이 되어 get_frame이 망가질 수 있음."""
+    def init(self, profile: str = DEFAULT_PROFILE, backend: str | None = None) -> None:
+        """이미 열린 카메라가 있으면 재초기화하지 않는다. 중복 Picamera2()는 장치 점유 실패로 camera=None이 되어 get_frame이 망가질 수 있음.
+        backend: "picamera2" | "synthetic" | "video:<경로>" (None이면 PF_CAMERA_BACKEND, 기본 picamera2)."""
         if self.camera is not None:
             return
+        if profile not in CAMERA_PROFILES:
+            raise ValueError(f"profile must be one of {tuple(CAMERA_PROFILES)}")
         try:
-            self.camera = Picamera2()
-            self.config = self.camera.create_video_configuration(
-                main={"size": (640, 480), "format": "RGB888"},
-                controls={"FrameDurationLimits": (33333, 33333)},
-                queue=False, buffer_count=2
-            )
-            self.camera.configure(self.config)
+            self.camera = create_backend(backend)
+            self._configure(profile)
             self.camera.start()
+        except ValueError:
+            # 잘못된 백엔드/프로필 지정은 숨기지 않는다
+            self.camera = None
+            self.config = None
+            self.profile = None
+            raise
         except Exception:
             self.camera = None
             self.config = None
+            self.profile = None
+            return
+        self._start_capture()
 
-    def get_frame(self):
+    def _configure(self, profile: str) -> None:
+        spec = CAMERA_PROFILES[profile]
+        self.camera.configure(spec["main"], spec["lores"], spec["fps"])
+        self.config = self.camera.config
+        self.profile = profile
+        self._streams = ("main", "lores") if spec["lores"] is not None else ("main",)
+
+    def set_profile(self, profile: str) -> None:
+        """실행 중 캡처 프로필 전환 (캡처 스레드 정지 -> 재구성 -> 재시작). 이전 프레임 참조는 반납 전까지 유효.
+        전환에 실패하면 이전 프로필로 다시 시작한 뒤 예외를 그대로 올린다."""
+        if profile not in CAMERA_PROFILES:
+            raise ValueError(f"profile must be one of {tuple(CAMERA_PROFILES)}")
         if self.camera is None:
+            self.init(profile)
+            return
+        if profile == self.profile:
+            return
+        self._stop_capture()
+        self.camera.stop()
+        for ring in self._rings.values():
+            ring.clear()
+        self.jpeg_cache.clear()
+        self._pools = {}
+        previous = self.profile
+        try:
+            self._configure(profile)
+            self.camera.start()
+        except Exception:
+            # 새 프로필 구성/시작에 실패하면 이전 프로필로 되돌려 캡처를 이어 가고 원래 예외를 올린다
+            try:
+                self._configure(previous)
+                self.camera.start()
+                self._start_capture()
+            except Exception:
+                pass
+            raise
+        self._start_capture()
+
+    def _start_capture(self) -> None:
+        self._capturing = True
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+
+    def _stop_capture(self) -> None:
+        self._capturing = False
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            self._capture_thread.join(timeout=1.0)
+        self._capture_thread = None
+
+    def _pool_for(self, stream: str, shape: tuple, dtype) -> _FramePool:
+        pool = self._pools.get(stream)
+        if pool is None or pool.shape != tuple(shape):
+            pool = self._pools[stream] = _FramePool(shape, dtype, _POOL_SIZE, _POOL_MAX)
+        return pool
+
+    def _capture_stream(self, src: np.ndarray, stream: str, seq: int, ts: float | None) -> FrameRef | None:
+        """백엔드 버퍼를 풀 슬롯에 직접 복사/변환 (capture_array의 배열 할당 없음). 2차원 입력은 YUV420."""
+        if src.ndim == 2:
+            w, h = CAMERA_PROFILES[self.profile][stream]
+            pool = self._pool_for(stream, (h, w, 3), np.uint8)
+        else:
+            pool = self._pool_for(stream, src.shape, src.dtype)
+        index = pool.acquire()
+        if index is None:
             return None
-        return self.camera.capture_array("main").copy()
+        if src.ndim == 2:
+            cv2.cvtColor(src, cv2.COLOR_YUV2BGR_I420, dst=pool.slot(index))
+        else:
+            np.copyto(pool.slot(index), src)
+        arrival = time.monotonic()
+        return FrameRef(pool, index, seq, ts if ts is not None and ts <= arrival else arrival, arrival)
+
+    def _capture_once(self) -> list[tuple[str, FrameRef]]:
+        refs = []
+        with self.camera.capture(self._streams) as (arrays, exposed):
+            self._seq += 1
+            for stream in self._streams:
+                ref = self._capture_stream(arrays[stream], stream, self._seq, exposed)
+                if ref is not None:
+                    refs.append((stream, ref))
+        if refs:
+            frame_trace.record("capture", refs[0][1].array.arrival - refs[0][1].timestamp)
+        return refs
+
+    def _capture_loop(self) -> None:
+        while self._capturing:
+            try:
+                refs = self._capture_once()
+            except Exception:
+                time.sleep(0.01)
+                continue
+            for stream, ref in refs:
+                if self._bus_spec is not None:
+                    self._publish_bus(stream, ref)
+                self._rings[stream].publish(ref)
+
+    def enable_frame_bus(self, name: str = DEFAULT_BUS_NAME, stream: str = "main", slots: int = 8) -> None:
+        """stream 프레임을 공유 메모리 링(name)에도 기록. 다른 프로세스는 FrameBusReader(name)로 읽는다.
+        세그먼트는 호출한 스레드에서 만들므로 잘못된 이름이나 공간 부족(OSError)은 여기서 올라온다."""
+        if stream not in STREAMS:
+            raise ValueError(f"stream must be one of {STREAMS}")
+        if int(slots) < 1:
+            raise ValueError("slots는 1 이상이어야 합니다.")
+        with self._bus_lock:
+            self._close_bus()
+            self._bus_spec = None
+            if self.profile is not None:
+                w, h = CAMERA_PROFILES[self.profile][self._bus_stream(stream)]
+                self._bus = _FrameBusWriter(name, (h, w, 3), int(slots))
+            self._bus_spec = (name, stream, int(slots))
+
+    def disable_frame_bus(self) -> None:
+        with self._bus_lock:
+            self._close_bus()
+            self._bus_spec = None
+
+    def _close_bus(self) -> None:
+        if self._bus is not None:
+            self._bus.close()
+            self._bus = None
+
+    def _bus_stream(self, want: str) -> str:
+        """lores가 없는 프로필이면 main을 버스에 쓴다."""
+        return want if want in self._streams else "main"
+
+    def _publish_bus(self, stream: str, ref: FrameRef) -> None:
+        """캡처 스레드에서 호출. 모양이 바뀌면(프로필 전환) 세그먼트를 새로 만든다.
+        세그먼트 생성/기록이 실패하면 버스만 끄고 캡처는 계속한다."""
+        with self._bus_lock:
+            spec = self._bus_spec
+            if spec is None:
+                return
+            name, want, slots = spec
+            if stream != self._bus_stream(want):
+                return
+            shape = ref.array.shape if ref.array.ndim == 3 else ref.array.shape + (1,)
+            try:
+                if self._bus is None or self._bus.shape != shape:
+                    self._close_bus()
+                    self._bus = _FrameBusWriter(name, shape, slots)
+                self._bus.publish(ref.array, ref.seq, ref.timestamp)
+            except Exception as e:
+                print(f"frame bus '{name}' 기록 실패, 버스를 끕니다: {e}")
+                try:
+                    self._close_bus()
+                except Exception:
+                    self._bus = None
+                self._bus_spec = None
 
-    def mjpeg_gen(self):
+    def get_frame_bus_stats(self) -> dict:
+        with self._bus_lock:
+            if self._bus_spec is None:
+                return {}
+            name, stream, slots = self._bus_spec
+            return {"name": name, "stream": stream, "slots": slots,
+                    "shape": self._bus.shape if self._bus is not None else None,
+                    "published": self._bus.published if self._bus is not None else 0}
+
+    def _ring_for(self, stream: str) -> _FrameRing:
+        """lores가 없는 프로필에서 lores를 요청하면 main을 준다."""
+        if stream not in STREAMS:
+            raise ValueError(f"stream must be one of {STREAMS}")
+        return self._rings[stream if stream in self._streams else "main"]
+
+    def get_frame_ref(self, stream: str = "main", timeout: float = _FIRST_FRAME_TIMEOUT_S) -> FrameRef | None:
+        """최신 프레임 참조(읽기 전용, 복사 없음). release() 또는 with 문으로 반납. 아직 없으면 첫 프레임까지 대기."""
+        if self.camera is None:
+            return None
+        ring = self._ring_for(stream)
+        ref = ring.latest()
+        if ref is None and self._capturing:
+            ref = ring.wait_next(0, timeout=timeout)
+        return self._note_fetched(ref)
+
+    def wait_next_ref(self, after_seq: int | None = None, timeout: float = 1.0, stream: str = "main") -> FrameRef | None:
+        if self.camera is None:
+            return None
+        return self._note_fetched(self._ring_for(stream).wait_next(after_seq, timeout))
+
+    def _note_fetched(self, ref: FrameRef | None) -> FrameRef | None:
+        if ref is not None:
+            self._fetched.meta = ref.array.meta()
+        return ref
+
+    def last_fetched_meta(self) -> tuple[int, float, float] | None:
+        """이 스레드가 마지막으로 가져온 프레임의 (seq, timestamp, arrival). 처리 결과 이미지의 출처 추정용."""
+        return getattr(self._fetched, "meta", None)
+
+    def get_frame(self, stream: str = "main"):
+        """최신 프레임의 쓰기 가능한 사본을 즉시 반환 (캡처를 기다리지 않음)."""
+        ref = self.get_frame_ref(stream)
+        if ref is None:
+            return None
+        with ref:
+            return ref.writable()
+
+    def wait_next(self, after_seq: int | None = None, timeout: float = 1.0, stream: str = "main"):
+        """after_seq(없으면 호출 시점)보다 새 프레임이 나올 때까지만 대기 후 사본 반환. 시간 초과 시 None."""
+        ref = self.wait_next_ref(after_seq, timeout, stream)
+        if ref is None:
+            return None
+        with ref:
+            return ref.writable()
+
+    def get_pool_stats(self) -> dict:
+        """스트림별 프레임 풀 할당/재사용/복사/드롭 횟수."""
+        return {name: pool.get_stats() for name, pool in self._pools.items()}
+
+    def encode_jpeg(self, frame, quality: int | None = None, preset: str = "default") -> bytes | None:
+        """JPEG bytes. 읽기 전용 카메라 프레임(FrameRef.array)이면 같은 프레임·프리셋·품질의 이전 결과를 재사용.
+
+        캐시 키는 실제로 쓰일 품질 기준이라 quality=None(프리셋 품질)과 같은 값을 직접 준 호출도 결과를 공유한다.
+        """
+        key = frame_key(frame)
+        if key is None or preset not in JPEG_PRESETS:
+            return encode_jpeg(frame, quality, preset)
+        q = int(quality) if quality is not None else JPEG_PRESETS[preset]["quality"]
+        return self.jpeg_cache.get_or_encode(key + (preset, q), lambda: encode_jpeg(frame, q, preset))
+
+    def get_jpeg(self, quality: int | None = None, stream: str = "main", preset: str = "default") -> tuple[int, bytes] | None:
+        """최신 프레임의 (seq, JPEG bytes). 캐시를 거치므로 여러 소비자가 불러도 프레임당 한 번만 인코딩."""
+        ref = self.get_frame_ref(stream)
+        if ref is None:
+            return None
+        with ref:
+            data = self.encode_jpeg(ref.array, quality, preset)
+            return (ref.seq, data) if data is not None else None
+
+    def mjpeg_gen(self, fps: float | None = None, quality: int | None = None, stream: str = "main", preset: str = "default"):
+        """multipart MJPEG 파트 생성기. 새 프레임이 도착할 때만 진행하고 이미 보낸 프레임은 다시 보내지 않는다.
+
+        fps를 주면 그보다 빨리 도착한 프레임은 건너뛴다. 클라이언트가 느리면 대기열 없이 재개 시점의 최신 프레임만 보내고,
+        그 사이 놓친 프레임 수를 dropped로 센다.
+        """
         if self.camera is None:
             return
-        while True:
-            arr = self.camera.capture_array("main").copy()
-            ok, buf = cv2.imencode('.jpg', arr, [int(cv2.IMWRITE_JPEG_QUALITY), 70])
-            if not ok:
-                continue
-            jpg = buf.tobytes()
-            yield (b"--frame\r\n"
-                b"Content-Type: image/jpeg\r\n"
-                b"Content-Length: " + str(len(jpg)).encode() + b"\r\n\r\n" +
-                jpg + b"\r\n")
-            time.sleep(0.001)
+        interval = 1.0 / fps if fps else 0.0
+        last_seq = 0
+        next_at = 0.0
+        with self._stream_lock:
+            self._stream_stats["clients"] += 1
+        try:
+            while self.camera is not None:
+                ref = self._ring_for(stream).wait_next(last_seq, timeout=1.0)
+                if ref is None:
+                    continue
+                with ref:
+                    # 카메라 프레임 간격의 흔들림 때문에 예정 시각보다 조금 이른 프레임은 허용 (주기의 1/4)
+                    if ref.timestamp < next_at - interval * 0.25:
+                        last_seq = ref.seq
+                        self._count_stream("paced")
+                        continue
+                    if last_seq and ref.seq > last_seq + 1:
+                        self._count_stream("dropped", ref.seq - last_seq - 1)
+                    last_seq = ref.seq
+                    if interval:
+                        # 격자 유지. 한 주기 이상 밀렸으면 이 프레임 기준으로 다시 잡음
+                        next_at = next_at + interval if next_at > ref.timestamp - interval else ref.timestamp + interval
+                    exposed = ref.timestamp
+                    jpg = self.encode_jpeg(ref.array, quality, preset)
+                if jpg is None:
+                    continue
+                # WSGI 서버가 넘겨받은 청크를 나중에 쓸 수 있으므로 재사용 버퍼 대신 파트마다 한 번에 join
+                part = b"".join((_MJPEG_PART_HEAD, str(len(jpg)).encode(), b"\r\n\r\n", jpg, b"\r\n"))
+                self._count_stream("sent")
+                self._count_stream("bytes", len(part))
+                yielded_at = time.monotonic()
+                self.stream_frame_age.record(yielded_at - exposed)
+                yield part
+                self.stream_client_wait.record(time.monotonic() - yielded_at)
+        finally:
+            with self._stream_lock:
+                self._stream_stats["clients"] -= 1
+
+    def _count_stream(self, key: str, n: int = 1) -> None:
+        with self._stream_lock:
+            self._stream_stats[key] += n
+
+    def get_stream_stats(self) -> dict:
+        """MJPEG 접속 수, 보낸/건너뛴(fps 제한)/놓친 프레임 수, 보낸 바이트, 노출~송출 프레임 나이·클라이언트 대기 히스토그램."""
+        with self._stream_lock:
+            stats = dict(self._stream_stats)
+        stats["frame_age"] = self.stream_frame_age.to_dict()
+        stats["client_wait"] = self.stream_client_wait.to_dict()
+        return stats
 
     def cleanup(self) -> None:
         if self.camera is None:
             return
+        self._stop_capture()
         try:
-            if hasattr(self.camera, 'stop'):
-                self.camera.stop()
-            if hasattr(self.camera, 'close'):
-                self.camera.close()
+            self.camera.stop()
+            self.camera.close()
         except Exception:
             pass
         self.camera = None
         self.config = None
+        self.profile = None
+        for ring in self._rings.values():
+            ring.clear()
+        self.jpeg_cache.clear()
+        self.disable_frame_bus()
@@ -0,0 +1,223 @@
+"""카메라 백엔드. _Camera는 캡처 스레드/링/풀만 담당하고, 프레임 공급원은 여기서 고른다.
+
+PF_CAMERA_BACKEND 환경 변수로 선택 (기본 picamera2):
+- picamera2: 실제 카메라 (picamera2는 이 백엔드를 열 때만 import)
+- synthetic: 움직이는 테스트 패턴을 프로필 fps로 생성
+- video:<경로>: 동영상 파일, 이미지 폴더, 또는 glob 패턴(예: video:/data/run1/*.jpg)을 프로필 fps로 반복 재생
+
+모든 백엔드는 capture(streams)로 ({스트림: 배열}, 노출 시각)을 빌려주며 with 블록을 벗어나면 배열은 무효다.
+노출 시각은 time.monotonic 기준 초 (picamera2는 SensorTimestamp 변환, 나머지는 예정 프레임 시각). 모르면 None.
+main은 BGR(H, W, 3), lores는 picamera2에서 YUV420(H*3/2, W), 나머지 백엔드에서 BGR(H, W, 3).
+"""
+from __future__ import annotations
+
+import glob
+import os
+import time
+from contextlib import ExitStack, contextmanager
+
+import cv2
+import numpy as np
+
+CAMERA_BACKEND_ENV = "PF_CAMERA_BACKEND"
+CAMERA_BACKENDS = ("picamera2", "synthetic", "video")
+_DEFAULT_BACKEND = "picamera2"
+_IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class _Picamera2Backend:
+    name = "picamera2"
+
+    def __init__(self):
+        from picamera2 import Picamera2
+        self._cam = Picamera2()
+        self.config = None
+
+    def configure(self, main: tuple[int, int], lores: tuple[int, int] | None, fps: float) -> None:
+        frame_us = int(1_000_000 / fps)
+        kwargs = {}
+        if lores is not None:
+            # lores는 Pi 4 이하 ISP 제약상 YUV420만 가능 -> _Camera가 캡처 시 BGR로 변환
+            kwargs["lores"] = {"size": lores, "format": "YUV420"}
+        self.config = self._cam.create_video_configuration(
+            main={"size": main, "format": "RGB888"},
+            controls={"FrameDurationLimits": (frame_us, frame_us)},
+            queue=False, buffer_count=2, **kwargs
+        )
+        self._cam.configure(self.config)
+
+    def start(self) -> None:
+        self._cam.start()
+
+    def stop(self) -> None:
+        self._cam.stop()
+
+    def close(self) -> None:
+        self._cam.close()
+
+    @contextmanager
+    def capture(self, streams: tuple[str, ...]):
+        from picamera2 import MappedArray
+        request = self._cam.capture_request()
+        try:
+            with ExitStack() as stack:
+                arrays = {s: stack.enter_context(MappedArray(request, s)).array for s in streams}
+                yield arrays, self._sensor_time(request)
+        finally:
+            request.release()
+
+    @staticmethod
+    def _sensor_time(request) -> float | None:
+        """SensorTimestamp(ns, CLOCK_BOOTTIME)를 time.monotonic 기준으로 변환."""
+        try:
+            ns = request.get_metadata().get("SensorTimestamp")
+        except Exception:
+            return None
+        if not ns:
+            return None
+        return ns / 1e9 + (time.monotonic() - time.clock_gettime(time.CLOCK_BOOTTIME))
+
+
+class _PacedBackend:
+    """fps 격자에 맞춰 프레임을 내는 파일/합성 백엔드 공통부. 늦어지면 밀린 틱은 건너뛴다 (실제 카메라와 같음).
+    하위 클래스는 _render(out)에서 main 버퍼(BGR)를 채운다."""
+    name = ""
+
+    def __init__(self):
+        self.config = None
+        self._main = (640, 480)
+        self._lores = None
+        self._period = 1.0 / 30.0
+        self._deadline = None
+        self._main_buf = None
+        self._lores_buf = None
+
+    def configure(self, main: tuple[int, int], lores: tuple[int, int] | None, fps: float) -> None:
+        self._main, self._lores, self._period = tuple(main), lores, 1.0 / fps
+        self._main_buf = np.zeros((main[1], main[0], 3), np.uint8)
+        self._lores_buf = np.zeros((lores[1], lores[0], 3), np.uint8) if lores is not None else None
+        self.config = {"main": {"size": main}, "lores": {"size": lores} if lores else None, "fps": fps}
+
+    def start(self) -> None:
+        self._deadline = time.monotonic()
+
+    def stop(self) -> None:
+        self._deadline = None
+
+    def close(self) -> None:
+        pass
+
+    def _pace(self) -> float:
+        """다음 격자 시각까지 대기 후 그 시각(이 프레임의 노출 시각 역할)을 반환."""
+        if self._deadline is None:
+            self._deadline = time.monotonic()
+        now = time.monotonic()
+        if now < self._deadline:
+            time.sleep(self._deadline - now)
+        elif now - self._deadline >= self._period:
+            self._deadline += int((now - self._deadline) / self._period) * self._period
+        exposed = self._deadline
+        self._deadline += self._period
+        return exposed
+
+    @contextmanager
+    def capture(self, streams: tuple[str, ...]):
+        exposed = self._pace()
+        self._render(self._main_buf)
+        arrays = {"main": self._main_buf}
+        if "lores" in streams and self._lores_buf is not None:
+            # ISP 축소 대신 CPU resize (개발 머신용이므로 비용은 무시)
+            cv2.resize(self._main_buf, self._lores, dst=self._lores_buf, interpolation=cv2.INTER_AREA)
+            arrays["lores"] = self._lores_buf
+        yield arrays, exposed
+
+
+class _SyntheticBackend(_PacedBackend):
+    """컬러 바 위에 원이 움직이고 프레임 번호가 찍힌 패턴. 같은 프레임 번호는 항상 같은 이미지."""
+    name = "synthetic"
+
+    def __init__(self):
+        super().__init__()
+        self._n = 0
+        self._background = None
+
+    def configure(self, main, lores, fps) -> None:
+        super().configure(main, lores, fps)
+        w, h = main
+        colors = ((255, 255, 255), (0, 255, 255), (255, 255, 0), (0, 255, 0),
+                  (255, 0, 255), (0, 0, 255), (255, 0, 0), (40, 40, 40))
+        self._background = np.zeros((h, w, 3), np.uint8)
+        for i, color in enumerate(colors):
+            self._background[:, i * w // len(colors):(i + 1) * w // len(colors)] = color
+
+    def _render(self, out: np.ndarray) -> None:
+        h, w = out.shape[:2]
+        self._n += 1
+        np.copyto(out, self._background)
+        x = int((self._n * 4) % w)
+        y = int(h / 2 + h / 4 * np.sin(self._n / 15.0))
+        cv2.circle(out, (x, y), max(4, h // 12), (0, 0, 255), -1)
+        cv2.putText(out, str(self._n), (8, h - 12), cv2.FONT_HERSHEY_SIMPLEX, h / 480.0, (0, 0, 0), 2)
+
+
+class _VideoBackend(_PacedBackend):
+    """동영상 파일 또는 이미지 시퀀스를 끝나면 처음부터 반복. 크기가 다르면 main 크기로 맞춘다."""
+    name = "video"
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._files: list[str] = []
+        self._index = 0
+        self._cap = None
+        if os.path.isdir(path):
+            self._files = sorted(p for p in glob.glob(os.path.join(path, "*")) if p.lower().endswith(_IMAGE_EXTS))
+        elif any(c in path for c in "*?["):
+            self._files = sorted(glob.glob(path))
+        else:
+            self._cap = cv2.VideoCapture(path)
+            if not self._cap.isOpened():
+                raise FileNotFoundError(f"동영상을 열 수 없습니다: {path}")
+        if self._cap is None and not self._files:
+            raise FileNotFoundError(f"이미지가 없습니다: {path}")
+
+    def _read(self) -> np.ndarray | None:
+        if self._cap is not None:
+            ok, img = self._cap.read()
+            if not ok:
+                self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ok, img = self._cap.read()
+            return img if ok else None
+        img = cv2.imread(self._files[self._index])
+        self._index = (self._index + 1) % len(self._files)
+        return img
+
+    def _render(self, out: np.ndarray) -> None:
+        img = self._read()
+        if img is None:
+            return
+        if img.shape[:2] == out.shape[:2]:
+            np.copyto(out, img)
+        else:
+            cv2.resize(img, (out.shape[1], out.shape[0]), dst=out, interpolation=cv2.INTER_AREA)
+
+    def close(self) -> None:
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+def create_backend(spec: str | None = None):
+    """spec(없으면 PF_CAMERA_BACKEND, 기본 picamera2)에 맞는 백엔드 생성. video는 "video:<경로>"."""
+    spec = (spec or os.environ.get(CAMERA_BACKEND_ENV) or _DEFAULT_BACKEND).strip()
+    name, _, arg = spec.partition(":")
+    name = name.lower()
+    if name == "picamera2":
+        return _Picamera2Backend()
+    if name == "synthetic":
+        return _SyntheticBackend()
+    if name == "video":
+        if not arg:
+            raise ValueError("video 백엔드는 경로가 필요합니다 (예: video:/home/pi/run.mp4)")
+        return _VideoBackend(arg)
+    raise ValueError(f"알 수 없는 카메라 백엔드: {name} (가능: {', '.join(CAMERA_BACKENDS)})")
@@ -0,0 +1,279 @@
+"""HSV 색상 분류기: 채널별 비트마스크 LUT 한 번으로 N개 색을 동시에 라벨링하고, 면적은 connected-component 통계로 구한다.
+
+색 범위 하나가 비트 하나를 차지한다. H/S/V 각각 256칸 LUT에 "이 값이 범위 안인 비트"를 미리 넣어 두면
+label = LUT_h[H] & LUT_s[S] & LUT_v[V] 가 픽셀이 속한 범위들의 비트 집합이 된다.
+빨강처럼 색상환 양끝에 걸친 색은 범위를 여러 개 주면 비트를 여러 개 쓰고 결과에서 합친다. 범위는 최대 8개.
+신호등 판정(traffic_light)은 같은 LUT 라벨에서 기존 detect_traffic_light와 같은 외곽선 면적 기준으로 판정한다 (has_outline).
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+_MAX_RANGES = 8
+_CACHE_SIZE = 16
+
+
+@dataclass
+class ColorBlob:
+    """색별 가장 큰 연결 영역. 좌표와 면적(픽셀 수)은 원본 프레임 기준."""
+    area: int
+    x: int
+    y: int
+    w: int
+    h: int
+    cx: float
+    cy: float
+
+    def _to_frame(self, x0: int, y0: int, scale: float) -> "ColorBlob":
+        """ROI/축소 좌표를 원본 프레임 좌표로. 면적도 원본 픽셀 수로 환산.
+
+        INTER_NEAREST 축소에서 축소 픽셀 i는 원본 픽셀 floor(i / scale)를 가져오므로 중심도 i / scale로 되돌린다.
+        """
+        if x0 == 0 and y0 == 0 and scale == 1.0:
+            return self
+        inv = 1.0 / scale
+        return ColorBlob(int(round(self.area * inv * inv)),
+                         x0 + int(self.x * inv), y0 + int(self.y * inv),
+                         int(round(self.w * inv)), int(round(self.h * inv)),
+                         x0 + self.cx * inv, y0 + self.cy * inv)
+
+
+def _as_ranges(bound) -> list[tuple[int, ...]]:
+    """[h_lo, h_hi, s_lo, s_hi, v_lo, v_hi] 하나 또는 그 목록."""
+    if all(np.isscalar(v) for v in bound):
+        bound = [bound]
+    ranges = [tuple(int(v) for v in b) for b in bound]
+    if not ranges or any(len(r) != 6 for r in ranges):
+        raise ValueError("HSV 범위 배열은 6개의 요소를 가져야 합니다.")
+    return ranges
+
+
+def crop_scale(image: np.ndarray, roi=None, scale: float = 1.0) -> tuple[np.ndarray, tuple[int, int, int, int]]:
+    """roi (x, y, w, h, 원본 픽셀)로 자르고 scale(0~1]로 축소. (처리할 이미지, 이미지 안으로 잘린 실제 roi).
+
+    축소는 INTER_NEAREST: HSV 색상값은 0/180에서 이어지므로 평균 보간을 하면 빨강이 엉뚱한 색이 된다.
+    """
+    if not 0.0 < scale <= 1.0:
+        raise ValueError("scale은 0보다 크고 1 이하여야 합니다.")
+    x0 = y0 = 0
+    if roi is not None:
+        if len(roi) != 4:
+            raise ValueError("roi는 (x, y, w, h) 4개의 요소를 가져야 합니다.")
+        x0, y0, w, h = (int(v) for v in roi)
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(image.shape[1], x0 + w), min(image.shape[0], y0 + h)
+        if x1 <= x0 or y1 <= y0:
+            raise ValueError("roi가 이미지 밖에 있습니다.")
+        image = image[y0:y1, x0:x1]
+    box = (x0, y0, image.shape[1], image.shape[0])
+    if scale != 1.0:
+        size = (max(1, int(round(image.shape[1] * scale))), max(1, int(round(image.shape[0] * scale))))
+        image = cv2.resize(image, size, interpolation=cv2.INTER_NEAREST)
+    return image, box
+
+
+def expand_mask(mask: np.ndarray, shape: tuple, box: tuple[int, int, int, int]) -> np.ndarray:
+    """crop_scale로 처리한 마스크를 원본 프레임 크기로 (ROI 밖은 0)."""
+    x0, y0, w, h = box
+    if (x0, y0) == (0, 0) and (h, w) == tuple(shape[:2]) and mask.shape[:2] == (h, w):
+        return mask
+    full = np.zeros(shape[:2], np.uint8)
+    if mask.shape[:2] == (h, w):
+        full[y0:y0 + h, x0:x0 + w] = mask
+    else:
+        cv2.resize(mask, (w, h), dst=full[y0:y0 + h, x0:x0 + w], interpolation=cv2.INTER_NEAREST)
+    return full
+
+
+class _ColorClassifier:
+    """colors: {이름: 범위 또는 범위 목록}. 생성 시 LUT를 한 번 만들고 classify()마다 재사용."""
+    def __init__(self, colors: dict):
+        self.names = list(colors)
+        luts = np.zeros((3, 256), np.uint8)
+        self._bits: dict[str, int] = {}
+        bit = 0
+        for name in self.names:
+            mask = 0
+            for h_lo, h_hi, s_lo, s_hi, v_lo, v_hi in _as_ranges(colors[name]):
+                if bit >= _MAX_RANGES:
+                    raise ValueError(f"색 범위는 최대 {_MAX_RANGES}개까지 지원합니다.")
+                for ch, (lo, hi) in enumerate(((h_lo, h_hi), (s_lo, s_hi), (v_lo, v_hi))):
+                    luts[ch, max(0, lo):min(255, hi) + 1] |= 1 << bit
+                mask |= 1 << bit
+                bit += 1
+            self._bits[name] = mask
+        self._luts = [luts[ch].copy() for ch in range(3)]
+        self._local = threading.local()
+
+    def _buf(self, name: str, shape: tuple, channels: int = 1) -> np.ndarray:
+        """스레드별 작업 버퍼 (같은 분류기를 여러 스레드가 공유해도 안전)."""
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = {}
+        shape = shape + ((channels,) if channels > 1 else ())
+        buf = scratch.get(name)
+        if buf is None or buf.shape != shape:
+            buf = scratch[name] = np.empty(shape, np.uint8)
+        return buf
+
+    def label(self, hsv: np.ndarray) -> np.ndarray:
+        """픽셀별 범위 비트 집합 (uint8). 결과 버퍼는 다음 호출에서 재사용된다."""
+        hw = hsv.shape[:2]
+        # 새 배열 할당(페이지 폴트)이 분리 자체보다 비싸므로 평면 버퍼도 재사용
+        planes = cv2.split(hsv, [self._buf(f"plane{ch}", hw) for ch in range(3)])
+        label = cv2.LUT(planes[0], self._luts[0], dst=self._buf("label", hw))
+        tmp = self._buf("tmp", hw)
+        for ch in (1, 2):
+            cv2.bitwise_and(label, cv2.LUT(planes[ch], self._luts[ch], dst=tmp), dst=label)
+        return label
+
+    def mask(self, label: np.ndarray, name: str) -> np.ndarray:
+        """label에서 name 색의 0/255 마스크."""
+        m = cv2.bitwise_and(label, self._bits[name], dst=self._buf("mask", label.shape))
+        return cv2.compare(m, 0, cv2.CMP_GT, dst=m)
+
+    @staticmethod
+    def _largest(mask: np.ndarray) -> ColorBlob | None:
+        """가장 큰 8-연결 영역. 연결 요소 계산은 마스크 픽셀의 외접 사각형 안에서만 한다."""
+        x0, y0, w, h = cv2.boundingRect(mask)
+        if w == 0 or h == 0:
+            return None
+        n, _, stats, centroids = cv2.connectedComponentsWithStatsWithAlgorithm(
+            mask[y0:y0 + h, x0:x0 + w], 8, cv2.CV_32S, cv2.CCL_GRANA)
+        if n <= 1:
+            return None
+        i = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        x, y, bw, bh, area = (int(v) for v in stats[i])
+        return ColorBlob(area, x0 + x, y0 + y, bw, bh, x0 + float(centroids[i, 0]), y0 + float(centroids[i, 1]))
+
+    def has_outline(self, label: np.ndarray, name: str, min_area: float) -> bool:
+        """name 색의 가장 큰 외곽선(RETR_EXTERNAL, 꼭짓점은 픽셀 중심) 면적이 min_area 이상인지.
+
+        외곽선을 전부 만들고 Python에서 contourArea를 도는 대신 결과가 같은 싼 판정부터 한다.
+        - 마스크 외접 사각형 (w-1)(h-1)이 min_area보다 작으면 어떤 외곽선도 못 넘는다.
+        - 한 변 k = ceil(sqrt(min_area)) + 1 인 정사각형이 통째로 들어 있으면(k x k 침식) 그 외곽선은 넘는다.
+        - 나머지는 8-연결 요소 중 외접 사각형이 충분히 큰 것만 골라 그 요소의 외곽선 면적을 잰다.
+          안쪽 구멍에 든 요소의 외곽선은 바깥 요소보다 작으므로 최대값은 RETR_EXTERNAL과 같다.
+        잡음 프레임에서 자잘한 외곽선 수천 개를 만들지 않는다.
+        """
+        m = cv2.bitwise_and(label, self._bits[name], dst=self._buf("mask", label.shape))
+        x0, y0, w, h = cv2.boundingRect(m)
+        if w == 0 or (w - 1) * (h - 1) < min_area:
+            return False
+        m = m[y0:y0 + h, x0:x0 + w]
+        k = int(np.ceil(np.sqrt(max(0.0, min_area)))) + 1
+        if k <= min(w, h):
+            core = cv2.erode(m, np.ones((k, k), np.uint8), dst=self._buf("core", m.shape),
+                             borderType=cv2.BORDER_CONSTANT, borderValue=0)
+            if cv2.countNonZero(core):
+                return True
+        n, labels, stats, _ = cv2.connectedComponentsWithStatsWithAlgorithm(m, 8, cv2.CV_32S, cv2.CCL_GRANA)
+        spans = (stats[1:, cv2.CC_STAT_WIDTH] - 1) * (stats[1:, cv2.CC_STAT_HEIGHT] - 1)
+        big = np.flatnonzero(spans >= min_area)
+        for i in 1 + big[np.argsort(-spans[big])]:
+            x, y, bw, bh = (int(v) for v in stats[i, :4])
+            part = (labels[y:y + bh, x:x + bw] == i).astype(np.uint8)
+            contours, _ = cv2.findContours(part, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            if contours and max(cv2.contourArea(c) for c in contours) >= min_area:
+                return True
+        return False
+
+    def classify(self, hsv: np.ndarray, min_area: int = 100, roi=None, scale: float = 1.0) -> dict[str, ColorBlob]:
+        """색별 가장 큰 연결 영역 중 min_area(원본 픽셀 수) 이상인 것. 픽셀 수가 모자란 색은 연결 요소 계산을 건너뛴다.
+
+        roi/scale을 주면 그 영역만 축소해서 처리하고, 결과 좌표와 면적은 원본 프레임 기준으로 되돌린다.
+        """
+        hsv, (x0, y0, _, _) = crop_scale(hsv, roi, scale)
+        min_area = max(1, int(round(min_area * scale * scale)))
+        label = self.label(hsv)
+        found: dict[str, ColorBlob] = {}
+        for name in self.names:
+            m = self.mask(label, name)
+            if cv2.countNonZero(m) < min_area:
+                continue
+            blob = self._largest(m)
+            if blob is not None and blob.area >= min_area:
+                found[name] = blob._to_frame(x0, y0, scale)
+        return found
+
+
+def traffic_light(hsv: np.ndarray, green_bound, red_bound, min_area: int = 100, roi=None, scale: float = 1.0) -> int:
+    """신호등 판정 (0 없음, 1 초록, 2 빨강). LUT 한 번으로 두 색을 라벨링하고 빨강을 먼저 본다 (찾으면 초록 생략).
+
+    판정 기준은 이전 구현과 같은 "가장 큰 외곽선(RETR_EXTERNAL) 면적 >= min_area" (_ColorClassifier.has_outline).
+    min_area는 원본 해상도 기준이고 roi/scale은 crop_scale과 같다.
+    """
+    hsv, _ = crop_scale(hsv, roi, scale)
+    classifier = get_classifier({"red": red_bound, "green": green_bound})
+    label = classifier.label(hsv)
+    min_area = min_area * scale * scale
+    for name, result in (("red", 2), ("green", 1)):
+        if classifier.has_outline(label, name, min_area):
+            return result
+    return 0
+
+
+class _BgrMaskLut:
+    """BGR 프레임을 HSV 변환 없이 바로 마스크로: BGR565(5-6-5비트) 코드 65536개 -> 0/255 표.
+
+    cvtColor(BGR2BGR565)는 픽셀을 16비트 인덱스로 압축하는 가장 싼 변환이라 표 조회 한 번으로 끝난다.
+    표는 각 코드 칸의 중심 색을 HSV로 바꿔 inRange한 결과. 경계 근처 픽셀은 양자화(채널당 2~3비트 손실) 때문에
+    HSV inRange와 다를 수 있다.
+    """
+    def __init__(self, bound):
+        h_lo, h_hi, s_lo, s_hi, v_lo, v_hi = _as_ranges(bound)[0]
+        code = np.arange(65536, dtype=np.uint32)
+        centers = np.empty((256, 256, 3), np.uint8)
+        flat = centers.reshape(-1, 3)
+        flat[:, 0] = ((code & 0x1F) << 3) | 4
+        flat[:, 1] = (((code >> 5) & 0x3F) << 2) | 2
+        flat[:, 2] = ((code >> 11) << 3) | 4
+        hsv = cv2.cvtColor(centers, cv2.COLOR_BGR2HSV)
+        self.table = cv2.inRange(hsv, (h_lo, s_lo, v_lo), (h_hi, s_hi, v_hi)).reshape(-1)
+        self._local = threading.local()
+
+    def mask(self, bgr: np.ndarray) -> np.ndarray:
+        """새 마스크 배열 (호출자가 보관해도 됨)."""
+        hw = bgr.shape[:2]
+        packed = getattr(self._local, "packed", None)
+        if packed is None or packed.shape[:2] != hw:
+            packed = self._local.packed = np.empty(hw + (2,), np.uint8)
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2BGR565, dst=packed)
+        return np.take(self.table, packed.view(np.uint16)[..., 0])
+
+
+_cache: OrderedDict[tuple, object] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cached(key: tuple, make):
+    with _cache_lock:
+        obj = _cache.get(key)
+        if obj is not None:
+            _cache.move_to_end(key)
+            return obj
+    obj = make()
+    with _cache_lock:
+        _cache[key] = obj
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return obj
+
+
+def get_classifier(colors: dict) -> _ColorClassifier:
+    """같은 색 설정이면 LUT를 다시 만들지 않도록 최근 분류기를 재사용."""
+    key = ("hsv",) + tuple((name, tuple(_as_ranges(bound))) for name, bound in colors.items())
+    return _cached(key, lambda: _ColorClassifier(colors))
+
+
+def get_bgr_mask_lut(bound) -> _BgrMaskLut:
+    """슬라이더 값이 바뀔 때만 표를 새로 만든다 (최근 설정 몇 개는 보관)."""
+    ranges = _as_ranges(bound)
+    if len(ranges) != 1:
+        raise ValueError("HSV 범위 배열은 6개의 요소를 가져야 합니다.")
+    return _cached(("bgr",) + ranges[0], lambda: _BgrMaskLut(ranges[0]))
@@ -0,0 +1,115 @@
+"""고정 주기 제어 루프: monotonic 시계 기준으로 step(snapshot)을 호출하고 주기/지터를 기록. Findee.run_control_loop에서 사용."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from findee._metrics import _LatencyHistogram
+
+# 예정 시각 직전 이 구간은 sleep 대신 양보하며 대기 (sleep 해상도 보정)
+_SPIN_S = 0.001
+OVERRUN_POLICIES = ("skip", "delay")
+
+
+@dataclass
+class ControlSnapshot:
+    """step에 전달되는 한 틱의 센서 스냅샷. 같은 틱 안에서는 값이 바뀌지 않는다."""
+    tick: int
+    t: float           # 루프 시작 후 경과 시간(초)
+    dt: float          # 직전 step 시작 이후 경과(초)
+    roll: float = 0.0
+    pitch: float = 0.0
+    yaw: float = 0.0
+    distance: float | None = None  # distance_every > 0일 때만 갱신, 그 사이엔 마지막 값
+
+
+class _ControlLoop:
+    """step을 rate_hz로 호출. step이 False를 반환하거나 duration/max_ticks에 도달하면 종료.
+
+    overrun: step이 주기를 넘겼을 때
+      - "skip": 놓친 틱은 버리고 원래 격자의 다음 시각에 실행 (위상 유지)
+      - "delay": 지금부터 한 주기 뒤로 격자를 다시 잡음 (간격 유지)
+    """
+    def __init__(self, step: Callable[[ControlSnapshot], object], rate_hz: float,
+                 imu=None, motor=None, distance_every: int = 0, overrun: str = "skip"):
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be greater than 0")
+        if overrun not in OVERRUN_POLICIES:
+            raise ValueError(f"overrun must be one of {OVERRUN_POLICIES}")
+        self._step = step
+        self.period = 1.0 / rate_hz
+        self._imu = imu
+        self._motor = motor
+        self._distance_every = int(distance_every)
+        self._overrun = overrun
+        # 주기 히스토그램은 공칭 주기 주변을 촘촘히 나눈다
+        self.period_hist = _LatencyHistogram(tuple(
+            round(self.period * 1000.0 * k, 4) for k in (0.5, 0.8, 0.9, 0.95, 0.99, 1.01, 1.05, 1.1, 1.2, 1.5, 2.0, 5.0)
+        ))
+        self.jitter_hist = _LatencyHistogram()
+        self.step_hist = _LatencyHistogram()
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self._distance = None
+
+    def _snapshot(self, tick: int, t: float, dt: float) -> ControlSnapshot:
+        snap = ControlSnapshot(tick=tick, t=t, dt=dt, distance=self._distance)
+        if self._imu is not None:
+            snap.roll, snap.pitch, snap.yaw = self._imu.get_rpy()
+        if self._motor is not None and self._distance_every > 0 and tick % self._distance_every == 0:
+            try:
+                # get_distance는 에코 시작 대기(100ms) + 에코 길이(30ms) 타임아웃이라 최대 ~130ms 블로킹한다
+                self._distance = snap.distance = self._motor.get_distance()
+            except Exception:
+                pass
+        return snap
+
+    def run(self, duration: float | None = None, max_ticks: int | None = None) -> dict:
+        start = time.monotonic()
+        deadline = start
+        last = None
+        while True:
+            now = time.monotonic()
+            remaining = deadline - now
+            if remaining > _SPIN_S:
+                time.sleep(remaining - _SPIN_S)
+            while time.monotonic() < deadline:
+                time.sleep(0)
+            now = time.monotonic()
+            if duration is not None and now - start >= duration:
+                break
+            self.jitter_hist.record(now - deadline)
+            if last is not None:
+                self.period_hist.record(now - last)
+            dt = now - last if last is not None else 0.0
+            last = now
+            snap = self._snapshot(self.ticks, now - start, dt)
+            self.ticks += 1
+            result = self._step(snap)
+            end = time.monotonic()
+            self.step_hist.record(end - now)
+            if result is False or (max_ticks is not None and self.ticks >= max_ticks):
+                break
+            deadline += self.period
+            if end > deadline:
+                self.overruns += 1
+                if self._overrun == "skip":
+                    missed = int((end - deadline) / self.period) + 1
+                    self.skipped += missed
+                    deadline += missed * self.period
+                else:
+                    deadline = end + self.period
+        return self.get_stats()
+
+    def get_stats(self) -> dict:
+        return {
+            "rate_hz": round(1.0 / self.period, 3),
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "period": self.period_hist.to_dict(),
+            "jitter": self.jitter_hist.to_dict(),
+            "step": self.step_hist.to_dict(),
+        }
@@ -0,0 +1,87 @@
+"""카메라 프레임 배열. ndarray 하위 클래스로 시퀀스 번호/캡처 시각을 함께 전달 (OpenCV에 그대로 전달 가능).
+
+파생 이미지(hsv, gray, blurred, half)는 처음 접근할 때 한 번만 계산해 프레임에 보관한다.
+여러 검출 함수가 같은 프레임의 HSV를 쓰더라도 cvtColor는 한 번만 돈다.
+"""
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+_BLUR_KSIZE = (5, 5)
+
+
+class _Frame(np.ndarray):
+    """seq: 캡처 순번(1부터), timestamp: 노출 시각(센서 타임스탬프를 time.monotonic으로 변환, 없으면 도착 시각),
+    arrival: 프레임이 링에 들어온 시각(time.monotonic)."""
+    def __new__(cls, array, seq: int | None = None, timestamp: float | None = None, arrival: float | None = None):
+        obj = np.asarray(array).view(cls)
+        obj.seq = seq
+        obj.timestamp = timestamp
+        obj.arrival = arrival if arrival is not None else timestamp
+        obj._derived = {}
+        return obj
+
+    def __array_finalize__(self, obj):
+        # 슬라이스/연산 결과는 원본과 내용이 다를 수 있으므로 메타데이터와 파생 이미지를 물려받지 않는다
+        self.seq = None
+        self.timestamp = None
+        self.arrival = None
+        self._derived = None
+        # 풀 슬롯을 가리키는 뷰면 그 슬롯의 FrameRef (weakref). 뷰/슬라이스도 같은 메모리이므로 물려받는다
+        self._ref = getattr(obj, "_ref", None)
+
+    def copy_frame(self) -> "_Frame":
+        """쓰기 가능한 사본. 메타데이터 유지."""
+        return _Frame(np.array(self, copy=True), self.seq, self.timestamp, self.arrival)
+
+    def meta(self) -> tuple[int, float, float] | None:
+        """(seq, timestamp, arrival). 카메라 프레임이 아니면 None."""
+        return (self.seq, self.timestamp, self.arrival) if self.seq else None
+
+    # --- 파생 이미지 (읽기 전용, 첫 접근 시 계산) ---
+    @property
+    def derivable(self) -> bool:
+        """BGR 카메라 프레임(또는 그 half)이라 파생 이미지를 만들 수 있으면 True. 슬라이스/연산 결과는 False."""
+        return self._derived is not None
+
+    def _memo(self, name: str, make):
+        cache = self._derived
+        if cache is None:
+            # 슬라이스 등: 보관할 곳이 없으므로 매번 계산
+            return make()
+        out = cache.get(name)
+        if out is None:
+            out = make()
+            out.flags.writeable = False
+            cache[name] = out
+        return out
+
+    @property
+    def hsv(self) -> np.ndarray:
+        return self._memo("hsv", lambda: cv2.cvtColor(self, cv2.COLOR_BGR2HSV))
+
+    @property
+    def gray(self) -> np.ndarray:
+        return self._memo("gray", lambda: cv2.cvtColor(self, cv2.COLOR_BGR2GRAY))
+
+    @property
+    def blurred(self) -> np.ndarray:
+        return self._memo("blurred", lambda: cv2.GaussianBlur(self, _BLUR_KSIZE, 0))
+
+    @property
+    def half(self) -> "_Frame":
+        """가로세로 절반(INTER_AREA). 메타데이터는 없지만 frame.half.hsv처럼 다시 파생 이미지를 가진다."""
+        return self._memo("half", lambda: _Frame(cv2.resize(self, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)))
+
+    def invalidate(self) -> None:
+        """프레임에 그림을 그리는 등 내용을 바꾼 뒤 호출하면 이후 파생 이미지를 다시 계산한다."""
+        if self._derived is not None:
+            self._derived.clear()
+
+
+def as_hsv(image: np.ndarray) -> np.ndarray:
+    """비전 함수 입력: 카메라 프레임이면 보관된 HSV, 아니면 이미 HSV인 배열로 보고 그대로."""
+    if isinstance(image, _Frame) and image._derived is not None:
+        return image.hsv
+    return image
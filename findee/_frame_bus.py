@@ -0,0 +1,241 @@
+"""공유 메모리 프레임 버스: 캡처 프로세스가 프레임을 multiprocessing.shared_memory 링에 쓰고,
+다른 프로세스(비전 워커, 녹화기, 대시보드)가 FrameBusReader로 복사 없이 읽는다.
+
+배치 (리틀 엔디언):
+  [0, 64)            전역 헤더: magic, version, slots, state, height, width, channels, slot_bytes, latest_seq
+  [64, 64 + 32*N)    슬롯 헤더: lock(seqlock, 쓰는 중 홀수), seq, timestamp(monotonic), nbytes
+  이후 64바이트 정렬  슬롯 데이터 N개 (uint8, height*width*channels)
+
+쓰기: lock을 홀수로 -> 데이터/seq/timestamp 기록 -> lock을 짝수로 -> latest_seq 갱신.
+읽기: lock을 읽고(짝수여야 함) 데이터를 쓴 뒤 lock이 그대로인지 확인. 복사 없는 뷰는 처리 후 valid()로 덮어쓰기 여부를 확인한다.
+writer가 모양을 바꾸거나 종료하면 state=closed로 표시하고, reader는 다음 wait_next에서 다시 연결한다.
+"""
+from __future__ import annotations
+
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from findee._frame import _Frame
+
+DEFAULT_BUS_NAME = "pf_frames"
+_MAGIC = 0x42464650  # "PFFB"
+_VERSION = 1
+_STATE_OPEN, _STATE_CLOSED = 1, 2
+_HEADER_BYTES = 64
+_HEADER = np.dtype([
+    ("magic", "<u4"), ("version", "<u4"), ("slots", "<u4"), ("state", "<u4"),
+    ("height", "<u4"), ("width", "<u4"), ("channels", "<u4"), ("pad", "<u4"),
+    ("slot_bytes", "<u8"), ("latest_seq", "<u8"),
+])
+_SLOT = np.dtype([("lock", "<u8"), ("seq", "<u8"), ("timestamp", "<f8"), ("nbytes", "<u8")])
+_POLL_S = 0.001
+
+
+def _layout(slots: int) -> int:
+    """데이터 영역 시작 오프셋."""
+    end = _HEADER_BYTES + _SLOT.itemsize * slots
+    return (end + 63) // 64 * 64
+
+
+class _Mapped:
+    """shared_memory 위의 헤더/슬롯 뷰 묶음."""
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self.shm = shm
+        self.header = np.ndarray((1,), _HEADER, buffer=shm.buf, offset=0)[0]
+        slots = int(self.header["slots"])
+        self.slots = np.ndarray((slots,), _SLOT, buffer=shm.buf, offset=_HEADER_BYTES)
+        self.shape = (int(self.header["height"]), int(self.header["width"]), int(self.header["channels"]))
+        slot_bytes = int(self.header["slot_bytes"])
+        base = _layout(slots)
+        self.data = [np.ndarray(self.shape, np.uint8, buffer=shm.buf, offset=base + i * slot_bytes) for i in range(slots)]
+
+    def release(self) -> None:
+        # shm.close() 전에 버퍼를 참조하는 뷰를 모두 놓아야 한다
+        self.header = self.slots = self.data = None
+
+
+class _FrameBusWriter:
+    """캡처 쪽. 같은 이름의 이전 세그먼트가 남아 있으면 지우고 새로 만든다."""
+    def __init__(self, name: str, shape: tuple, slots: int = 8):
+        shape = tuple(shape) if len(shape) == 3 else tuple(shape) + (1,)
+        self.name = name
+        self.shape = shape
+        slot_bytes = (int(np.prod(shape)) + 63) // 64 * 64
+        try:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=_layout(slots) + slot_bytes * slots)
+        header = np.ndarray((1,), _HEADER, buffer=self._shm.buf, offset=0)
+        header[0] = (_MAGIC, _VERSION, slots, _STATE_OPEN, shape[0], shape[1], shape[2], 0, slot_bytes, 0)
+        del header
+        self._map = _Mapped(self._shm)
+        self.published = 0
+
+    def publish(self, array: np.ndarray, seq: int, timestamp: float) -> None:
+        m = self._map
+        i = seq % len(m.slots)
+        slot = m.slots[i]
+        slot["lock"] += 1
+        np.copyto(m.data[i], array.reshape(self.shape))
+        slot["seq"] = seq
+        slot["timestamp"] = timestamp
+        slot["nbytes"] = array.nbytes
+        slot["lock"] += 1
+        m.header["latest_seq"] = seq
+        self.published += 1
+
+    def close(self) -> None:
+        if self._map is None:
+            return
+        self._map.header["state"] = _STATE_CLOSED
+        self._map.release()
+        self._map = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class FrameView:
+    """버스 슬롯에 대한 복사 없는 읽기 전용 뷰. writer가 링을 한 바퀴 돌면 덮어써지므로 처리 후 valid()로 확인."""
+    def __init__(self, reader: "FrameBusReader", index: int, lock: int, array: _Frame):
+        self._reader = reader
+        self._index = index
+        self._lock = lock
+        self.array = array
+
+    @property
+    def seq(self) -> int:
+        return self.array.seq
+
+    @property
+    def timestamp(self) -> float:
+        return self.array.timestamp
+
+    def valid(self) -> bool:
+        """뷰를 만든 뒤 슬롯이 다시 쓰이지 않았으면 True."""
+        m = self._reader._map
+        return m is not None and int(m.slots[self._index]["lock"]) == self._lock
+
+    def copy(self) -> _Frame | None:
+        """쓰기 가능한 사본. 복사 도중 덮어써졌으면 None."""
+        out = self.array.copy_frame()
+        return out if self.valid() else None
+
+
+class FrameBusReader:
+    """다른 프로세스에서 카메라 프레임 읽기.
+
+        reader = FrameBusReader()            # Findee.enable_frame_bus() 가 켜져 있어야 함
+        view = reader.wait_next()
+        while True:
+            view = reader.wait_next(view.seq if view else None)
+            if view is None:
+                continue
+            mask = cv2.inRange(view.array, lo, hi)
+            if not view.valid():             # 처리 중 덮어써짐 -> 결과 버림
+                continue
+    """
+    def __init__(self, name: str = DEFAULT_BUS_NAME, timeout: float = 0.0):
+        self.name = name
+        self._shm = None
+        self._map: _Mapped | None = None
+        deadline = time.monotonic() + timeout
+        while not self._attach() and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def _attach(self) -> bool:
+        self._detach()
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return False
+        if sys.version_info < (3, 13):
+            # 3.13 전에는 attach만 해도 resource_tracker가 종료 시 세그먼트를 unlink한다
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        header = np.ndarray((1,), _HEADER, buffer=shm.buf, offset=0)[0]
+        ok = int(header["magic"]) == _MAGIC and int(header["version"]) == _VERSION and int(header["state"]) == _STATE_OPEN
+        del header
+        if not ok:
+            shm.close()
+            return False
+        self._shm = shm
+        self._map = _Mapped(shm)
+        return True
+
+    def _detach(self) -> None:
+        if self._map is not None:
+            self._map.release()
+            self._map = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                # 사용자가 아직 FrameView 배열을 들고 있음. 매핑은 GC 시 해제된다
+                pass
+            self._shm = None
+
+    @property
+    def connected(self) -> bool:
+        return self._map is not None and int(self._map.header["state"]) == _STATE_OPEN
+
+    @property
+    def shape(self) -> tuple | None:
+        return self._map.shape if self._map is not None else None
+
+    @property
+    def latest_seq(self) -> int:
+        return int(self._map.header["latest_seq"]) if self._map is not None else 0
+
+    def _view(self, seq: int) -> FrameView | None:
+        m = self._map
+        i = seq % len(m.slots)
+        lock = int(m.slots[i]["lock"])
+        if lock & 1 or int(m.slots[i]["seq"]) != seq:
+            return None
+        frame = _Frame(m.data[i], seq, float(m.slots[i]["timestamp"]))
+        frame.flags.writeable = False
+        if int(m.slots[i]["lock"]) != lock:
+            return None
+        return FrameView(self, i, lock, frame)
+
+    def latest(self) -> FrameView | None:
+        """가장 최근 프레임 뷰. 연결 전이거나 쓰는 중이면 None."""
+        if not self.connected and not self._attach():
+            return None
+        seq = self.latest_seq
+        return self._view(seq) if seq else None
+
+    def wait_next(self, after_seq: int | None = None, timeout: float = 1.0) -> FrameView | None:
+        """after_seq(None이면 호출 시점 최신)보다 새 프레임까지 폴링 대기. writer가 재시작되면 다시 연결."""
+        deadline = time.monotonic() + timeout
+        if after_seq is None:
+            after_seq = self.latest_seq
+        while True:
+            if not self.connected:
+                if self._attach():
+                    after_seq = min(after_seq, self.latest_seq)
+            elif self.latest_seq > after_seq:
+                view = self._view(self.latest_seq)
+                if view is not None:
+                    return view
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(_POLL_S)
+
+    def close(self) -> None:
+        self._detach()
+
+    def __enter__(self) -> "FrameBusReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
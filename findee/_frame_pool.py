@@ -0,0 +1,130 @@
+"""참조 카운트 프레임 버퍼 풀. 캡처는 미리 할당한 슬롯에 직접 쓰고, 소비자는 읽기 전용 뷰(FrameRef)를 받는다."""
+from __future__ import annotations
+
+import threading
+import weakref
+
+import numpy as np
+
+from findee._frame import _Frame
+
+
+class _FramePool:
+    """같은 shape/dtype 슬롯 목록. 참조 0인 슬롯만 캡처가 다시 쓴다. 모두 사용 중이면 max_size까지 늘린다."""
+    def __init__(self, shape: tuple, dtype=np.uint8, size: int = 6, max_size: int = 12):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._max_size = max(size, max_size)
+        self._lock = threading.Lock()
+        self._slots: list[np.ndarray] = []
+        self._refs: list[int] = []
+        self.allocs = 0
+        self.reuses = 0
+        self.copies = 0
+        self.dropped = 0
+        for _ in range(size):
+            self._grow()
+
+    def _grow(self) -> int:
+        self._slots.append(np.empty(self.shape, self.dtype))
+        self._refs.append(0)
+        self.allocs += 1
+        return len(self._slots) - 1
+
+    def acquire(self) -> int | None:
+        """캡처용 빈 슬롯 번호 (참조 1로 시작). 풀이 가득 차 있으면 None (해당 프레임은 버림)."""
+        with self._lock:
+            for i, r in enumerate(self._refs):
+                if r == 0:
+                    self._refs[i] = 1
+                    self.reuses += 1
+                    return i
+            if len(self._slots) < self._max_size:
+                i = self._grow()
+                self._refs[i] = 1
+                return i
+            self.dropped += 1
+            return None
+
+    def slot(self, index: int) -> np.ndarray:
+        return self._slots[index]
+
+    def incref(self, index: int) -> None:
+        with self._lock:
+            self._refs[index] += 1
+
+    def decref(self, index: int) -> None:
+        with self._lock:
+            self._refs[index] -= 1
+
+    def count_copy(self) -> None:
+        with self._lock:
+            self.copies += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            in_use = sum(1 for r in self._refs if r > 0)
+        return {
+            "shape": self.shape,
+            "slots": len(self._slots),
+            "in_use": in_use,
+            "allocs": self.allocs,
+            "reuses": self.reuses,
+            "copies": self.copies,
+            "dropped": self.dropped,
+        }
+
+
+class FrameRef:
+    """풀 슬롯 하나에 대한 참조. array는 복사 없는 읽기 전용 뷰이며 release() 전까지만 유효하다.
+
+        with findee.get_frame_ref() as ref:
+            hsv = cv2.cvtColor(ref.array, cv2.COLOR_BGR2HSV)
+    """
+    def __init__(self, pool: _FramePool, index: int, seq: int, timestamp: float, arrival: float | None = None):
+        self._pool = pool
+        self._index = index
+        self._released = False
+        frame = _Frame(pool.slot(index), seq, timestamp, arrival)
+        frame.flags.writeable = False
+        frame._ref = weakref.ref(self)
+        self.array = frame
+
+    @property
+    def seq(self) -> int:
+        return self.array.seq
+
+    @property
+    def timestamp(self) -> float:
+        return self.array.timestamp
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def share(self) -> "FrameRef":
+        """같은 슬롯에 대한 새 참조 (각자 release 필요)."""
+        self._pool.incref(self._index)
+        return FrameRef(self._pool, self._index, self.seq, self.timestamp, self.array.arrival)
+
+    def writable(self) -> "_Frame":
+        """쓰기 가능한 사본. 이때만 복사가 일어난다."""
+        self._pool.count_copy()
+        return self.array.copy_frame()
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._pool.decref(self._index)
+
+    def __enter__(self) -> "FrameRef":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            pass
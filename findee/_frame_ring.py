@@ -0,0 +1,50 @@
+"""최신 프레임 링 버퍼: 캡처 스레드가 publish, 소비자는 latest/wait_next로 공유 참조를 받는다. _Camera에서 사용."""
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+from findee._frame_pool import FrameRef
+
+
+class _FrameRing:
+    """최근 size개 FrameRef 보관. 밀려난 프레임은 참조를 반납해 풀 슬롯이 재사용된다."""
+    def __init__(self, size: int = 4):
+        self._cond = threading.Condition()
+        self._size = size
+        self._refs: deque[FrameRef] = deque()
+        self._seq = 0
+
+    @property
+    def seq(self) -> int:
+        """마지막으로 publish된 프레임 번호 (없으면 0)."""
+        return self._seq
+
+    def publish(self, ref: FrameRef) -> None:
+        """캡처가 만든 참조의 소유권을 링으로 넘긴다."""
+        with self._cond:
+            if len(self._refs) >= self._size:
+                self._refs.popleft().release()
+            self._refs.append(ref)
+            self._seq = ref.seq
+            self._cond.notify_all()
+
+    def latest(self) -> FrameRef | None:
+        """최신 프레임 공유 참조 (호출자가 release)."""
+        with self._cond:
+            return self._refs[-1].share() if self._refs else None
+
+    def wait_next(self, after_seq: int | None = None, timeout: float | None = None) -> FrameRef | None:
+        """after_seq보다 새 프레임이 생길 때까지 대기 (None이면 호출 시점 이후 프레임). 시간 초과 시 None."""
+        with self._cond:
+            if after_seq is None:
+                after_seq = self._seq
+            if not self._cond.wait_for(lambda: self._seq > after_seq and self._refs, timeout):
+                return None
+            return self._refs[-1].share()
+
+    def clear(self) -> None:
+        with self._cond:
+            while self._refs:
+                self._refs.popleft().release()
+            self._cond.notify_all()
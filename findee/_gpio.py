@@ -0,0 +1,66 @@
+"""GPIO/PWM 백엔드 선택. RPi.GPIO 호환 인터페이스(GPIO)로 노출해 모터/센서 코드는 그대로 사용.
+
+백엔드는 프로세스 시작 시 PF_GPIO_BACKEND 환경 변수(rpi | lgpio | sim)로 고르거나,
+Findee() 생성 전에 select_backend()로 지정한다. 기본값은 rpi (기존 RPi.GPIO 소프트웨어 PWM).
+"""
+from __future__ import annotations
+
+import os
+import threading
+
+GPIO_BACKEND_ENV = "PF_GPIO_BACKEND"
+GPIO_BACKENDS = ("rpi", "lgpio", "sim")
+_DEFAULT_BACKEND = "rpi"
+
+_backend_lock = threading.Lock()
+_backend = None
+_backend_name = None
+
+
+def _load_backend(name: str):
+    if name == "rpi":
+        import RPi.GPIO as rpi_gpio
+        return rpi_gpio
+    if name == "lgpio":
+        from findee._gpio_lgpio import _LgpioGPIO
+        return _LgpioGPIO()
+    if name == "sim":
+        from findee._gpio_sim import _SimGPIO
+        return _SimGPIO()
+    raise ValueError(f"알 수 없는 GPIO 백엔드: {name} (가능: {', '.join(GPIO_BACKENDS)})")
+
+
+def select_backend(name: str | None = None):
+    """GPIO 백엔드 선택. None이면 환경 변수/기본값. 핀 초기화(gpio_init) 전에 호출해야 한다."""
+    global _backend, _backend_name
+    name = (name or os.environ.get(GPIO_BACKEND_ENV) or _DEFAULT_BACKEND).strip().lower()
+    with _backend_lock:
+        if _backend is not None and name == _backend_name:
+            return _backend
+        backend = _load_backend(name)
+        _backend, _backend_name = backend, name
+        GPIO.__dict__.clear()
+    return backend
+
+
+def get_backend():
+    """현재 백엔드 반환. 아직 없으면 환경 변수 기준으로 로드."""
+    if _backend is None:
+        return select_backend()
+    return _backend
+
+
+def get_backend_name() -> str:
+    get_backend()
+    return _backend_name
+
+
+class _GPIOProxy:
+    """RPi.GPIO 모듈 자리에 쓰는 위임 객체. 첫 접근 시 속성을 캐시해 이후 호출 오버헤드 없음."""
+    def __getattr__(self, name):
+        value = getattr(get_backend(), name)
+        self.__dict__[name] = value
+        return value
+
+
+GPIO = _GPIOProxy()
@@ -0,0 +1,215 @@
+"""lgpio 기반 GPIO 백엔드. PWM은 lgpio C 스레드(tx_pwm) 또는 sysfs 하드웨어 PWM 채널 사용.
+
+하드웨어 PWM은 PWM 기능이 있는 핀(BCM 12/13/18/19 등)에만 가능하므로 PF_HW_PWM 환경 변수로
+"핀=칩:채널" 목록을 지정한다 (예: "18=0:2,19=0:3"). 목록에 없는 핀은 tx_pwm으로 동작한다.
+"""
+from __future__ import annotations
+
+import os
+import threading
+
+import lgpio
+
+GPIOCHIP_ENV = "PF_GPIOCHIP"
+HW_PWM_ENV = "PF_HW_PWM"
+_SYSFS_PWM = "/sys/class/pwm"
+
+
+def _parse_hw_pwm_map(text: str) -> dict[int, tuple[int, int]]:
+    out = {}
+    for item in (text or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        pin, _, chan = item.partition("=")
+        chip, _, ch = chan.partition(":")
+        out[int(pin)] = (int(chip), int(ch))
+    return out
+
+
+class _SysfsPWM:
+    """/sys/class/pwm 하드웨어 PWM 채널 하나."""
+    def __init__(self, chip: int, channel: int):
+        self._base = f"{_SYSFS_PWM}/pwmchip{chip}"
+        self._path = f"{self._base}/pwm{channel}"
+        if not os.path.isdir(self._path):
+            self._write(f"{self._base}/export", channel)
+        self._period_ns = 0
+
+    @staticmethod
+    def _write(path: str, value) -> None:
+        with open(path, "w") as f:
+            f.write(str(value))
+
+    def configure(self, frequency: float, duty: float) -> None:
+        period = int(1e9 / frequency)
+        if period != self._period_ns:
+            # period 축소 전에 duty를 먼저 0으로 내려야 EINVAL이 나지 않음
+            self._write(f"{self._path}/duty_cycle", 0)
+            self._write(f"{self._path}/period", period)
+            self._period_ns = period
+        self._write(f"{self._path}/duty_cycle", int(period * duty / 100.0))
+
+    def enable(self, on: bool) -> None:
+        self._write(f"{self._path}/enable", 1 if on else 0)
+
+
+class _LgpioPWM:
+    """RPi.GPIO.PWM 호환: start, ChangeDutyCycle, ChangeFrequency, stop."""
+    def __init__(self, gpio: "_LgpioGPIO", channel: int, frequency: float):
+        self._gpio = gpio
+        self._channel = channel
+        self._freq = float(frequency)
+        self._duty = 0.0
+        self._running = False
+        hw = gpio._hw_pwm_map.get(channel)
+        if hw is not None:
+            gpio._release_for_pwm(channel)
+        self._hw = _SysfsPWM(*hw) if hw is not None else None
+
+    def _apply(self) -> None:
+        if self._hw is not None:
+            self._hw.configure(self._freq, self._duty)
+        else:
+            lgpio.tx_pwm(self._gpio._handle, self._channel, self._freq, self._duty)
+
+    def start(self, duty: float) -> None:
+        self._duty = float(duty)
+        self._running = True
+        self._apply()
+        if self._hw is not None:
+            self._hw.enable(True)
+
+    def ChangeDutyCycle(self, duty: float) -> None:
+        self._duty = float(duty)
+        if self._running:
+            self._apply()
+
+    def ChangeFrequency(self, frequency: float) -> None:
+        self._freq = float(frequency)
+        if self._running:
+            self._apply()
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        if self._hw is not None:
+            self._hw.enable(False)
+        else:
+            lgpio.tx_pwm(self._gpio._handle, self._channel, 0, 0)
+
+
+class _LgpioGPIO:
+    """RPi.GPIO 모듈 호환 인터페이스 (BCM 번호만 지원)."""
+    BCM = 11
+    BOARD = 10
+    OUT = 0
+    IN = 1
+    LOW = 0
+    HIGH = 1
+    PUD_OFF = 20
+    PUD_DOWN = 21
+    PUD_UP = 22
+    RISING = 31
+    FALLING = 32
+    BOTH = 33
+
+    _PULL_FLAGS = {PUD_OFF: lgpio.SET_PULL_NONE, PUD_DOWN: lgpio.SET_PULL_DOWN, PUD_UP: lgpio.SET_PULL_UP}
+    _EDGE_FLAGS = {RISING: lgpio.RISING_EDGE, FALLING: lgpio.FALLING_EDGE, BOTH: lgpio.BOTH_EDGES}
+
+    def __init__(self):
+        self._handle = lgpio.gpiochip_open(int(os.environ.get(GPIOCHIP_ENV, "0")))
+        self._hw_pwm_map = _parse_hw_pwm_map(os.environ.get(HW_PWM_ENV, ""))
+        self._claimed: set[int] = set()
+        # setup()에서 준 풀업/풀다운. add_event_detect가 핀을 alert로 다시 잡을 때 같은 풀을 유지한다
+        self._pulls: dict[int, int] = {}
+        self._callbacks: dict[int, object] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _channels(channel):
+        return tuple(channel) if isinstance(channel, (list, tuple)) else (channel,)
+
+    def PWM(self, channel: int, frequency: float) -> _LgpioPWM:
+        return _LgpioPWM(self, channel, frequency)
+
+    def setwarnings(self, flag: bool) -> None:
+        pass
+
+    def setmode(self, mode: int) -> None:
+        if mode != self.BCM:
+            raise ValueError("lgpio 백엔드는 BCM 번호만 지원합니다.")
+
+    def setup(self, channel, direction: int, pull_up_down: int = PUD_OFF, initial: int = LOW) -> None:
+        flags = self._PULL_FLAGS.get(pull_up_down, lgpio.SET_PULL_NONE)
+        with self._lock:
+            for ch in self._channels(channel):
+                self._pulls[ch] = flags
+                if ch in self._claimed:
+                    lgpio.gpio_free(self._handle, ch)
+                    self._claimed.discard(ch)
+                if direction == self.OUT and ch in self._hw_pwm_map:
+                    # GPIO 출력으로 잡으면 핀 기능(pinmux)이 PWM에서 바뀌어 sysfs PWM 신호가 핀에 나가지 않는다
+                    continue
+                if direction == self.OUT:
+                    lgpio.gpio_claim_output(self._handle, ch, initial, flags)
+                else:
+                    lgpio.gpio_claim_input(self._handle, ch, flags)
+                self._claimed.add(ch)
+
+    def _release_for_pwm(self, channel: int) -> None:
+        """하드웨어 PWM 채널을 열기 전에 GPIO로 잡혀 있던 핀을 놓는다."""
+        with self._lock:
+            if channel in self._claimed:
+                lgpio.gpio_free(self._handle, channel)
+                self._claimed.discard(channel)
+
+    def output(self, channel, value) -> None:
+        channels = self._channels(channel)
+        values = self._channels(value)
+        if len(values) == 1:
+            values = values * len(channels)
+        for ch, v in zip(channels, values):
+            if ch in self._hw_pwm_map and ch not in self._claimed:
+                # 하드웨어 PWM 핀은 GPIO로 잡지 않으므로 레벨은 PWM duty로만 정한다
+                continue
+            lgpio.gpio_write(self._handle, ch, 1 if v else 0)
+
+    def input(self, channel: int) -> int:
+        return self.HIGH if lgpio.gpio_read(self._handle, channel) else self.LOW
+
+    def add_event_detect(self, channel: int, edge: int, callback=None, bouncetime: int | None = None) -> None:
+        eflags = self._EDGE_FLAGS[edge]
+        with self._lock:
+            if channel in self._claimed:
+                lgpio.gpio_free(self._handle, channel)
+            lgpio.gpio_claim_alert(self._handle, channel, eflags, self._pulls.get(channel, lgpio.SET_PULL_NONE))
+            self._claimed.add(channel)
+        if bouncetime:
+            lgpio.gpio_set_debounce_micros(self._handle, channel, int(bouncetime) * 1000)
+        if callback is not None:
+            self._callbacks[channel] = lgpio.callback(
+                self._handle, channel, eflags, lambda chip, gpio, level, tick: callback(gpio)
+            )
+
+    def remove_event_detect(self, channel: int) -> None:
+        cb = self._callbacks.pop(channel, None)
+        if cb is None:
+            raise RuntimeError(f"GPIO {channel}: 이벤트 감지가 설정되지 않았습니다.")
+        cb.cancel()
+
+    def cleanup(self, channel=None) -> None:
+        with self._lock:
+            channels = self._channels(channel) if channel is not None else tuple(self._claimed)
+            for ch in channels:
+                cb = self._callbacks.pop(ch, None)
+                if cb is not None:
+                    cb.cancel()
+                if ch in self._claimed:
+                    try:
+                        lgpio.gpio_free(self._handle, ch)
+                    except lgpio.error:
+                        pass
+                    self._claimed.discard(ch)
+                self._pulls.pop(ch, None)
@@ -0,0 +1,258 @@
+"""시뮬레이션 GPIO 백엔드. 하드웨어 없이 모터/센서 경로를 실행하기 위한 RPi.GPIO 호환 객체.
+
+- 초음파: attach_ultrasonic(trig, echo, distances)로 TRIG 하강 에지마다 스크립트 거리만큼의 ECHO 펄스 생성
+- 인터럽트: add_edge_source(pin, rate_hz)로 일정 주기 에지를 만들어 add_event_detect 콜백 호출 (예: IMU INT)
+- PWM: 모든 duty/주파수 변경을 (monotonic 시각, 핀, duty) 로 pwm_log에 기록
+
+PF_GPIO_BACKEND=sim 으로 선택. PF_SIM_DISTANCE_CM 을 주면 보드 초음파 핀(TRIG 5 / ECHO 6)에 고정 거리를 붙인다.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from collections import deque
+
+SIM_DISTANCE_ENV = "PF_SIM_DISTANCE_CM"
+_BOARD_TRIG, _BOARD_ECHO = 5, 6
+_SOUND_CM_PER_S = 34300.0
+# HC-SR04: TRIG 하강 후 8사이클 버스트 송신까지의 지연
+_ECHO_START_DELAY_S = 0.0005
+_PWM_LOG_SIZE = 65536
+
+
+class _SimPWM:
+    """RPi.GPIO.PWM 호환. duty 변경을 부모 _SimGPIO 로그에 기록."""
+    def __init__(self, gpio: "_SimGPIO", channel: int, frequency: float):
+        self._gpio = gpio
+        self.channel = channel
+        self.frequency = float(frequency)
+        self.duty = 0.0
+        self.running = False
+
+    def start(self, duty: float) -> None:
+        self.running = True
+        self.ChangeDutyCycle(duty)
+
+    def ChangeDutyCycle(self, duty: float) -> None:
+        self.duty = float(duty)
+        self._gpio._record_pwm(self.channel, self.duty)
+
+    def ChangeFrequency(self, frequency: float) -> None:
+        self.frequency = float(frequency)
+
+    def stop(self) -> None:
+        self.running = False
+        self._gpio._record_pwm(self.channel, 0.0)
+
+
+class _EchoScript:
+    """TRIG 하강마다 다음 거리(cm)를 꺼내 ECHO 구간(monotonic)을 만든다. None/음수면 응답 없음."""
+    def __init__(self, trig: int, echo: int, distances):
+        self.trig = trig
+        self.echo = echo
+        if callable(distances):
+            self._next = distances
+        else:
+            it = itertools.cycle(distances) if isinstance(distances, (list, tuple)) else iter(distances)
+            self._next = lambda: next(it, None)
+        self.window: tuple[float, float] | None = None
+        self.pulses = 0
+
+    def fire(self, t: float) -> tuple[float, float] | None:
+        d = self._next()
+        if d is None or d < 0:
+            self.window = None
+            return None
+        rise = t + _ECHO_START_DELAY_S
+        self.window = (rise, rise + 2.0 * float(d) / _SOUND_CM_PER_S)
+        self.pulses += 1
+        return self.window
+
+
+class _EdgeSource(threading.Thread):
+    """rate_hz 주기로 pin에 짧은 펄스를 만들어 에지 콜백 호출. 예정 대비 실제 발생 지연을 기록."""
+    def __init__(self, gpio: "_SimGPIO", pin: int, rate_hz: float, active_low: bool, count: int | None):
+        super().__init__(daemon=True)
+        self._gpio = gpio
+        self.pin = pin
+        self.period = 1.0 / rate_hz
+        self.active_low = active_low
+        self.count = count
+        self.fired = 0
+        self.lateness: deque = deque(maxlen=4096)
+        self._stop_ev = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_ev.set()
+
+    def run(self) -> None:
+        idle, active = (1, 0) if self.active_low else (0, 1)
+        self._gpio.set_level(self.pin, idle)
+        deadline = time.monotonic() + self.period
+        while not self._stop_ev.is_set() and (self.count is None or self.fired < self.count):
+            remaining = deadline - time.monotonic()
+            if remaining > 0 and self._stop_ev.wait(remaining):
+                break
+            self.lateness.append(time.monotonic() - deadline)
+            self._gpio.set_level(self.pin, active)
+            self._gpio.set_level(self.pin, idle)
+            self.fired += 1
+            deadline += self.period
+
+
+class _SimGPIO:
+    """RPi.GPIO 모듈 호환 시뮬레이터. 핀 레벨은 메모리에만 존재."""
+    BCM = 11
+    BOARD = 10
+    OUT = 0
+    IN = 1
+    LOW = 0
+    HIGH = 1
+    PUD_OFF = 20
+    PUD_DOWN = 21
+    PUD_UP = 22
+    RISING = 31
+    FALLING = 32
+    BOTH = 33
+
+    def __init__(self, pwm_log_size: int = _PWM_LOG_SIZE):
+        self._lock = threading.Lock()
+        self._levels: dict[int, int] = {}
+        self._modes: dict[int, int] = {}
+        self._callbacks: dict[int, tuple[int, object]] = {}
+        self._echo_by_trig: dict[int, _EchoScript] = {}
+        self._echo_by_pin: dict[int, _EchoScript] = {}
+        self._edge_sources: dict[int, _EdgeSource] = {}
+        self.pwm_log: deque = deque(maxlen=pwm_log_size)
+        env_distance = os.environ.get(SIM_DISTANCE_ENV)
+        if env_distance:
+            self.attach_ultrasonic(_BOARD_TRIG, _BOARD_ECHO, lambda: float(env_distance))
+
+    @staticmethod
+    def _channels(channel):
+        return tuple(channel) if isinstance(channel, (list, tuple)) else (channel,)
+
+    # --- 시뮬레이션 제어 ---
+    def attach_ultrasonic(self, trig: int, echo: int, distances) -> None:
+        """distances: 거리(cm) 목록(순환), 이터레이터(소진 시 무응답), 또는 호출마다 거리를 주는 함수."""
+        script = _EchoScript(trig, echo, distances)
+        with self._lock:
+            self._echo_by_trig[trig] = script
+            self._echo_by_pin[echo] = script
+
+    def detach_ultrasonic(self, trig: int) -> None:
+        with self._lock:
+            script = self._echo_by_trig.pop(trig, None)
+            if script is not None:
+                self._echo_by_pin.pop(script.echo, None)
+
+    def add_edge_source(self, pin: int, rate_hz: float, active_low: bool = True, count: int | None = None) -> _EdgeSource:
+        """pin에 rate_hz 펄스 생성 (active_low=True면 HIGH→LOW→HIGH, FALLING 콜백 대상). 반환 객체에 lateness 기록."""
+        self.remove_edge_source(pin)
+        src = _EdgeSource(self, pin, rate_hz, active_low, count)
+        self._edge_sources[pin] = src
+        src.start()
+        return src
+
+    def remove_edge_source(self, pin: int) -> None:
+        src = self._edge_sources.pop(pin, None)
+        if src is not None:
+            src.stop()
+            src.join(timeout=1.0)
+
+    def pwm_events(self, channel: int | None = None, since: float | None = None) -> list[tuple[float, int, float]]:
+        """기록된 (시각, 핀, duty) 목록. channel/since로 거르기."""
+        return [e for e in list(self.pwm_log)
+                if (channel is None or e[1] == channel) and (since is None or e[0] >= since)]
+
+    def clear_pwm_log(self) -> None:
+        self.pwm_log.clear()
+
+    def _record_pwm(self, channel: int, duty: float) -> None:
+        self.pwm_log.append((time.monotonic(), channel, duty))
+
+    def _fire(self, channel: int, prev: int, level: int) -> None:
+        cb = self._callbacks.get(channel)
+        if cb is None or prev == level:
+            return
+        edge, func = cb
+        if func is not None and (edge == self.BOTH or (edge == self.RISING) == (level == self.HIGH)):
+            func(channel)
+
+    def _schedule_echo_edges(self, script: _EchoScript, window: tuple[float, float]) -> None:
+        """ECHO 핀에 이벤트 감지가 걸린 경우에만 타이머로 에지 콜백 발생."""
+        if script.echo not in self._callbacks:
+            return
+        now = time.monotonic()
+        for at, level in ((window[0], self.HIGH), (window[1], self.LOW)):
+            t = threading.Timer(max(0.0, at - now), self._fire, args=(script.echo, 1 - level, level))
+            t.daemon = True
+            t.start()
+
+    # --- RPi.GPIO 호환 ---
+    def PWM(self, channel: int, frequency: float) -> _SimPWM:
+        return _SimPWM(self, channel, frequency)
+
+    def setwarnings(self, flag: bool) -> None:
+        pass
+
+    def setmode(self, mode: int) -> None:
+        pass
+
+    def setup(self, channel, direction: int, pull_up_down: int = PUD_OFF, initial: int = LOW) -> None:
+        with self._lock:
+            for ch in self._channels(channel):
+                self._modes[ch] = direction
+                if direction == self.OUT:
+                    self._levels[ch] = self.HIGH if initial else self.LOW
+                else:
+                    self._levels[ch] = self.HIGH if pull_up_down == self.PUD_UP else self.LOW
+
+    def output(self, channel, value) -> None:
+        channels = self._channels(channel)
+        values = self._channels(value)
+        if len(values) == 1:
+            values = values * len(channels)
+        for ch, v in zip(channels, values):
+            self.set_level(ch, v)
+
+    def input(self, channel: int) -> int:
+        script = self._echo_by_pin.get(channel)
+        if script is not None:
+            w = script.window
+            if w is not None and w[0] <= time.monotonic() < w[1]:
+                return self.HIGH
+            return self.LOW
+        return self._levels.get(channel, self.LOW)
+
+    def set_level(self, channel: int, value) -> None:
+        """핀 레벨 변경. 에지가 생기면 등록된 콜백 호출 (외부 신호 주입용)."""
+        level = self.HIGH if value else self.LOW
+        with self._lock:
+            prev = self._levels.get(channel, self.LOW)
+            self._levels[channel] = level
+            script = self._echo_by_trig.get(channel)
+        if script is not None and prev == self.HIGH and level == self.LOW:
+            window = script.fire(time.monotonic())
+            if window is not None:
+                self._schedule_echo_edges(script, window)
+        self._fire(channel, prev, level)
+
+    def add_event_detect(self, channel: int, edge: int, callback=None, bouncetime: int | None = None) -> None:
+        with self._lock:
+            self._callbacks[channel] = (edge, callback)
+
+    def remove_event_detect(self, channel: int) -> None:
+        with self._lock:
+            if self._callbacks.pop(channel, None) is None:
+                raise RuntimeError(f"GPIO {channel}: 이벤트 감지가 설정되지 않았습니다.")
+
+    def cleanup(self, channel=None) -> None:
+        with self._lock:
+            channels = self._channels(channel) if channel is not None else tuple(self._modes)
+            for ch in channels:
+                self._callbacks.pop(ch, None)
+                self._modes.pop(ch, None)
+                self._levels.pop(ch, None)
@@ -5,8 +5,7 @@ import math
 import threading
 import time
 
-import RPi.GPIO as GPIO
-
+from findee._gpio import GPIO
 from findee._i2c_bus import _I2C_LOCK
 
 _MPU_ADDR = 0x68
@@ -33,6 +32,7 @@ class _IMU:
         self._addr = addr
         self._q = [1.0, 0.0, 0.0, 0.0]
         self._roll = self._pitch = self._yaw = 0.0
+        self._rpy = (0.0, 0.0, 0.0)
         self._gyro_off = (0.0, 0.0, 0.0)
         self._accel_off = (0.0, 0.0, 0.0)
         self._last_ts = None
@@ -180,7 +180,9 @@ class _IMU:
         ax, ay, az = self._lever_arm(ax, ay, az, gx, gy, gz, dt)
         deg2rad = math.pi / 180.0
         self._madgwick(gx*deg2rad, gy*deg2rad, gz*deg2rad, ax, ay, az, dt)
-        self._roll, self._pitch, self._yaw = self._quat_to_euler()
+        # 튜플 한 번 대입으로 갱신해 다른 스레드가 roll/pitch/yaw를 섞어 읽지 않게 함
+        self._rpy = self._quat_to_euler()
+        self._roll, self._pitch, self._yaw = self._rpy
 
     def calibrate(self, samples: int = 500) -> None:
         gx_s = gy_s = gz_s = ax_s = ay_s = az_s = 0.0
@@ -194,4 +196,4 @@ class _IMU:
         self._accel_off = (ax_s/n/_ACCEL_SCALE, ay_s/n/_ACCEL_SCALE, az_s/n/_ACCEL_SCALE - 1.0)
 
     def get_rpy(self):
-        return self._roll, self._pitch, self._yaw
+        return self._rpy
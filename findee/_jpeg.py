@@ -0,0 +1,113 @@
+"""JPEG 인코더 백엔드와 프리셋. PyTurboJPEG가 설치되어 있으면 libjpeg-turbo를 직접 쓰고, 없으면 OpenCV.
+
+PF_JPEG_ENCODER 환경 변수(auto | turbojpeg | opencv)로 강제할 수 있다. 기본 auto.
+프리셋은 품질 외에 크로마 서브샘플링, 흑백, 인코딩 전 축소를 묶는다. 축소/흑백 변환용 중간 버퍼는 스레드별로 재사용한다.
+"""
+from __future__ import annotations
+
+import os
+import threading
+
+import cv2
+import numpy as np
+
+JPEG_ENCODER_ENV = "PF_JPEG_ENCODER"
+JPEG_ENCODERS = ("auto", "turbojpeg", "opencv")
+
+# subsampling: "444" | "422" | "420", scale: 인코딩 전 축소 비율
+JPEG_PRESETS = {
+    "default": {"quality": 70, "subsampling": "420", "gray": False, "scale": 1.0},
+    "quality": {"quality": 90, "subsampling": "444", "gray": False, "scale": 1.0},
+    "fast": {"quality": 60, "subsampling": "420", "gray": False, "scale": 1.0},
+    "preview": {"quality": 55, "subsampling": "420", "gray": False, "scale": 0.5},
+    "gray": {"quality": 70, "subsampling": "420", "gray": True, "scale": 1.0},
+}
+
+_CV2_SAMPLING = {
+    "444": getattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR_444", None),
+    "422": getattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR_422", None),
+    "420": getattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR_420", None),
+}
+
+
+class _JpegEncoder:
+    """encode(image, preset, quality) -> bytes | None. 입력은 BGR(H, W, 3) 또는 흑백(H, W)."""
+    def __init__(self, backend: str = "auto"):
+        if backend not in JPEG_ENCODERS:
+            raise ValueError(f"알 수 없는 JPEG 인코더: {backend} (가능: {', '.join(JPEG_ENCODERS)})")
+        self._tj = None
+        if backend in ("auto", "turbojpeg"):
+            try:
+                import turbojpeg
+                self._tj = turbojpeg.TurboJPEG()
+                self._tj_mod = turbojpeg
+            except Exception:
+                if backend == "turbojpeg":
+                    raise
+        self.backend = "turbojpeg" if self._tj is not None else "opencv"
+        self._local = threading.local()
+
+    def _scratch(self, name: str, shape: tuple, dtype=np.uint8) -> np.ndarray:
+        """스레드별 중간 버퍼. 같은 크기면 재할당하지 않는다."""
+        buf = getattr(self._local, name, None)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype)
+            setattr(self._local, name, buf)
+        return buf
+
+    def _prepare(self, image: np.ndarray, scale: float, gray: bool) -> np.ndarray:
+        if scale != 1.0:
+            h, w = image.shape[:2]
+            size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            dst = self._scratch("scaled", (size[1], size[0]) + image.shape[2:], image.dtype)
+            image = cv2.resize(image, size, dst=dst, interpolation=cv2.INTER_AREA)
+        if gray and image.ndim == 3 and self._tj is None:
+            dst = self._scratch("gray", image.shape[:2])
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=dst)
+        return image
+
+    def encode(self, image: np.ndarray, preset: str = "default", quality: int | None = None) -> bytes | None:
+        spec = JPEG_PRESETS.get(preset)
+        if spec is None:
+            raise ValueError(f"preset must be one of {tuple(JPEG_PRESETS)}")
+        q = int(quality if quality is not None else spec["quality"])
+        img = self._prepare(image, spec["scale"], spec["gray"])
+        if self._tj is not None:
+            return self._encode_tj(img, q, spec)
+        params = [int(cv2.IMWRITE_JPEG_QUALITY), q]
+        sampling = _CV2_SAMPLING.get(spec["subsampling"])
+        if sampling is not None and img.ndim == 3:
+            params += [int(cv2.IMWRITE_JPEG_SAMPLING_FACTOR), int(sampling)]
+        ok, buf = cv2.imencode(".jpg", img, params)
+        return buf.tobytes() if ok else None
+
+    def _encode_tj(self, img: np.ndarray, q: int, spec: dict) -> bytes:
+        tj = self._tj_mod
+        if img.ndim == 2:
+            return self._tj.encode(img[:, :, None], quality=q, pixel_format=tj.TJPF_GRAY, jpeg_subsample=tj.TJSAMP_GRAY)
+        if spec["gray"]:
+            # libjpeg-turbo는 BGR 입력에서 휘도만 인코딩할 수 있어 cvtColor가 필요 없다
+            subsample = tj.TJSAMP_GRAY
+        else:
+            subsample = {"444": tj.TJSAMP_444, "422": tj.TJSAMP_422, "420": tj.TJSAMP_420}[spec["subsampling"]]
+        if not img.flags.c_contiguous:
+            img = np.ascontiguousarray(img)
+        return self._tj.encode(img, quality=q, pixel_format=tj.TJPF_BGR, jpeg_subsample=subsample)
+
+
+_encoder_lock = threading.Lock()
+_encoder: _JpegEncoder | None = None
+
+
+def get_encoder() -> _JpegEncoder:
+    """프로세스 공용 인코더 (PF_JPEG_ENCODER 기준으로 처음 한 번 생성)."""
+    global _encoder
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                _encoder = _JpegEncoder((os.environ.get(JPEG_ENCODER_ENV) or "auto").strip().lower())
+    return _encoder
+
+
+def encode_jpeg(image: np.ndarray, quality: int | None = None, preset: str = "default") -> bytes | None:
+    return get_encoder().encode(image, preset, quality)
@@ -0,0 +1,94 @@
+"""프레임별 JPEG 인코딩 결과 캐시. 같은 프레임·같은 품질을 여러 소비자(MJPEG, emit_image, AP 미리보기)가 요청하면 한 번만 인코딩."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from findee._frame import _Frame
+
+_DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+
+
+def frame_key(frame) -> tuple | None:
+    """캐시 키로 쓸 수 있는 프레임이면 (seq, timestamp, shape), 아니면 None.
+
+    읽기 전용 카메라 프레임(FrameRef.array)만 대상. 쓰기 가능한 배열은 사용자가 그림을 그렸을 수 있어 캐시하지 않는다.
+    슬라이스처럼 메타데이터가 없는 프레임(seq None)도 대상이 아니다.
+    """
+    if not isinstance(frame, _Frame) or frame.seq is None or frame.seq <= 0 or frame.flags.writeable:
+        return None
+    return frame.seq, frame.timestamp, frame.shape
+
+
+class _JpegCache:
+    """(프레임 키, 인코딩 파라미터) -> JPEG bytes LRU. 총 바이트가 max_bytes를 넘으면 오래된 것부터 버린다."""
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, bytes] = OrderedDict()
+        self._bytes = 0
+        # 인코딩 중인 키 -> 완료 이벤트. 같은 프레임을 동시에 요청한 소비자는 먼저 시작한 인코딩을 기다린다
+        self._inflight: dict[tuple, threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_encode(self, key: tuple, encode: Callable[[], bytes | None]) -> bytes | None:
+        """key가 있으면 저장된 bytes, 없으면 encode() 결과를 저장 후 반환. 인코딩은 잠금 밖에서 한다.
+
+        다른 스레드가 같은 key를 인코딩 중이면 그 결과를 기다려 쓴다 (적중으로 집계). 그 인코딩이 실패했으면 직접 인코딩.
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            pending = self._inflight.get(key) if data is None else None
+        if pending is not None:
+            pending.wait()
+            with self._lock:
+                data = self._entries.get(key)
+        with self._lock:
+            if data is not None:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+            done = self._inflight.get(key)
+            owner = done is None
+            if owner:
+                done = self._inflight[key] = threading.Event()
+        data = None
+        try:
+            data = encode()
+        finally:
+            with self._lock:
+                if owner:
+                    del self._inflight[key]
+                if data is not None and len(data) <= self.max_bytes and key not in self._entries:
+                    self._entries[key] = data
+                    self._bytes += len(data)
+                while self._bytes > self.max_bytes:
+                    _, old = self._entries.popitem(last=False)
+                    self._bytes -= len(old)
+                    self.evictions += 1
+            if owner:
+                done.set()
+        return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
@@ -0,0 +1,87 @@
+"""라인 트레이싱용 스캔라인 중심 계산: 프레임 전체가 아니라 몇 개의 가로 띠(band)만 이진화한다.
+
+띠들을 한 배열로 모아(n, band_h, W) 한 번에 변환/이진화하고, 열 합(n, W)에 x 좌표를 곱해 띠별 중심과 폭을 벡터 연산으로 구한다.
+찾은 띠 중심들을 직선으로 맞춰 각도를, 가장 아래(로봇에 가까운) 띠 중심으로 좌우 오프셋을 낸다.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+DEFAULT_BANDS = (0.55, 0.7, 0.85, 0.95)
+
+
+@dataclass
+class LineResult:
+    """offset: 가장 아래 띠 중심의 좌우 위치 (-1 왼쪽 끝 ~ 0 가운데 ~ 1 오른쪽 끝), offset_px: 가운데 기준 픽셀.
+    angle: 선이 앞으로 갈수록 오른쪽으로 기울면 +, 왼쪽이면 - (도). 띠가 2개 이상 잡혀야 계산.
+    bands: 띠별 (y, 중심 x 또는 None, 폭 px)."""
+    found: bool
+    offset: float = 0.0
+    offset_px: float = 0.0
+    angle: float | None = None
+    bands: list[tuple[int, float | None, float]] = field(default_factory=list)
+
+
+@lru_cache(maxsize=16)
+def _rows(height: int, bands: tuple, band_height: int) -> np.ndarray:
+    """띠 중심(0~1 비율 또는 픽셀 y) -> (n, band_height) 행 인덱스. 설정이 같으면 재사용."""
+    centers = [int(b * (height - 1)) if isinstance(b, float) and b <= 1.0 else int(b) for b in bands]
+    half = band_height // 2
+    starts = np.clip(np.array(centers) - half, 0, max(0, height - band_height))
+    return starts[:, None] + np.arange(band_height)[None, :]
+
+
+def follow_line(frame: np.ndarray, bands=DEFAULT_BANDS, band_height: int = 6, color=None,
+                threshold: int | None = None, dark: bool = True, min_width: int = 4) -> LineResult:
+    """frame: BGR. color(HSV 범위 6개)를 주면 그 색, 아니면 gray 밝기로 선을 찾는다.
+
+    밝기 모드: threshold가 None이면 띠 픽셀로 Otsu 임계값을 구하고, dark=True면 임계값보다 어두운 쪽이 선.
+    min_width: 띠 평균 폭이 이보다 좁으면 잡음으로 보고 그 띠는 선이 없는 것으로 둔다.
+    화면 폭의 1/3보다 넓게 잡힌 띠도 버린다 (선이 없을 때 Otsu가 바닥 질감을 둘로 나눈 경우).
+    """
+    h, w = frame.shape[:2]
+    rows = _rows(h, tuple(bands), max(1, int(band_height)))
+    n, bh = rows.shape
+    strip = frame[rows.reshape(-1)]  # (n*bh, W, C) 띠만 복사
+    if color is not None:
+        lo = (int(color[0]), int(color[2]), int(color[4]))
+        hi = (int(color[1]), int(color[3]), int(color[5]))
+        mask = cv2.inRange(cv2.cvtColor(strip, cv2.COLOR_BGR2HSV), lo, hi)
+        cv2.threshold(mask, 0, 1, cv2.THRESH_BINARY, dst=mask)
+    else:
+        gray = strip if strip.ndim == 2 else cv2.cvtColor(strip, cv2.COLOR_BGR2GRAY)
+        mode = cv2.THRESH_BINARY_INV if dark else cv2.THRESH_BINARY
+        if threshold is None:
+            _, mask = cv2.threshold(gray, 0, 1, mode | cv2.THRESH_OTSU)
+        else:
+            _, mask = cv2.threshold(gray, int(threshold), 1, mode)
+    cols = mask.reshape(n, bh, w).sum(axis=1, dtype=np.int32)  # (n, W) 열별 선 픽셀 수 (마스크는 0/1)
+    mass = cols.sum(axis=1)
+    cx = np.divide(cols @ np.arange(w, dtype=np.float64), mass, out=np.zeros(n), where=mass > 0)
+    width = mass / float(bh)
+    ys = rows[:, bh // 2]
+    ok = (width >= min_width) & (width <= w / 3.0)
+    found = [(int(y), float(c), float(wd)) for y, c, wd, good in zip(ys, cx, width, ok) if good]
+    result = LineResult(found=bool(found),
+                        bands=[(int(y), float(c) if good else None, float(wd))
+                               for y, c, wd, good in zip(ys, cx, width, ok)])
+    if not found:
+        return result
+    y_bottom, x_bottom, _ = max(found)
+    half_w = (w - 1) / 2.0
+    result.offset_px = x_bottom - half_w
+    result.offset = result.offset_px / half_w
+    if len(found) >= 2:
+        # 띠 몇 개뿐이라 polyfit 대신 최소제곱 기울기(dx/dy, y는 아래로 증가)를 직접 계산
+        my = sum(f[0] for f in found) / len(found)
+        mx = sum(f[1] for f in found) / len(found)
+        var = sum((f[0] - my) ** 2 for f in found)
+        if var > 0:
+            slope = sum((f[0] - my) * (f[1] - mx) for f in found) / var
+            result.angle = -math.degrees(math.atan(slope))
+    return result
@@ -0,0 +1,89 @@
+"""지연/주기 측정용 고정 구간 히스토그램. 스케줄러·제어 루프·카메라 경로가 공용으로 사용."""
+from __future__ import annotations
+
+import bisect
+import threading
+
+# ms 단위 구간 상한. 마지막 구간은 그 이상 전부.
+_DEFAULT_BOUNDS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 250.0)
+
+
+class _LatencyHistogram:
+    """초 단위 표본을 ms 구간별로 센다. record()는 O(log 구간 수)이고 표본을 보관하지 않는다."""
+    def __init__(self, bounds_ms: tuple[float, ...] = _DEFAULT_BOUNDS_MS):
+        self._bounds = tuple(bounds_ms)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self._bounds) + 1)
+            self._n = 0
+            self._sum = 0.0
+            self._min = None
+            self._max = None
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        with self._lock:
+            self._counts[bisect.bisect_left(self._bounds, ms)] += 1
+            self._n += 1
+            self._sum += ms
+            if self._min is None or ms < self._min:
+                self._min = ms
+            if self._max is None or ms > self._max:
+                self._max = ms
+
+    @property
+    def count(self) -> int:
+        return self._n
+
+    def _percentile(self, p: float) -> float:
+        """구간 상한 기준 근사 백분위 (마지막 구간은 max)."""
+        target = p / 100.0 * self._n
+        acc = 0
+        for i, c in enumerate(self._counts):
+            acc += c
+            if acc >= target and c:
+                return min(self._bounds[i], self._max) if i < len(self._bounds) else self._max
+        return self._max or 0.0
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            if self._n == 0:
+                return {"count": 0}
+            labels = [f"<={b:g}ms" for b in self._bounds] + [f">{self._bounds[-1]:g}ms"]
+            return {
+                "count": self._n,
+                "mean_ms": round(self._sum / self._n, 3),
+                "min_ms": round(self._min, 3),
+                "max_ms": round(self._max, 3),
+                "p50_ms": round(self._percentile(50), 3),
+                "p95_ms": round(self._percentile(95), 3),
+                "p99_ms": round(self._percentile(99), 3),
+                "buckets": {k: c for k, c in zip(labels, self._counts) if c},
+            }
+
+
+FRAME_STAGES = ("capture", "process", "encode", "queue", "send", "total")
+
+
+class _StageTracer:
+    """단계별 지연 히스토그램 묶음. 프레임 경로(노출 -> 링 -> 사용자 처리 -> 인코딩 -> 전송 대기 -> 전송)에 사용."""
+    def __init__(self, stages: tuple[str, ...] = FRAME_STAGES):
+        self.stages = {name: _LatencyHistogram() for name in stages}
+
+    def record(self, stage: str, seconds: float) -> None:
+        if seconds >= 0.0:
+            self.stages[stage].record(seconds)
+
+    def reset(self) -> None:
+        for hist in self.stages.values():
+            hist.reset()
+
+    def to_dict(self) -> dict:
+        return {name: hist.to_dict() for name, hist in self.stages.items()}
+
+
+# 프로세스 공용: 카메라가 capture, emit_image 경로가 process/encode/queue/send/total을 기록
+frame_trace = _StageTracer()
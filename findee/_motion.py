@@ -0,0 +1,177 @@
+"""비동기 시간 제한 이동: 타이머 스레드 하나가 예정 시각에 정지/다음 이동을 실행. _MotorUltrasonic에서 사용."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from findee._metrics import _LatencyHistogram
+
+# 예정 시각 직전 이 구간은 Condition.wait 대신 짧게 양보하며 대기 (wait 해상도 보정)
+_SPIN_S = 0.002
+
+
+class MotionHandle:
+    """move_*(..., wait=False)가 반환하는 핸들. cancel / wait / done 지원."""
+    def __init__(self, scheduler: "_MotionScheduler", start_fn: Callable[[], None], duration: float):
+        self._scheduler = scheduler
+        self._start_fn = start_fn
+        self.duration = duration
+        self.deadline: float | None = None
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.cancelled = False
+        self._done = threading.Event()
+
+    @property
+    def latency(self) -> float | None:
+        """예정 종료 대비 실제 종료 지연(초). 아직 안 끝났거나 취소되면 None."""
+        if self.finished_at is None or self.deadline is None or self.cancelled:
+            return None
+        return self.finished_at - self.deadline
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """이동이 끝날(또는 취소될) 때까지 대기. 끝났으면 True."""
+        return self._done.wait(timeout)
+
+    def cancel(self) -> bool:
+        """실행 중이면 즉시 정지(대기열 다음 이동이 있으면 그것 시작), 대기 중이면 대기열에서 제거."""
+        return self._scheduler.cancel(self)
+
+    def __repr__(self) -> str:
+        state = "cancelled" if self.cancelled else ("done" if self.done() else ("running" if self.started_at else "queued"))
+        return f"<MotionHandle {state} duration={self.duration}>"
+
+
+class _MotionScheduler:
+    """시간 제한 이동의 대기열과 종료 타이머. 모든 시각은 time.monotonic 기준."""
+    def __init__(self, stop_fn: Callable[[], None]):
+        self._stop_fn = stop_fn
+        self._cond = threading.Condition()
+        self._active: MotionHandle | None = None
+        self._queue: deque[MotionHandle] = deque()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.latency = _LatencyHistogram()
+
+    def submit(self, start_fn: Callable[[], None], duration: float, queue: bool = False) -> MotionHandle:
+        """이동 예약. queue=False면 진행/대기 중인 이동을 대체(정지 없이)하고 바로 시작."""
+        if duration < 0.0:
+            raise ValueError("Duration must be greater or equal to 0.0")
+        handle = MotionHandle(self, start_fn, duration)
+        with self._cond:
+            dropped = [] if queue else self._detach_all_locked()
+            self._queue.append(handle)
+            if self._active is None:
+                self._advance_locked(stop_if_idle=False)
+            # 대체된 이동은 새 이동이 모터에 적용된 뒤 완료 처리
+            for old in dropped:
+                self._finish_locked(old, cancelled=True)
+            self._ensure_thread_locked()
+            self._cond.notify()
+        return handle
+
+    def cancel(self, handle: MotionHandle) -> bool:
+        with self._cond:
+            if handle is self._active:
+                # 모터를 먼저 세우고(또는 다음 이동으로 넘기고) 나서 완료를 알린다
+                self._active = None
+                self._advance_locked(stop_if_idle=True)
+                self._finish_locked(handle, cancelled=True)
+            elif handle in self._queue:
+                self._queue.remove(handle)
+                self._finish_locked(handle, cancelled=True)
+            else:
+                return False
+            self._cond.notify()
+        return True
+
+    def cancel_all(self, stop_fn: Callable[[], None] | None = None) -> None:
+        """예약된 이동을 모두 버린다. stop_fn(모터 정지/브레이크)을 주면 그것을 먼저 실행한 뒤 핸들을 완료 처리하므로,
+        handle.wait()가 돌아왔을 때는 모터가 이미 멈춰 있다. stop_fn이 없으면 정지는 호출자 몫."""
+        with self._cond:
+            dropped = self._detach_all_locked()
+            self._cond.notify()
+        try:
+            if stop_fn is not None:
+                stop_fn()
+        finally:
+            with self._cond:
+                for handle in dropped:
+                    self._finish_locked(handle, cancelled=True)
+
+    def close(self) -> None:
+        with self._cond:
+            self._drop_all_locked()
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _drop_all_locked(self) -> None:
+        for handle in self._detach_all_locked():
+            self._finish_locked(handle, cancelled=True)
+
+    def _detach_all_locked(self) -> list[MotionHandle]:
+        """진행/대기 중인 이동을 스케줄러에서 떼어 낸다 (완료 신호는 아직 보내지 않음)."""
+        handles = [] if self._active is None else [self._active]
+        handles.extend(self._queue)
+        self._active = None
+        self._queue.clear()
+        return handles
+
+    def _finish_locked(self, handle: MotionHandle, cancelled: bool) -> None:
+        handle.cancelled = cancelled
+        handle.finished_at = time.monotonic()
+        if handle is self._active:
+            self._active = None
+        handle._done.set()
+
+    def _advance_locked(self, stop_if_idle: bool) -> None:
+        """대기열에서 다음 이동 시작. duration 0인 이동은 시작만 하고 곧바로 완료 처리."""
+        while self._queue:
+            handle = self._queue.popleft()
+            handle._start_fn()
+            handle.started_at = time.monotonic()
+            if handle.duration > 0.0:
+                handle.deadline = handle.started_at + handle.duration
+                self._active = handle
+                return
+            self._finish_locked(handle, cancelled=False)
+            stop_if_idle = False
+        if stop_if_idle:
+            self._stop_fn()
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._closed = False
+            self._thread = threading.Thread(target=self._timer_loop, daemon=True)
+            self._thread.start()
+
+    def _timer_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._active is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                handle = self._active
+                remaining = handle.deadline - time.monotonic()
+                if remaining > _SPIN_S:
+                    self._cond.wait(remaining - _SPIN_S)
+                    continue
+            while time.monotonic() < handle.deadline:
+                time.sleep(0)
+            with self._cond:
+                if handle is not self._active:
+                    continue
+                # 정지/다음 이동을 먼저 적용하고 완료를 알린다 (finished_at도 그 시각 기준)
+                self._active = None
+                self._advance_locked(stop_if_idle=True)
+                self._finish_locked(handle, cancelled=False)
+                self.latency.record(handle.finished_at - handle.deadline)
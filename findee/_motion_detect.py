@@ -0,0 +1,123 @@
+"""저해상도 움직임 감지: 프레임을 폭 width(기본 80px) gray로 줄여 누적 평균 배경과 비교한다.
+
+배경은 cv2.accumulateWeighted로 매 프레임 alpha만큼 갱신하므로 조명이 천천히 바뀌거나 물체가 멈춰 있으면 배경에 흡수된다.
+80x60이면 VGA 원본 대비 픽셀 수가 1/64라 다른 비전 처리 옆에서 매 프레임 돌려도 부담이 거의 없다.
+moving은 마지막 움직임 이후 hold 프레임 동안 유지되므로, 무거운 검출을 켜고 끄는 트리거로 쓸 수 있다.
+
+로봇이 직접 움직이면 화면 전체가 바뀌므로 주행 중에는 score가 크게 나온다. 멈춘 뒤 reset()으로 배경을 새로 잡는다.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from findee._frame import _Frame
+from findee._metrics import _LatencyHistogram
+
+_KERNEL = np.ones((3, 3), np.uint8)
+
+
+@dataclass
+class MotionResult:
+    """score: 작은 프레임에서 배경과 달라진 픽셀 비율(0~1). regions: 바뀐 영역 (x, y, w, h) 원본 좌표, 큰 순.
+    moving: score가 trigger 이상이었던 마지막 프레임 이후 hold 프레임 이내면 True."""
+    moving: bool
+    score: float
+    regions: list[tuple[int, int, int, int]] = field(default_factory=list)
+    seq: int | None = None
+
+
+def _shrink(image: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    """목표 크기의 약 2배까지는 행/열 건너뛰기(복사 없음)로, 나머지는 INTER_AREA 평균으로 줄인다.
+    VGA 전체를 INTER_AREA로 80x60까지 줄이는 비용이 비교 자체보다 커서 원본 픽셀을 다 읽지 않는다."""
+    step = max(1, min(image.shape[1] // size[0], image.shape[0] // size[1]) // 2)
+    if step > 1:
+        image = image[::step, ::step]
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def _small_gray(frame: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    """원본 gray가 이미 계산돼 있으면 그걸 줄이고, 아니면 BGR을 먼저 줄인 뒤 gray로 (변환 픽셀 수를 줄임)."""
+    if frame.ndim == 2:
+        return _shrink(frame, size)
+    if isinstance(frame, _Frame) and frame.derivable and "gray" in frame._derived:
+        return _shrink(frame.gray, size)
+    return cv2.cvtColor(_shrink(frame, size), cv2.COLOR_BGR2GRAY)
+
+
+class _MotionDetector:
+    """width: 비교 해상도(폭, 높이는 비율 유지). alpha: 배경 학습률(0~1, 클수록 빨리 흡수).
+    threshold: 배경과 밝기 차가 이보다 크면 바뀐 픽셀. min_area: 작은 프레임 기준 최소 영역 픽셀 수.
+    trigger: moving으로 볼 score 하한. hold: 움직임이 멎은 뒤 moving을 유지할 프레임 수.
+    """
+    def __init__(self, width: int = 80, alpha: float = 0.05, threshold: int = 25, min_area: int = 4,
+                 trigger: float = 0.01, hold: int = 5):
+        if width < 8:
+            raise ValueError("width는 8 이상이어야 합니다.")
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha는 0보다 크고 1 이하여야 합니다.")
+        self.width = int(width)
+        self.alpha = float(alpha)
+        self.threshold = int(threshold)
+        self.min_area = max(1, int(min_area))
+        self.trigger = float(trigger)
+        self.hold = max(0, int(hold))
+        self._bg: np.ndarray | None = None
+        self._shape: tuple[int, int] | None = None
+        self._since_motion: int | None = None
+        self.frames = 0
+        self.triggered = 0
+        self.update_hist = _LatencyHistogram()
+
+    def reset(self) -> None:
+        """배경을 버린다 (다음 update 프레임이 새 배경)."""
+        self._bg = None
+        self._since_motion = None
+
+    def update(self, frame: np.ndarray) -> MotionResult:
+        """프레임 하나로 배경과 비교하고 배경을 갱신한다. 첫 프레임(또는 해상도가 바뀐 프레임)은 배경으로만 쓴다."""
+        t0 = time.monotonic()
+        self.frames += 1
+        seq = getattr(frame, "seq", None)
+        h, w = frame.shape[:2]
+        size = (self.width, max(1, round(self.width * h / w)))
+        small = cv2.GaussianBlur(_small_gray(frame, size), (3, 3), 0)
+        if self._bg is None or self._shape != (h, w):
+            self._bg = small.astype(np.float32)
+            self._shape = (h, w)
+            self._since_motion = None
+            self.update_hist.record(time.monotonic() - t0)
+            return MotionResult(False, 0.0, [], seq)
+        diff = cv2.absdiff(small, cv2.convertScaleAbs(self._bg))
+        _, mask = cv2.threshold(diff, self.threshold, 255, cv2.THRESH_BINARY)
+        cv2.accumulateWeighted(small, self._bg, self.alpha)
+        changed = cv2.countNonZero(mask)
+        score = changed / float(mask.size)
+        regions = []
+        if changed >= self.min_area:
+            mask = cv2.dilate(mask, _KERNEL)
+            n, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+            sx, sy = w / float(size[0]), h / float(size[1])
+            for x, y, bw, bh, area in sorted(stats[1:], key=lambda s: -s[4]):
+                if area >= self.min_area:
+                    regions.append((int(x * sx), int(y * sy), int(np.ceil(bw * sx)), int(np.ceil(bh * sy))))
+        if score >= self.trigger and regions:
+            self._since_motion = 0
+            self.triggered += 1
+        elif self._since_motion is not None:
+            self._since_motion += 1
+        moving = self._since_motion is not None and self._since_motion <= self.hold
+        self.update_hist.record(time.monotonic() - t0)
+        return MotionResult(moving, score, regions, seq)
+
+    def get_stats(self) -> dict:
+        """처리 프레임 수, trigger를 넘은 프레임 수, update 소요 히스토그램."""
+        return {
+            "frames": self.frames,
+            "triggered": self.triggered,
+            "size": (self.width, round(self.width * self._shape[0] / self._shape[1])) if self._shape else None,
+            "update": self.update_hist.to_dict(),
+        }
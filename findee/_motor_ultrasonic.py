@@ -1,10 +1,12 @@
-"""DRV8833 모터 + 초음파 거리센서. GPIO/PWM 제어."""
+"""DRV8833 모터 + 초음파 거리센서. GPIO/PWM 제어 (백엔드는 findee._gpio에서 선택)."""
 from __future__ import annotations
 
 import gc
 import time
 
-import RPi.GPIO as GPIO
+from findee._gpio import GPIO
+from findee._motion import MotionHandle, _MotionScheduler
+from findee._ramp import _MotorRamp
 
 USE_DEBUG = False
 
@@ -37,6 +39,8 @@ class _MotorUltrasonic:
         self._pwm_ain2 = None
         self._pwm_bin1 = None
         self._pwm_bin2 = None
+        self._motion = _MotionScheduler(lambda: self.control_motors(0.0, 0.0))
+        self._ramp: _MotorRamp | None = None
 
     @staticmethod
     def constrain(value, min_value, max_value):
@@ -84,69 +88,133 @@ class _MotorUltrasonic:
                 pwm1.ChangeDutyCycle(100 - duty)
                 pwm2.ChangeDutyCycle(duty)
 
+    def _normalize(self, s: float) -> float:
+        return (1 if s >= 0 else -1) * self.constrain(abs(s), 20, 100) if s != 0.0 else 0.0
+
     def control_motors(self, left: float, right: float, decay: str = "slow") -> None:
         if self._pwm_ain1 is None or self._pwm_bin1 is None:
             return
-        def normalize(s: float) -> float:
-            return (1 if s >= 0 else -1) * self.constrain(abs(s), 20, 100) if s != 0.0 else 0.0
-        self._set_channel(normalize(right), self._pwm_ain1, self._pwm_ain2, decay)
-        self._set_channel(normalize(left), self._pwm_bin1, self._pwm_bin2, decay)
+        if self._ramp is not None:
+            self._ramp.set_target(self._normalize(left), self._normalize(right), decay)
+            return
+        self._apply_motors(left, right, decay)
+
+    def _apply_motors(self, left: float, right: float, decay: str = "slow") -> None:
+        if self._pwm_ain1 is None or self._pwm_bin1 is None:
+            return
+        self._set_channel(self._normalize(right), self._pwm_ain1, self._pwm_ain2, decay)
+        self._set_channel(self._normalize(left), self._pwm_bin1, self._pwm_bin2, decay)
+
+    def set_ramp(self, enabled: bool = True, accel: float = 400.0, decel: float = 800.0, rate_hz: float = 100.0) -> None:
+        """램프 모드. 켜면 control_motors는 목표만 기록하고, rate_hz 제어 스레드가 accel/decel(%/s) 한도로 duty를 옮긴다."""
+        if not enabled:
+            if self._ramp is not None:
+                ramp, self._ramp = self._ramp, None
+                ramp.stop()
+                # 램프 도중 끄면 마지막 목표로 바로 맞춘다
+                self._apply_motors(*ramp.get_target())
+            return
+        if self._ramp is None:
+            ramp = _MotorRamp(self._apply_motors, rate_hz, accel, decel)
+            ramp.start()
+            self._ramp = ramp
+        else:
+            self._ramp.configure(rate_hz, accel, decel)
+
+    def get_ramp_stats(self) -> dict:
+        """램프 틱 수, 늦은/건너뛴 틱, 지연 히스토그램. 램프 꺼져 있으면 빈 dict."""
+        return self._ramp.get_stats() if self._ramp is not None else {}
 
     @_debug_decorator
     def stop(self) -> None:
+        # 모터를 세운 뒤에 취소된 핸들의 wait()가 돌아오도록 정지를 cancel_all 안에서 실행
+        self._motion.cancel_all(self._halt)
+
+    def _halt(self) -> None:
         if self._pwm_ain1 is None:
             return
         self.control_motors(0.0, 0.0)
 
     @_debug_decorator
     def force_stop(self) -> None:
+        self._motion.cancel_all(self._brake)
+
+    def _brake(self) -> None:
         if self._pwm_ain1 is None:
             return
-        self._pwm_ain1.ChangeDutyCycle(100)
-        self._pwm_ain2.ChangeDutyCycle(100)
-        self._pwm_bin1.ChangeDutyCycle(100)
-        self._pwm_bin2.ChangeDutyCycle(100)
-        time.sleep(0.5)
-        self._pwm_ain1.ChangeDutyCycle(0)
-        self._pwm_ain2.ChangeDutyCycle(0)
-        self._pwm_bin1.ChangeDutyCycle(0)
-        self._pwm_bin2.ChangeDutyCycle(0)
+        # 램프 스레드가 브레이크 duty를 이전 목표로 덮어쓰지 않도록 먼저 멈추고, duty가 0이 된 뒤 재개
+        ramp = self._ramp
+        if ramp is not None:
+            ramp.pause()
+        try:
+            self._pwm_ain1.ChangeDutyCycle(100)
+            self._pwm_ain2.ChangeDutyCycle(100)
+            self._pwm_bin1.ChangeDutyCycle(100)
+            self._pwm_bin2.ChangeDutyCycle(100)
+            time.sleep(0.5)
+            self._pwm_ain1.ChangeDutyCycle(0)
+            self._pwm_ain2.ChangeDutyCycle(0)
+            self._pwm_bin1.ChangeDutyCycle(0)
+            self._pwm_bin2.ChangeDutyCycle(0)
+        finally:
+            if ramp is not None:
+                ramp.resume()
 
     @_debug_decorator
-    def move_forward(self, speed: float = None, duration: float = 0.0) -> None:
+    def move_forward(self, speed: float = None, duration: float = 0.0,
+                    wait: bool = True, queue: bool = False) -> MotionHandle | None:
         s = speed if speed is not None else self.default_speed
-        self.control_motors(s, s)
-        self._duration_check(duration)
+        return self._move(s, s, duration, wait, queue)
 
     @_debug_decorator
-    def move_backward(self, speed: float = None, duration: float = 0.0) -> None:
+    def move_backward(self, speed: float = None, duration: float = 0.0,
+                     wait: bool = True, queue: bool = False) -> MotionHandle | None:
         s = speed if speed is not None else self.default_speed
-        self.control_motors(-s, -s)
-        self._duration_check(duration)
+        return self._move(-s, -s, duration, wait, queue)
 
     @_debug_decorator
-    def turn_left(self, speed: float = None, duration: float = 0.0) -> None:
+    def turn_left(self, speed: float = None, duration: float = 0.0,
+                 wait: bool = True, queue: bool = False) -> MotionHandle | None:
         s = speed if speed is not None else self.default_speed
-        self.control_motors(-s, s)
-        self._duration_check(duration)
+        return self._move(-s, s, duration, wait, queue)
 
     @_debug_decorator
-    def turn_right(self, speed: float = None, duration: float = 0.0) -> None:
+    def turn_right(self, speed: float = None, duration: float = 0.0,
+                  wait: bool = True, queue: bool = False) -> MotionHandle | None:
         s = speed if speed is not None else self.default_speed
-        self.control_motors(s, -s)
-        self._duration_check(duration)
+        return self._move(s, -s, duration, wait, queue)
 
     @_debug_decorator
-    def curve_left(self, speed: float = None, ratio: float = 0.5, duration: float = 0.0) -> None:
+    def curve_left(self, speed: float = None, ratio: float = 0.5, duration: float = 0.0,
+                  wait: bool = True, queue: bool = False) -> MotionHandle | None:
         s = speed if speed is not None else self.default_speed
-        self.control_motors(s * ratio, s)
-        self._duration_check(duration)
+        return self._move(s * ratio, s, duration, wait, queue)
 
     @_debug_decorator
-    def curve_right(self, speed: float = None, ratio: float = 0.5, duration: float = 0.0) -> None:
+    def curve_right(self, speed: float = None, ratio: float = 0.5, duration: float = 0.0,
+                   wait: bool = True, queue: bool = False) -> MotionHandle | None:
         s = speed if speed is not None else self.default_speed
-        self.control_motors(s, s * ratio)
-        self._duration_check(duration)
+        return self._move(s, s * ratio, duration, wait, queue)
+
+    def _move(self, left: float, right: float, duration: float, wait: bool, queue: bool) -> MotionHandle | None:
+        """wait=True(기본)는 기존처럼 duration 동안 블로킹. wait=False 또는 queue=True면 타이머 스레드가
+        종료를 처리하고 MotionHandle 반환 (queue=True는 앞선 이동이 끝난 뒤 이어서 실행)."""
+        if wait and not queue:
+            self._motion.cancel_all(lambda: self.control_motors(left, right))
+            self._duration_check(duration)
+            return None
+        handle = self._motion.submit(lambda: self.control_motors(left, right), duration, queue=queue)
+        if wait:
+            handle.wait()
+        return handle
+
+    def cancel_motions(self) -> None:
+        """예약된 비동기 이동을 정지 없이 모두 취소 (직접 control_motors 호출 전에 사용)."""
+        self._motion.cancel_all()
+
+    def get_motion_stats(self) -> dict:
+        """비동기 이동 종료 지연(예정 시각 대비) 히스토그램."""
+        return self._motion.latency.to_dict()
 
     def _duration_check(self, duration: float) -> None:
         if duration < 0.0:
@@ -173,6 +241,8 @@ class _MotorUltrasonic:
         return round(distance, 1)
 
     def cleanup(self) -> None:
+        self._motion.close()
+        self.set_ramp(False)
         self.control_motors(0.0, 0.0)
         for p in ('_pwm_ain1', '_pwm_ain2', '_pwm_bin1', '_pwm_bin2'):
             pwm = getattr(self, p, None)
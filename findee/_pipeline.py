@@ -0,0 +1,273 @@
+"""비전 파이프라인: 캡처 -> 변환 -> 검출 -> 전송 같은 단계를 선언하고 단계마다 워커 스레드(또는 프로세스 풀)에서 실행.
+
+단계 사이 큐는 1칸(newest-wins)이라 뒤 단계가 밀리면 대기 중인 이전 항목을 새 항목이 대체한다 (dropped로 집계).
+한 단계에 워커가 여럿이면 결과 순서가 뒤바뀔 수 있는데, 이미 더 새 프레임을 넘긴 뒤 끝난 결과는 버린다 (stale로 집계).
+OpenCV/numpy 연산은 GIL을 놓으므로 스레드 단계만으로도 여러 코어를 쓴다. 순수 파이썬 계산이 많은 단계는 processes=N으로
+프로세스 풀에서 실행한다 (입력/출력은 pickle로 복사).
+
+프로세스 풀은 fork가 아니라 forkserver(없으면 spawn)로 만든다. 이 프로세스에는 이미 캡처/인코더/GPIO/소켓 스레드가 돌고 있어서
+fork하면 그 순간 다른 스레드가 잡고 있던 잠금(logging, OpenCV 스레드 풀 등)이 자식에서 영영 풀리지 않을 수 있다.
+그 대신 단계 함수는 import 가능한 모듈의 최상위 함수(또는 그 functools.partial)여야 한다. lambda, 함수 안에서 정의한 함수,
+exec로 실행한 사용자 코드 안의 함수는 자식 프로세스가 찾을 수 없으므로 stage()에서 ValueError를 낸다.
+
+    pipe = findee.create_pipeline()
+    pipe.stage("convert", lambda f: f.hsv)
+    pipe.stage("detect", detect, workers=2)
+    pipe.stage("emit", lambda r: emit_image(r, "imageWidget"))
+    pipe.start()
+"""
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+from findee._metrics import _LatencyHistogram
+
+_SOURCE_TIMEOUT_S = 0.5
+_CLOSED = object()
+
+# 멀티스레드 프로세스에서 fork하지 않는다 (모듈 docstring 참고)
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class _Slot:
+    """newest-wins 1칸 큐. put은 막히지 않고, 대기 중인 항목이 있으면 버리고 True(드롭)를 반환."""
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._item = None
+        self._closed = False
+
+    def put(self, item) -> bool:
+        with self._cond:
+            dropped = self._item is not None
+            self._item = item
+            self._cond.notify()
+            return dropped
+
+    def get(self):
+        with self._cond:
+            while self._item is None and not self._closed:
+                self._cond.wait()
+            if self._item is None:
+                return _CLOSED
+            item, self._item = self._item, None
+            return item
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class _Stage:
+    def __init__(self, name: str, fn: Callable, workers: int, processes: int):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, processes or workers)
+        self.processes = processes
+        self.slot = _Slot()
+        self.pool: ProcessPoolExecutor | None = None
+        self.lock = threading.Lock()
+        self.last_out_seq = 0
+        self.processed = 0
+        self.dropped = 0
+        self.filtered = 0
+        self.failed = 0
+        self.stale = 0
+        self.last_error: str | None = None
+        self.first_at: float | None = None
+        self.last_at: float | None = None
+        self.busy = _LatencyHistogram()
+        self.latency = _LatencyHistogram()
+
+    def call(self, value):
+        if self.pool is not None:
+            return self.pool.submit(self.fn, value).result()
+        return self.fn(value)
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            span = (self.last_at - self.first_at) if self.first_at is not None else 0.0
+            return {
+                "workers": self.workers,
+                "processes": self.processes,
+                "processed": self.processed,
+                "dropped": self.dropped,
+                "filtered": self.filtered,
+                "failed": self.failed,
+                "stale": self.stale,
+                "fps": round((self.processed - 1) / span, 2) if span > 0 else 0.0,
+                "last_error": self.last_error,
+                "busy": self.busy.to_dict(),
+                "latency": self.latency.to_dict(),
+            }
+
+
+class _Pipeline:
+    """source(after_seq, timeout) -> 프레임 또는 None 에서 프레임을 받아 단계를 순서대로 통과시킨다.
+
+    각 단계 fn(value)는 이전 단계의 반환값을 받는다 (첫 단계는 카메라 프레임). None을 반환하면 그 프레임은 거기서 끝난다.
+    마지막 단계의 결과는 latest() / wait_next()로 읽는다.
+    """
+    def __init__(self, source: Callable, name: str = "pipeline"):
+        self.name = name
+        self._source = source
+        self._stages: list[_Stage] = []
+        self._threads: list[threading.Thread] = []
+        self._running = False
+        self._out_cond = threading.Condition()
+        self._out: tuple[int, object] | None = None
+        self.frames = 0
+        self._started_at: float | None = None
+
+    def stage(self, name: str, fn: Callable, workers: int = 1, processes: int = 0) -> "_Pipeline":
+        """단계 추가 (시작 전에만). workers: 스레드 수, processes>0이면 그 크기의 프로세스 풀에서 실행
+        (fn은 import 가능한 모듈의 최상위 함수여야 한다)."""
+        if self._running:
+            raise RuntimeError("실행 중인 파이프라인에는 단계를 추가할 수 없습니다.")
+        if any(s.name == name for s in self._stages):
+            raise ValueError(f"이미 있는 단계 이름입니다: {name}")
+        if processes:
+            try:
+                pickle.dumps(fn)
+            except Exception:
+                raise ValueError(f"processes 단계 함수는 import 가능한 모듈의 최상위 함수여야 합니다 "
+                                 f"(lambda/지역 함수 불가): {name}") from None
+        self._stages.append(_Stage(name, fn, int(workers), int(processes)))
+        return self
+
+    def start(self) -> "_Pipeline":
+        if self._running:
+            return self
+        if not self._stages:
+            raise ValueError("단계가 없습니다.")
+        for st in self._stages:
+            st.slot = _Slot()
+            if st.processes:
+                st.pool = ProcessPoolExecutor(st.processes, mp_context=multiprocessing.get_context(_START_METHOD))
+        self._running = True
+        self._started_at = time.monotonic()
+        self._spawn(self._feed, "source")
+        for i, st in enumerate(self._stages):
+            nxt = self._stages[i + 1] if i + 1 < len(self._stages) else None
+            for w in range(st.workers):
+                self._spawn(lambda st=st, nxt=nxt: self._work(st, nxt), f"{st.name}-{w}")
+        return self
+
+    def _spawn(self, target, label: str) -> None:
+        t = threading.Thread(target=target, name=f"{self.name}:{label}", daemon=True)
+        t.start()
+        self._threads.append(t)
+
+    def _feed(self) -> None:
+        first = self._stages[0]
+        after = None
+        while self._running:
+            frame = self._source(after, _SOURCE_TIMEOUT_S)
+            if frame is None or not self._running:
+                continue
+            after = frame.seq
+            self.frames += 1
+            t_capture = frame.timestamp or time.monotonic()
+            if first.slot.put((frame.seq, t_capture, frame)):
+                with first.lock:
+                    first.dropped += 1
+
+    def _work(self, st: _Stage, nxt: _Stage | None) -> None:
+        while True:
+            item = st.slot.get()
+            if item is _CLOSED:
+                return
+            seq, t_capture, value = item
+            t0 = time.monotonic()
+            try:
+                result = st.call(value)
+                error = None
+            except Exception as e:
+                result, error = None, f"{type(e).__name__}: {e}"
+            t1 = time.monotonic()
+            with st.lock:
+                st.busy.record(t1 - t0)
+                if error is not None:
+                    st.failed += 1
+                    st.last_error = error
+                    continue
+                if result is None:
+                    st.filtered += 1
+                    continue
+                if seq <= st.last_out_seq:
+                    st.stale += 1
+                    continue
+                st.last_out_seq = seq
+                st.processed += 1
+                st.latency.record(t1 - t_capture)
+                if st.first_at is None:
+                    st.first_at = t1
+                st.last_at = t1
+            if nxt is not None:
+                if nxt.slot.put((seq, t_capture, result)):
+                    with nxt.lock:
+                        nxt.dropped += 1
+            else:
+                with self._out_cond:
+                    self._out = (seq, result)
+                    self._out_cond.notify_all()
+
+    def latest(self) -> tuple[int, object] | None:
+        """마지막 단계의 가장 최근 결과 (seq, 값). 아직 없으면 None."""
+        with self._out_cond:
+            return self._out
+
+    def wait_next(self, after_seq: int | None = None, timeout: float = 1.0) -> tuple[int, object] | None:
+        """after_seq(None이면 호출 시점 최신)보다 새 결과까지 대기. 시간 초과 시 None."""
+        deadline = time.monotonic() + timeout
+        with self._out_cond:
+            if after_seq is None:
+                after_seq = self._out[0] if self._out is not None else 0
+            while self._out is None or self._out[0] <= after_seq:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    return None
+                self._out_cond.wait(remaining)
+            return self._out
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """소스와 워커를 멈추고 프로세스 풀을 닫는다. 처리 중인 항목은 끝까지 처리된다."""
+        if not self._running:
+            return
+        self._running = False
+        for st in self._stages:
+            st.slot.close()
+        deadline = time.monotonic() + timeout
+        for t in self._threads:
+            t.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+        for st in self._stages:
+            if st.pool is not None:
+                st.pool.shutdown(wait=False, cancel_futures=True)
+                st.pool = None
+        with self._out_cond:
+            self._out_cond.notify_all()
+
+    def get_stats(self) -> dict:
+        """소스 프레임 수/fps와 단계별 처리·드롭·필터·실패·순서역전 수, fps, 처리 시간(busy)·캡처 이후 지연(latency)."""
+        elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        return {
+            "running": self._running,
+            "source": {"frames": self.frames, "fps": round(self.frames / elapsed, 2) if elapsed > 0 else 0.0},
+            "stages": {st.name: st.to_dict() for st in self._stages},
+        }
+
+    def __enter__(self) -> "_Pipeline":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
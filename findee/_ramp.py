@@ -0,0 +1,155 @@
+"""모터 램프(슬루) 생성기: 고정 주기 스레드가 적용 duty를 목표 쪽으로 가속 한계 내에서 이동. _MotorUltrasonic에서 사용."""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Callable
+
+from findee._metrics import _LatencyHistogram
+
+# 모터가 실제로 도는 최소 duty (_MotorUltrasonic.control_motors 정규화와 동일). 0과 이 값 사이는 건너뛴다.
+_MIN_DUTY = 20.0
+
+
+class _MotorRamp:
+    """좌/우 목표 속도(-100~100)를 받아 rate_hz 틱마다 accel/decel(%/s) 한도로 apply_fn 호출.
+
+    목표에 도달하면 스레드는 다음 목표가 올 때까지 대기하므로 정지 상태에서는 CPU를 쓰지 않는다.
+    틱이 예정 시각보다 반 주기 이상 늦으면 late_ticks, 한 주기 이상 밀려 건너뛴 틱은 missed_ticks로 센다.
+    """
+    def __init__(self, apply_fn: Callable[[float, float, str], None], rate_hz: float = 100.0,
+                 accel: float = 400.0, decel: float = 800.0):
+        self._apply_fn = apply_fn
+        self._cond = threading.Condition()
+        self._target = [0.0, 0.0]
+        self._applied = [0.0, 0.0]
+        self._decay = "slow"
+        self._decay_changed = False
+        self._running = False
+        self._paused = False
+        # 틱 스레드의 apply_fn 호출 구간. pause()는 진행 중인 호출이 끝날 때까지 기다린다
+        self._apply_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.configure(rate_hz, accel, decel)
+        self.lateness = _LatencyHistogram()
+        self.ticks = 0
+        self.late_ticks = 0
+        self.missed_ticks = 0
+
+    def configure(self, rate_hz: float, accel: float, decel: float) -> None:
+        if rate_hz <= 0 or accel <= 0 or decel <= 0:
+            raise ValueError("rate_hz, accel, decel must be greater than 0")
+        with self._cond:
+            self.period = 1.0 / rate_hz
+            self.accel = float(accel)
+            self.decel = float(decel)
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def set_target(self, left: float, right: float, decay: str = "slow") -> None:
+        """비블로킹. 새 목표만 기록하고 틱 스레드를 깨운다."""
+        with self._cond:
+            self._target = [float(left), float(right)]
+            if decay != self._decay:
+                self._decay = decay
+                self._decay_changed = True
+            self._cond.notify()
+
+    def reset(self, left: float = 0.0, right: float = 0.0) -> None:
+        """적용값과 목표를 즉시 맞춤 (force_stop처럼 램프를 우회한 출력 후 동기화용)."""
+        with self._cond:
+            self._target = [float(left), float(right)]
+            self._applied = [float(left), float(right)]
+
+    def pause(self) -> None:
+        """출력을 멈추고 적용값/목표를 0으로. 반환 뒤에는 틱 스레드가 apply_fn을 부르지 않는다 (force_stop 브레이크 동안)."""
+        with self._cond:
+            self._paused = True
+            self._target = [0.0, 0.0]
+            self._applied = [0.0, 0.0]
+        with self._apply_lock:
+            pass
+
+    def resume(self) -> None:
+        with self._cond:
+            self._paused = False
+            self._cond.notify()
+
+    def get_target(self) -> tuple[float, float, str]:
+        with self._cond:
+            return self._target[0], self._target[1], self._decay
+
+    def get_stats(self) -> dict:
+        return {
+            "rate_hz": round(1.0 / self.period, 3),
+            "accel": self.accel,
+            "decel": self.decel,
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "missed_ticks": self.missed_ticks,
+            "lateness": self.lateness.to_dict(),
+        }
+
+    def _step(self, cur: float, tgt: float, dt: float) -> float:
+        if cur == tgt:
+            return cur
+        away = tgt != 0.0 and (cur == 0.0 or (cur > 0) == (tgt > 0)) and abs(tgt) > abs(cur)
+        limit = (self.accel if away else self.decel) * dt
+        nxt = cur + max(-limit, min(limit, tgt - cur))
+        if 0.0 < abs(nxt) < _MIN_DUTY:
+            nxt = math.copysign(_MIN_DUTY, tgt) if away else 0.0
+        return nxt
+
+    def _loop(self) -> None:
+        deadline = None
+        last = time.monotonic()
+        while True:
+            with self._cond:
+                while self._running and (self._paused or (self._applied == self._target and not self._decay_changed)):
+                    deadline = None
+                    self._cond.wait()
+                if not self._running:
+                    return
+            now = time.monotonic()
+            if deadline is None:
+                # 대기 후 첫 틱: 한 주기 분량만 진행
+                deadline, last = now, now - self.period
+            elif now < deadline:
+                time.sleep(deadline - now)
+                now = time.monotonic()
+            late = now - deadline
+            self.lateness.record(max(0.0, late))
+            self.ticks += 1
+            if late > self.period * 0.5:
+                self.late_ticks += 1
+            if late >= self.period:
+                skipped = int(late / self.period)
+                self.missed_ticks += skipped
+                deadline += skipped * self.period
+            deadline += self.period
+            dt, last = now - last, now
+            with self._cond:
+                left = self._step(self._applied[0], self._target[0], dt)
+                right = self._step(self._applied[1], self._target[1], dt)
+                changed = (left, right) != tuple(self._applied) or self._decay_changed
+                self._applied = [left, right]
+                self._decay_changed = False
+                decay = self._decay
+            with self._apply_lock:
+                if changed and not self._paused:
+                    self._apply_fn(left, right, decay)
@@ -0,0 +1,144 @@
+"""검출-후-추적: 비싼 검출은 N프레임마다(또는 추적 신뢰도가 떨어질 때만) 돌리고, 그 사이에는
+직전 위치 주변 탐색 창에서 템플릿 매칭(gray, TM_CCOEFF_NORMED)으로 위치만 갱신한다.
+
+템플릿은 검출이 성공할 때만 새로 잘라 둔다 (추적 결과로 템플릿을 바꾸면 조금씩 미끄러진다).
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import cv2
+import numpy as np
+
+from findee._frame import _Frame
+from findee._metrics import _LatencyHistogram
+
+_MIN_TEMPLATE = 4
+
+
+@dataclass
+class TrackResult:
+    """box: (x, y, w, h) 원본 프레임 좌표. detected: 이번 프레임에서 검출을 돌렸으면 True, 추적이면 False.
+    score: 검출이면 1.0, 추적이면 템플릿 매칭 점수(-1~1)."""
+    box: tuple[int, int, int, int]
+    cx: float
+    cy: float
+    score: float
+    detected: bool
+    seq: int | None = None
+
+
+def _gray(frame: np.ndarray) -> np.ndarray:
+    if isinstance(frame, _Frame) and frame.derivable:
+        return frame.gray
+    return frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+
+class _DetectTracker:
+    """detect(frame) -> (x, y, w, h) 또는 None.
+
+    every: 추적 중에도 이 프레임 수마다 검출로 다시 맞춤. min_score: 매칭 점수가 이보다 낮으면 즉시 검출.
+    search: 탐색 창 크기 (직전 상자 대비 배율).
+    """
+    def __init__(self, detect: Callable, every: int = 10, min_score: float = 0.6, search: float = 2.0):
+        if every < 1:
+            raise ValueError("every는 1 이상이어야 합니다.")
+        if search < 1.0:
+            raise ValueError("search는 1 이상이어야 합니다.")
+        self._detect = detect
+        self.every = int(every)
+        self.min_score = float(min_score)
+        self.search = float(search)
+        self._template: np.ndarray | None = None
+        self._box: tuple[int, int, int, int] | None = None
+        self._since_detect = 0
+        self.frames = 0
+        self.detections = {"scheduled": 0, "low_score": 0, "no_track": 0}
+        self.tracked = 0
+        self.misses = 0
+        self.detect_hist = _LatencyHistogram()
+        self.track_hist = _LatencyHistogram()
+        self._busy = 0.0
+
+    def reset(self) -> None:
+        """추적 중인 대상을 잊는다 (다음 update는 검출부터)."""
+        self._template = None
+        self._box = None
+
+    def update(self, frame: np.ndarray) -> TrackResult | None:
+        """프레임 하나 처리. 대상을 못 찾으면 None."""
+        self.frames += 1
+        seq = getattr(frame, "seq", None)
+        if self._box is None:
+            return self._run_detect(frame, "no_track", seq)
+        if self._since_detect >= self.every:
+            return self._run_detect(frame, "scheduled", seq)
+        t0 = time.monotonic()
+        result = self._track(frame, seq)
+        dt = time.monotonic() - t0
+        self.track_hist.record(dt)
+        self._busy += dt
+        if result is None:
+            return self._run_detect(frame, "low_score", seq)
+        self._since_detect += 1
+        self.tracked += 1
+        return result
+
+    def _run_detect(self, frame: np.ndarray, reason: str, seq) -> TrackResult | None:
+        t0 = time.monotonic()
+        box = self._detect(frame)
+        self.detections[reason] += 1
+        self._since_detect = 1  # 검출한 이 프레임도 주기에 포함 (every=1이면 매 프레임 검출)
+        if box is None:
+            self.misses += 1
+            self.reset()
+            result = None
+        else:
+            x, y, w, h = (int(v) for v in box)
+            gray = _gray(frame)
+            x, y = max(0, x), max(0, y)
+            w, h = min(w, gray.shape[1] - x), min(h, gray.shape[0] - y)
+            if w < _MIN_TEMPLATE or h < _MIN_TEMPLATE:
+                # 너무 작으면 템플릿 매칭이 의미 없으므로 매 프레임 검출
+                self._template = None
+                self._box = None
+            else:
+                self._template = gray[y:y + h, x:x + w].copy()
+                self._box = (x, y, w, h)
+            result = TrackResult((x, y, w, h), x + w / 2.0, y + h / 2.0, 1.0, True, seq)
+        dt = time.monotonic() - t0
+        self.detect_hist.record(dt)
+        self._busy += dt
+        return result
+
+    def _track(self, frame: np.ndarray, seq) -> TrackResult | None:
+        gray = _gray(frame)
+        x, y, w, h = self._box
+        fh, fw = gray.shape[:2]
+        pad_x, pad_y = int(w * (self.search - 1.0) / 2.0) + 1, int(h * (self.search - 1.0) / 2.0) + 1
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1, y1 = min(fw, x + w + pad_x), min(fh, y + h + pad_y)
+        if x1 - x0 < w or y1 - y0 < h:
+            return None
+        scores = cv2.matchTemplate(gray[y0:y1, x0:x1], self._template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (mx, my) = cv2.minMaxLoc(scores)
+        if score < self.min_score:
+            return None
+        self._box = (x0 + mx, y0 + my, w, h)
+        bx, by = self._box[:2]
+        return TrackResult(self._box, bx + w / 2.0, by + h / 2.0, float(score), False, seq)
+
+    def get_stats(self) -> dict:
+        """검출 횟수(이유별), 추적 횟수, 놓친 횟수, 검출/추적 소요 히스토그램, 프레임당 평균 처리 시간(ms)."""
+        return {
+            "frames": self.frames,
+            "detections": dict(self.detections),
+            "tracked": self.tracked,
+            "misses": self.misses,
+            "detect_ratio": round(sum(self.detections.values()) / self.frames, 3) if self.frames else 0.0,
+            "mean_ms": round(self._busy / self.frames * 1000.0, 3) if self.frames else 0.0,
+            "detect": self.detect_hist.to_dict(),
+            "track": self.track_hist.to_dict(),
+        }
@@ -0,0 +1,229 @@
+"""희소 광류 시각 주행거리계: 저해상도 gray에서 좋은 특징점(goodFeaturesToTrack)을 피라미드 LK로 프레임마다 추적하고,
+추적점을 바닥 평면으로 투영해 직전 프레임 대비 로봇 이동량(dx, dy)을 구한다. 회전은 IMU yaw 변화량을 그대로 쓴다.
+
+바닥 투영: 카메라 높이 camera_height, 아래로 기울인 각도 tilt(0 수평, 90 정면 아래)와 내부 파라미터로 화소 -> 로봇 좌표
+(X 앞, Y 왼쪽) 바닥 점을 구한다. 정지한 바닥 점 P는 로봇이 (T, dψ)만큼 움직이면 P_prev = R(dψ)·P_curr + T 를 만족하므로,
+점마다 T를 구해 중앙값을 쓰고 중앙값에서 먼 점(움직이는 물체, 잘못된 추적)은 추적에서 뺀다.
+IMU가 없으면 같은 점 쌍에서 회전까지 추정한다 (estimateAffinePartial2D, RANSAC).
+
+추적점은 프레임 사이에 유지하고, min_points보다 줄어들면 기존 점 주변을 피해 max_points까지 다시 뽑는다.
+비용 조절: width(처리 폭), max_points, levels(피라미드 단계), win(LK 창 크기), max_range(바닥 점 최대 거리).
+"""
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+from findee._aruco import _Intrinsics
+from findee._metrics import _LatencyHistogram
+from findee._motion_detect import _small_gray
+
+# 수평선 근처 화소는 바닥 거리가 급격히 커져 투영 오차가 크므로 ray가 이 값보다 아래를 향할 때만 쓴다
+_MIN_DOWN = 0.05
+# 바닥 점 오차 허용치 (camera_height 배수). RANSAC 회전 추정 / 이상치 제거 하한
+_RANSAC_TOL = 0.2
+_RESID_FLOOR = 0.02
+
+
+@dataclass
+class VoPose:
+    """x, y: 시작 위치 기준 누적 위치 (camera_height와 같은 단위, x는 시작 시 앞 방향). heading: 시작 대비 회전(도, 왼쪽 +).
+    dx, dy: 이번 프레임 이동량 (직전 로봇 좌표, 앞/왼쪽). tracked: 이동 계산에 쓴 점 수. ok: 이번 프레임 이동을 계산했으면 True."""
+    x: float
+    y: float
+    heading: float
+    dx: float = 0.0
+    dy: float = 0.0
+    tracked: int = 0
+    ok: bool = False
+    seq: int | None = None
+
+
+def _wrap_deg(a: float) -> float:
+    return (a + 180.0) % 360.0 - 180.0
+
+
+@lru_cache(maxsize=8)
+def _ground_model(size: tuple[int, int], k: tuple, height: float, tilt_deg: float, max_range: float):
+    """처리 해상도 화소 -> 바닥 투영 계수와 특징점 검출 마스크 (바닥이 보이고 max_range 이내인 영역)."""
+    w, h = size
+    fx, fy, cx, cy = k
+    s, c = math.sin(math.radians(tilt_deg)), math.cos(math.radians(tilt_deg))
+    b = (np.arange(h, dtype=np.float64) - cy) / fy
+    down = s + b * c
+    rows = down > _MIN_DOWN
+    # 화소 (u, v): X = H (c - b s) / down, Y = -H a / down
+    forward = np.where(rows, height * (c - b * s) / np.where(rows, down, 1.0), np.inf)
+    mask = np.zeros((h, w), np.uint8)
+    near = rows & (forward <= max_range)
+    mask[near] = 255
+    return (fx, cx, fy, cy, s, c, height), mask
+
+
+def _project(points: np.ndarray, model) -> tuple[np.ndarray, np.ndarray]:
+    """(N, 2) 화소 -> (N, 2) 바닥 점 (X 앞, Y 왼쪽)과 유효 여부."""
+    fx, cx, fy, cy, s, c, height = model
+    a = (points[:, 0] - cx) / fx
+    b = (points[:, 1] - cy) / fy
+    down = s + b * c
+    ok = down > _MIN_DOWN
+    t = height / np.where(ok, down, 1.0)
+    return np.stack([t * (c - b * s), -t * a], axis=1), ok
+
+
+class _FlowOdometry:
+    """imu: get_rpy()가 있는 객체(없으면 회전도 영상으로 추정). intrinsics: _Intrinsics (없으면 Pi 카메라 화각 근사).
+
+    camera_height/tilt는 실제로 재서 넣어야 한다 (높이 단위가 곧 x/y 단위). yaw_sign: IMU yaw가 오른쪽 회전일 때
+    증가하면 -1로 둔다 (heading은 왼쪽 회전 +).
+    """
+    def __init__(self, imu=None, intrinsics: _Intrinsics | None = None, camera_height: float = 0.1,
+                 tilt: float = 30.0, width: int = 160, max_points: int = 80, min_points: int = 30,
+                 levels: int = 2, win: int = 15, max_range: float = 1.5, yaw_sign: float = 1.0):
+        if camera_height <= 0:
+            raise ValueError("camera_height는 0보다 커야 합니다.")
+        if not 0.0 <= tilt <= 90.0:
+            raise ValueError("tilt는 0~90도여야 합니다.")
+        if width < 32:
+            raise ValueError("width는 32 이상이어야 합니다.")
+        self._imu = imu
+        self._intrinsics = intrinsics
+        self.camera_height = float(camera_height)
+        self.tilt = float(tilt)
+        self.width = int(width)
+        self.max_points = max(4, int(max_points))
+        self.min_points = min(self.max_points, max(3, int(min_points)))
+        self.levels = max(0, int(levels))
+        self.win = max(5, int(win))
+        self.max_range = float(max_range)
+        self.yaw_sign = 1.0 if yaw_sign >= 0 else -1.0
+        self._criteria = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03)
+        self.frames = 0
+        self.lost = 0
+        self.replenished = 0
+        self.tracked_sum = 0
+        self.update_hist = _LatencyHistogram()
+        self.reset()
+
+    def reset(self, x: float = 0.0, y: float = 0.0, heading: float = 0.0) -> None:
+        """위치/방향을 다시 잡고 추적점을 버린다."""
+        self.x, self.y, self.heading = float(x), float(y), float(heading)
+        self._prev: np.ndarray | None = None
+        self._points: np.ndarray | None = None
+        self._yaw: float | None = None
+        self._size: tuple[int, int] | None = None
+
+    def _read_yaw(self) -> float | None:
+        if self._imu is None:
+            return None
+        try:
+            return self.yaw_sign * float(self._imu.get_rpy()[2])
+        except Exception:
+            return None
+
+    def _model(self, frame_size: tuple[int, int], size: tuple[int, int]):
+        if self._intrinsics is None:
+            self._intrinsics = _Intrinsics.approximate(frame_size)
+        k = self._intrinsics.for_size(size)
+        return _ground_model(size, (float(k[0, 0]), float(k[1, 1]), float(k[0, 2]), float(k[1, 2])),
+                             self.camera_height, self.tilt, self.max_range)
+
+    def _replenish(self, gray: np.ndarray, mask: np.ndarray) -> None:
+        have = 0 if self._points is None else len(self._points)
+        want = self.max_points - have
+        if want <= 0:
+            return
+        if have:
+            mask = mask.copy()
+            for px, py in self._points.reshape(-1, 2):
+                cv2.circle(mask, (int(px), int(py)), 5, 0, -1)
+        found = cv2.goodFeaturesToTrack(gray, want, 0.01, 5, mask=mask, blockSize=5)
+        self.replenished += 1
+        if found is None:
+            return
+        found = found.reshape(-1, 1, 2).astype(np.float32)
+        self._points = found if not have else np.concatenate([self._points, found])
+
+    def update(self, frame: np.ndarray, yaw: float | None = None) -> VoPose:
+        """프레임 하나로 추적하고 누적 자세를 갱신한다. yaw(도)를 주면 IMU 대신 그 값을 쓴다."""
+        t0 = time.monotonic()
+        self.frames += 1
+        seq = getattr(frame, "seq", None)
+        h, w = frame.shape[:2]
+        size = (self.width, max(1, round(self.width * h / w)))
+        gray = _small_gray(frame, size)
+        if yaw is None:
+            yaw = self._read_yaw()
+        model, mask = self._model((w, h), size)
+        dyaw = None if yaw is None or self._yaw is None else math.radians(_wrap_deg(yaw - self._yaw))
+        pose = VoPose(self.x, self.y, self.heading, seq=seq)
+        if self._prev is None or self._size != size or self._points is None or not len(self._points):
+            if self._prev is not None and dyaw is not None:
+                # 추적점이 없던 프레임에도 방향은 IMU로 따라간다
+                self.heading = pose.heading = _wrap_deg(self.heading + math.degrees(dyaw))
+                self.lost += 1
+            self._prev, self._size, self._yaw = gray, size, yaw
+            self._points = None
+            self._replenish(gray, mask)
+            self.update_hist.record(time.monotonic() - t0)
+            return pose
+        nxt, status, _ = cv2.calcOpticalFlowPyrLK(self._prev, gray, self._points, None, winSize=(self.win, self.win),
+                                                  maxLevel=self.levels, criteria=self._criteria)
+        good = status.reshape(-1) == 1
+        prev_px, curr_px = self._points.reshape(-1, 2)[good], nxt.reshape(-1, 2)[good]
+        prev_g, ok_p = _project(prev_px, model)
+        curr_g, ok_c = _project(curr_px, model)
+        ok = ok_p & ok_c
+        prev_g, curr_g, curr_px = prev_g[ok], curr_g[ok], curr_px[ok]
+        keep = np.zeros(len(curr_px), bool)
+        if len(curr_px) >= 3:
+            if dyaw is None:
+                m, inl = cv2.estimateAffinePartial2D(curr_g.astype(np.float32), prev_g.astype(np.float32),
+                                                     method=cv2.RANSAC, ransacReprojThreshold=_RANSAC_TOL * self.camera_height)
+                if m is not None:
+                    dyaw = math.atan2(m[1, 0], m[0, 0])
+            if dyaw is not None:
+                cs, sn = math.cos(dyaw), math.sin(dyaw)
+                rotated = curr_g @ np.array([[cs, sn], [-sn, cs]])
+                steps = prev_g - rotated
+                t = np.median(steps, axis=0)
+                resid = np.linalg.norm(steps - t, axis=1)
+                # 중앙값에서 먼 점(움직이는 물체, 미끄러진 추적)은 빼고 나머지로 다시 평균
+                keep = resid <= max(3.0 * np.median(resid), _RESID_FLOOR * self.camera_height)
+                if keep.sum() >= 3:
+                    t = steps[keep].mean(axis=0)
+                    heading = math.radians(self.heading)
+                    ch, shd = math.cos(heading), math.sin(heading)
+                    self.x += ch * t[0] - shd * t[1]
+                    self.y += shd * t[0] + ch * t[1]
+                    self.heading = _wrap_deg(self.heading + math.degrees(dyaw))
+                    pose = VoPose(self.x, self.y, self.heading, float(t[0]), float(t[1]), int(keep.sum()), True, seq)
+                    self.tracked_sum += int(keep.sum())
+        if not pose.ok:
+            self.lost += 1
+            if dyaw is not None:
+                self.heading = _wrap_deg(self.heading + math.degrees(dyaw))
+                pose.heading = self.heading
+        self._points = curr_px[keep].reshape(-1, 1, 2).astype(np.float32) if keep.any() else None
+        self._prev, self._yaw = gray, yaw
+        if self._points is None or len(self._points) < self.min_points:
+            self._replenish(gray, mask)
+        self.update_hist.record(time.monotonic() - t0)
+        return pose
+
+    def get_stats(self) -> dict:
+        """처리 프레임 수, 이동을 못 구한 프레임 수, 재검출 횟수, 프레임당 평균 추적점 수, update 소요 히스토그램."""
+        done = self.frames - self.lost
+        return {
+            "frames": self.frames,
+            "lost": self.lost,
+            "replenished": self.replenished,
+            "mean_tracked": round(self.tracked_sum / done, 1) if done > 0 else 0.0,
+            "pose": (round(self.x, 4), round(self.y, 4), round(self.heading, 2)),
+            "update": self.update_hist.to_dict(),
+        }
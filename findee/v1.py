@@ -4,6 +4,7 @@ import random
 import threading
 import time
 import atexit
+import weakref
 import cv2
 import psutil
 import numpy as np
@@ -21,6 +22,20 @@ from findee._imu import _IMU
 from findee._battery import _Battery
 from findee._camera import _Camera
 from findee._motor_ultrasonic import _MotorUltrasonic
+from findee._control_loop import _ControlLoop
+from findee._pipeline import _Pipeline
+from findee._metrics import frame_trace
+from findee._jpeg import encode_jpeg as _encode_jpeg
+from findee._frame import _Frame, as_hsv as _as_hsv
+from findee._tracker import _DetectTracker
+from findee._line_follow import LineResult as _LineResult, follow_line as _follow_line
+from findee._motion_detect import _MotionDetector
+from findee._visual_odometry import _FlowOdometry
+from findee._aruco import _Intrinsics, _MarkerDetector, detect_markers as _detect_markers
+from findee._color_lut import (
+    get_classifier as _get_color_classifier, get_bgr_mask_lut as _get_bgr_mask_lut,
+    crop_scale as _crop_scale, expand_mask as _expand_mask, traffic_light as _traffic_light,
+)
 
 ULTRASONIC_PROBE_COUNT = 5
 ULTRASONIC_PROBE_INTERVAL_S = 0.1
@@ -61,6 +76,8 @@ class Findee:
         self._oled_stop = False
         self._oled_thread = None
         self._oled_status = ""
+        # 만든 파이프라인 전부 (시작 전/멈춘 뒤 다시 시작한 것 포함). 사용자가 버린 것은 자동으로 빠진다
+        self._pipelines = weakref.WeakSet()
 
         self._motor = _MotorUltrasonic()
         self._motor.gpio_init()
@@ -242,8 +259,20 @@ class Findee:
     @debug_decorator
     def control_motors(self, left: float, right: float, decay: str = "slow") -> None:
         if getattr(self, '_motor', None) is not None:
+            self._motor.cancel_motions()
             self._motor.control_motors(left, right, decay)
 
+    def set_motor_ramp(self, enabled: bool = True, accel: float = 400.0, decel: float = 800.0, rate_hz: float = 100.0) -> None:
+        """모터 램프 모드. accel/decel은 초당 duty(%) 변화 한도. 켜져 있으면 stop()도 decel로 감속 정지."""
+        if getattr(self, '_motor', None) is not None:
+            self._motor.set_ramp(enabled, accel, decel, rate_hz)
+
+    def get_motor_ramp_stats(self) -> dict:
+        """램프 제어 스레드의 틱 수, 늦은/건너뛴 틱, 지연 히스토그램."""
+        if getattr(self, '_motor', None) is None:
+            return {}
+        return self._motor.get_ramp_stats()
+
     @debug_decorator
     def stop(self):
         if getattr(self, '_motor', None) is not None:
@@ -254,34 +283,40 @@ class Findee:
         self._motor.force_stop()
 
     @debug_decorator
-    def move_forward(self, speed: float = None, duration: float = 0.0):
+    def move_forward(self, speed: float = None, duration: float = 0.0, wait: bool = True, queue: bool = False):
         s = speed if speed is not None else self.default_speed
-        self._motor.move_forward(s, duration)
+        return self._motor.move_forward(s, duration, wait, queue)
 
     @debug_decorator
-    def move_backward(self, speed: float = None, duration: float = 0.0):
+    def move_backward(self, speed: float = None, duration: float = 0.0, wait: bool = True, queue: bool = False):
         s = speed if speed is not None else self.default_speed
-        self._motor.move_backward(s, duration)
+        return self._motor.move_backward(s, duration, wait, queue)
 
     @debug_decorator
-    def turn_left(self, speed: float = None, duration: float = 0.0):
+    def turn_left(self, speed: float = None, duration: float = 0.0, wait: bool = True, queue: bool = False):
         s = speed if speed is not None else self.default_speed
-        self._motor.turn_left(s, duration)
+        return self._motor.turn_left(s, duration, wait, queue)
 
     @debug_decorator
-    def turn_right(self, speed: float = None, duration: float = 0.0):
+    def turn_right(self, speed: float = None, duration: float = 0.0, wait: bool = True, queue: bool = False):
         s = speed if speed is not None else self.default_speed
-        self._motor.turn_right(s, duration)
+        return self._motor.turn_right(s, duration, wait, queue)
 
     @debug_decorator
-    def curve_left(self, speed: float = None, ratio: float = 0.5, duration: float = 0.0):
+    def curve_left(self, speed: float = None, ratio: float = 0.5, duration: float = 0.0, wait: bool = True, queue: bool = False):
         s = speed if speed is not None else self.default_speed
-        self._motor.curve_left(s, ratio, duration)
+        return self._motor.curve_left(s, ratio, duration, wait, queue)
 
     @debug_decorator
-    def curve_right(self, speed: float = None, ratio: float = 0.5, duration: float = 0.0):
+    def curve_right(self, speed: float = None, ratio: float = 0.5, duration: float = 0.0, wait: bool = True, queue: bool = False):
         s = speed if speed is not None else self.default_speed
-        self._motor.curve_right(s, ratio, duration)
+        return self._motor.curve_right(s, ratio, duration, wait, queue)
+
+    def get_motion_stats(self) -> dict:
+        """비동기 이동(wait=False/queue=True)의 예정 종료 시각 대비 지연 통계."""
+        if getattr(self, '_motor', None) is None:
+            return {}
+        return self._motor.get_motion_stats()
 
     @debug_decorator
     def get_distance(self):
@@ -289,19 +324,143 @@ class Findee:
             return -1.0
         return self._motor.get_distance()
 
+    # --- 고정 주기 제어 루프 ---
+    def run_control_loop(self, step, rate_hz: float = 50.0, duration: float = None, max_ticks: int = None,
+                         distance_every: int = 0, overrun: str = "skip") -> dict:
+        """step(snapshot)을 rate_hz로 호출 (블로킹). step이 False를 반환하면 종료.
+
+        snapshot: tick, t, dt, roll, pitch, yaw, distance. distance_every=N이면 N틱마다 초음파 측정(에코 대기 포함 최대 ~130ms 블로킹).
+        그 틱은 주기를 넘기기 쉬우므로 rate_hz와 distance_every를 그만큼 여유 있게 잡는다.
+        overrun="skip"은 주기를 넘기면 놓친 틱을 건너뛰고, "delay"는 그 시점부터 격자를 다시 잡는다.
+        반환: 틱 수, overrun/skip 수, 주기·지터·step 소요 히스토그램.
+        """
+        loop = _ControlLoop(step, rate_hz, imu=getattr(self, '_imu', None), motor=getattr(self, '_motor', None),
+                            distance_every=distance_every, overrun=overrun)
+        return loop.run(duration=duration, max_ticks=max_ticks)
+
     # --- 위임: 카메라 ---
-    def get_frame(self):
+    def get_frame(self, stream: str = "main"):
+        """최신 프레임 사본을 즉시 반환. frame.seq(순번), frame.timestamp(캡처 시각) 포함.
+        stream="lores"면 ISP가 함께 만든 축소 프레임 (lores가 없는 프로필에서는 main).
+        frame.hsv / frame.gray / frame.blurred / frame.half 는 처음 접근할 때 한 번만 계산된다."""
+        if getattr(self, '_camera', None) is None:
+            return None
+        return self._camera.get_frame(stream)
+
+    def wait_next_frame(self, after_seq: int = None, timeout: float = 1.0, stream: str = "main"):
+        """after_seq(기본: 호출 시점 최신)보다 새 프레임이 나올 때까지만 대기. 시간 초과 시 None."""
+        if getattr(self, '_camera', None) is None:
+            return None
+        return self._camera.wait_next(after_seq, timeout, stream)
+
+    def get_frame_ref(self, stream: str = "main"):
+        """최신 프레임 참조 (복사 없음, 읽기 전용 ref.array). with 문 또는 release()로 반납해야 버퍼가 재사용된다."""
         if getattr(self, '_camera', None) is None:
             return None
-        return self._camera.get_frame()
+        return self._camera.get_frame_ref(stream)
 
-    def mjpeg_gen(self):
+    def get_frame_pool_stats(self) -> dict:
+        """스트림별 프레임 풀 슬롯 수/사용 중/할당/재사용/사본/드롭 횟수."""
+        if getattr(self, '_camera', None) is None:
+            return {}
+        return self._camera.get_pool_stats()
+
+    def encode_jpeg(self, image, quality: int = None, preset: str = "default") -> bytes | None:
+        """JPEG bytes. get_frame_ref()로 받은 읽기 전용 프레임은 같은 프레임·품질이면 이전 인코딩 결과를 재사용."""
+        if getattr(self, '_camera', None) is None:
+            return _encode_jpeg(image, quality, preset)
+        return self._camera.encode_jpeg(image, quality, preset)
+
+    def get_jpeg_cache_stats(self) -> dict:
+        """JPEG 캐시 항목 수/바이트/적중/미스/축출."""
+        if getattr(self, '_camera', None) is None:
+            return {}
+        return self._camera.jpeg_cache.get_stats()
+
+    def last_frame_meta(self):
+        """이 스레드가 마지막으로 가져온 카메라 프레임의 (seq, 노출 시각, 도착 시각). 없으면 None."""
+        if getattr(self, '_camera', None) is None:
+            return None
+        return self._camera.last_fetched_meta()
+
+    def get_latency_trace(self, reset: bool = False) -> dict:
+        """프레임 단계별 지연 히스토그램: capture(노출->링), process(링->emit_image), encode, queue(WebRTC 대기), send, total(노출->전송)."""
+        stats = frame_trace.to_dict()
+        if reset:
+            frame_trace.reset()
+        return stats
+
+    def enable_frame_bus(self, name: str = "pf_frames", stream: str = "main", slots: int = 8) -> None:
+        """카메라 프레임을 공유 메모리 링에도 기록. 다른 프로세스에서 findee.FrameBusReader(name)로 복사 없이 읽는다."""
+        if getattr(self, '_camera', None) is not None:
+            self._camera.enable_frame_bus(name, stream, slots)
+
+    def disable_frame_bus(self) -> None:
+        if getattr(self, '_camera', None) is not None:
+            self._camera.disable_frame_bus()
+
+    def get_frame_bus_stats(self) -> dict:
+        if getattr(self, '_camera', None) is None:
+            return {}
+        return self._camera.get_frame_bus_stats()
+
+    @debug_decorator
+    def set_camera_profile(self, profile: str) -> None:
+        """캡처 프로필 전환: "vga", "vga_qvga"(+320x240 lores), "hd_vga"(1280x720 + 640x360 lores), "qvga"."""
+        if getattr(self, '_camera', None) is not None:
+            self._camera.set_profile(profile)
+            self._module_status.camera = self._camera.camera is not None
+
+    def get_camera_profile(self) -> str | None:
+        if getattr(self, '_camera', None) is None:
+            return None
+        return self._camera.profile
+
+    def mjpeg_gen(self, fps: float = None, quality: int = None, stream: str = "main", preset: str = "default"):
+        """카메라 프레임 도착에 맞춘 MJPEG 파트 생성기. fps로 상한, 느린 클라이언트에게는 최신 프레임만 보냄."""
         if getattr(self, '_camera', None) is None:
             return
-        yield from self._camera.mjpeg_gen()
+        yield from self._camera.mjpeg_gen(fps, quality, stream, preset)
+
+    def get_stream_stats(self) -> dict:
+        if getattr(self, '_camera', None) is None:
+            return {}
+        return self._camera.get_stream_stats()
+
+    # --- 비전 파이프라인 ---
+    def create_pipeline(self, stream: str = "main", name: str = "pipeline"):
+        """카메라 프레임을 단계별 워커로 처리하는 파이프라인. stage()로 단계를 추가하고 start()로 시작.
+
+        단계 사이 큐는 1칸(newest-wins)이며 get_stats()로 단계별 fps/지연/드롭 수를 본다. 코드 실행이 끝나면 자동으로 멈춘다.
+        """
+        if getattr(self, '_camera', None) is None:
+            return None
+        camera = self._camera
+        pipe = _Pipeline(lambda after, timeout: camera.wait_next(after, timeout, stream), name)
+        self._pipelines.add(pipe)
+        return pipe
+
+    def stop_pipelines(self) -> None:
+        """create_pipeline으로 만든 파이프라인을 모두 멈춘다."""
+        for pipe in list(getattr(self, '_pipelines', ())):
+            pipe.stop()
 
     # --- Image Processing ---
-    def mask_image(self, hsv_image, slider_values: list[int]):
+    def mask_image(self, hsv_image, slider_values: list[int], roi=None, scale: float = 1.0, from_bgr: bool = False):
+        """
+        HSV 범위 마스크
+
+        Args:
+            hsv_image: HSV 형식의 이미지 (numpy array) 또는 get_frame() 프레임 (HSV 변환은 프레임당 한 번)
+            slider_values: [h_lower, h_upper, s_lower, s_upper, v_lower, v_upper]
+            roi: 처리할 영역 (x, y, w, h). None이면 전체
+            scale: 처리 배율 (0~1]. 0.5면 가로세로 절반 크기로 계산
+            from_bgr: True면 hsv_image 자리에 BGR 카메라 프레임을 그대로 받아 HSV 변환 없이
+                      색 조회표(슬라이더 값이 바뀔 때만 다시 만듦)로 마스크. 경계 근처 색은 조금 다를 수 있음
+
+        Returns:
+            원본과 같은 크기의 마스크 (ROI 밖은 0)
+        """
         if slider_values is None or len(slider_values) != 6:
             print("배열의 값이 6개가 아닙니다.")
             return None
@@ -309,21 +468,233 @@ class Findee:
             print("이미지가 None 이거나 또는 np.ndarray가 아닙니다.")
             return None
 
-        lower_bound = np.array([int(slider_values[0]), int(slider_values[2]), int(slider_values[4])])
-        upper_bound = np.array([int(slider_values[1]), int(slider_values[3]), int(slider_values[5])])
+        if from_bgr:
+            masker = _get_bgr_mask_lut(slider_values).mask
+        else:
+            hsv_image = _as_hsv(hsv_image)
+            lower_bound = np.array([int(slider_values[0]), int(slider_values[2]), int(slider_values[4])])
+            upper_bound = np.array([int(slider_values[1]), int(slider_values[3]), int(slider_values[5])])
+            masker = lambda image: cv2.inRange(image, lower_bound, upper_bound)
 
-        return cv2.inRange(hsv_image, lower_bound, upper_bound)
+        if roi is None and scale == 1.0:
+            return masker(hsv_image)
+        try:
+            sub, box = _crop_scale(hsv_image, roi, scale)
+        except ValueError as e:
+            print(e)
+            return None
+        return _expand_mask(masker(sub), hsv_image.shape, box)
 
-    def detect_traffic_light(self, hsv_image, green_bound=None, red_bound=None):
+    def detect_colors(self, hsv_image, colors: dict, min_area: int = 100, roi=None, scale: float = 1.0) -> dict:
         """
-        신호등 색상 인식 함수 (Contour 기반 필터링)
+        여러 색을 한 번에 인식 (채널별 LUT 1회 + 색별 connected-component)
 
         Args:
-            hsv_image: HSV 형식의 이미지 (numpy array)
+            hsv_image: HSV 형식의 이미지 (numpy array) 또는 get_frame() 프레임
+            colors: {이름: [h_lower, h_upper, s_lower, s_upper, v_lower, v_upper]}
+                    색상환 양끝에 걸친 색은 범위 목록으로 지정 (예: {"red": [[0, 10, ...], [170, 180, ...]]}), 범위는 합쳐서 최대 8개
+            min_area: 가장 큰 연결 영역의 픽셀 수가 이 값 이상인 색만 결과에 포함 (원본 해상도 기준, scale에 맞춰 환산)
+            roi: 처리할 영역 (x, y, w, h). None이면 전체
+            scale: 처리 배율 (0~1]
+
+        Returns:
+            {이름: ColorBlob(area, x, y, w, h, cx, cy)} - 인식된 색만 포함, 좌표와 면적은 원본 프레임 기준
+        """
+        if hsv_image is None or not isinstance(hsv_image, np.ndarray):
+            return {}
+        try:
+            return _get_color_classifier(colors).classify(_as_hsv(hsv_image), min_area, roi, scale)
+        except (ValueError, TypeError) as e:
+            print(e)
+            return {}
+
+    def create_tracker(self, detect=None, color=None, every: int = 10, min_score: float = 0.6,
+                       search: float = 2.0, min_area: int = 100):
+        """
+        검출-후-추적기. 검출은 every 프레임마다 또는 추적 점수가 min_score보다 낮을 때만 하고,
+        그 사이에는 직전 위치 주변(search 배)에서 템플릿 매칭으로 위치만 갱신한다.
+
+        Args:
+            detect: BGR 프레임 -> (x, y, w, h) 또는 None 을 반환하는 검출 함수
+            color: detect 대신 HSV 범위(detect_colors와 같은 형식)를 주면 그 색의 가장 큰 영역을 검출
+            every: 검출 주기 (프레임 수)
+            min_score: 추적 신뢰도(템플릿 매칭 점수 -1~1) 하한
+            search: 탐색 창 크기 (직전 상자 대비 배율)
+            min_area: color 검출 시 최소 면적
+
+        Returns:
+            tracker - tracker.update(frame) -> TrackResult(box, cx, cy, score, detected, seq) 또는 None,
+            tracker.get_stats(), tracker.reset()
+        """
+        if detect is None and color is None:
+            print("detect 또는 color 중 하나가 필요합니다.")
+            return None
+        if detect is None:
+            try:
+                classifier = _get_color_classifier({"target": color})
+            except (ValueError, TypeError) as e:
+                print(e)
+                return None
+
+            def detect(frame):
+                hsv = frame.hsv if isinstance(frame, _Frame) and frame.derivable else cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+                blob = classifier.classify(hsv, min_area).get("target")
+                return (blob.x, blob.y, blob.w, blob.h) if blob is not None else None
+        try:
+            return _DetectTracker(detect, every, min_score, search)
+        except ValueError as e:
+            print(e)
+            return None
+
+    def detect_markers(self, frame, dictionary: str = "DICT_4X4_50", marker_length: float = None) -> list:
+        """
+        ArUco/AprilTag 마커 검출 (사전별 검출기 재사용, 직전 마커 주변 ROI 우선 검사)
+
+        Args:
+            frame: BGR 프레임 또는 gray 이미지
+            dictionary: cv2.aruco 사전 이름 (예: "DICT_4X4_50", "DICT_APRILTAG_36h11")
+            marker_length: 마커 한 변 길이. 주면 마커별 자세(rvec, tvec, distance)를 같은 단위로 계산
+
+        Returns:
+            [Marker(id, corners, cx, cy, rvec, tvec, distance)]
+        """
+        if frame is None or not isinstance(frame, np.ndarray):
+            return []
+        detectors = getattr(self, '_marker_detectors', None)
+        if detectors is None:
+            detectors = self._marker_detectors = {}
+        detector = detectors.get(dictionary)
+        if detector is None:
+            try:
+                detector = detectors[dictionary] = _MarkerDetector(dictionary)
+            except (RuntimeError, ValueError) as e:
+                print(e)
+                return []
+        intrinsics = None
+        if marker_length:
+            intrinsics = getattr(self, '_intrinsics', None)
+            if intrinsics is None:
+                # 보정값이 없으면 Pi 카메라 v2 화각으로 근사 (거리 오차 수 % 수준)
+                intrinsics = self._intrinsics = _Intrinsics.approximate((frame.shape[1], frame.shape[0]))
+        return _detect_markers(detector, frame, marker_length, intrinsics)
+
+    def set_camera_intrinsics(self, camera_matrix=None, dist_coeffs=None, size=(640, 480), path: str = None):
+        """
+        마커 자세 계산용 카메라 내부 파라미터 (cv2.calibrateCamera 결과)
+
+        Args:
+            camera_matrix: 3x3 카메라 행렬
+            dist_coeffs: 왜곡 계수 (없으면 0)
+            size: 보정한 해상도 (w, h). 다른 해상도 프레임에는 비율로 환산
+            path: camera_matrix 대신 파일(.npz: camera_matrix, dist_coeffs, size / .yml: OpenCV FileStorage)에서 읽기
+        """
+        if path is not None:
+            if path.endswith(".npz"):
+                data = np.load(path)
+                camera_matrix = data["camera_matrix"]
+                dist_coeffs = data["dist_coeffs"] if "dist_coeffs" in data else None
+                size = tuple(data["size"]) if "size" in data else size
+            else:
+                fs = cv2.FileStorage(path, cv2.FILE_STORAGE_READ)
+                camera_matrix = fs.getNode("camera_matrix").mat()
+                dist_coeffs = fs.getNode("dist_coeffs").mat()
+                node = fs.getNode("size")
+                size = tuple(int(v) for v in node.mat().reshape(-1)) if not node.empty() else size
+                fs.release()
+        if camera_matrix is None:
+            self._intrinsics = None
+            return
+        self._intrinsics = _Intrinsics(camera_matrix, dist_coeffs, size)
+
+    def get_marker_stats(self) -> dict:
+        """사전별 프레임 수, ROI/전체 검사 횟수, 검출·자세 계산 소요 히스토그램."""
+        return {name: d.get_stats() for name, d in getattr(self, '_marker_detectors', {}).items()}
+
+    def follow_line(self, frame, bands=(0.55, 0.7, 0.85, 0.95), band_height: int = 6, color=None,
+                    threshold: int = None, dark: bool = True, min_width: int = 4):
+        """
+        라인 트레이싱: 몇 개의 가로 띠만 이진화해 띠별 선 중심/폭과 좌우 오프셋, 기울기를 구한다
+
+        Args:
+            frame: BGR 카메라 프레임
+            bands: 검사할 띠의 세로 위치 (0~1 실수는 화면 높이 비율, 정수는 픽셀 y)
+            band_height: 띠 높이 (픽셀)
+            color: 선 색 HSV 범위 [h_lower, h_upper, s_lower, s_upper, v_lower, v_upper]. None이면 밝기로 판단
+            threshold: 밝기 임계값 (None이면 띠 픽셀로 Otsu 자동 결정)
+            dark: True면 바닥보다 어두운 선(검은 테이프), False면 밝은 선
+            min_width: 이보다 좁게 잡힌 띠는 잡음으로 무시 (픽셀)
+
+        Returns:
+            LineResult(found, offset(-1~1), offset_px, angle(도, 앞쪽이 오른쪽으로 기울면 +), bands)
+        """
+        if frame is None or not isinstance(frame, np.ndarray):
+            return _LineResult(False)
+        return _follow_line(frame, bands, band_height, color, threshold, dark, min_width)
+
+    def create_motion_detector(self, width: int = 80, alpha: float = 0.05, threshold: int = 25, min_area: int = 4,
+                               trigger: float = 0.01, hold: int = 5):
+        """
+        저해상도 움직임 감지기. 프레임을 폭 width의 gray로 줄여 누적 평균 배경과 비교한다 (매 프레임 호출해도 가벼움)
+
+        Args:
+            width: 비교 해상도 폭 (픽셀, 높이는 비율 유지)
+            alpha: 배경 학습률 (0~1, 클수록 멈춘 물체가 빨리 배경이 됨)
+            threshold: 배경과의 밝기 차 임계값 (0~255)
+            min_area: 영역으로 인정할 최소 픽셀 수 (줄인 프레임 기준)
+            trigger: moving으로 판단할 움직임 점수 하한 (바뀐 픽셀 비율)
+            hold: 움직임이 멎은 뒤 moving을 유지할 프레임 수
+
+        Returns:
+            detector - detector.update(frame) -> MotionResult(moving, score, regions, seq),
+            detector.get_stats(), detector.reset()
+        """
+        try:
+            return _MotionDetector(width, alpha, threshold, min_area, trigger, hold)
+        except ValueError as e:
+            print(e)
+            return None
+
+    def create_visual_odometry(self, camera_height: float = 0.1, tilt: float = 30.0, width: int = 160,
+                               max_points: int = 80, levels: int = 2, win: int = 15, max_range: float = 1.5,
+                               use_imu: bool = True, yaw_sign: float = 1.0):
+        """
+        희소 광류 시각 주행거리계. 바닥 특징점을 피라미드 LK로 추적해 프레임마다 이동량을 구하고 IMU yaw로 방향을 합친다
+
+        Args:
+            camera_height: 바닥에서 카메라까지 높이 (이 단위가 x/y 단위, 보통 m)
+            tilt: 카메라가 아래로 기울어진 각도 (0 수평 ~ 90 바로 아래)
+            width: 처리 해상도 폭 (픽셀, 작을수록 빠름)
+            max_points: 추적점 최대 수
+            levels: LK 피라미드 단계 수 (빠른 움직임일수록 크게)
+            win: LK 탐색 창 크기 (픽셀)
+            max_range: 이보다 먼 바닥 점은 쓰지 않음 (camera_height 단위)
+            use_imu: IMU yaw로 회전을 구함 (False이거나 IMU가 없으면 영상으로 추정)
+            yaw_sign: IMU yaw가 오른쪽 회전에 증가하면 -1
+
+        Returns:
+            odometry - odometry.update(frame) -> VoPose(x, y, heading, dx, dy, tracked, ok, seq),
+            odometry.reset(x=0, y=0, heading=0), odometry.get_stats()
+        """
+        imu = getattr(self, '_imu', None) if use_imu else None
+        try:
+            return _FlowOdometry(imu, getattr(self, '_intrinsics', None), camera_height, tilt, width,
+                                 max_points, max(3, max_points // 3), levels, win, max_range, yaw_sign)
+        except ValueError as e:
+            print(e)
+            return None
+
+    def detect_traffic_light(self, hsv_image, green_bound=None, red_bound=None, roi=None, scale: float = 1.0):
+        """
+        신호등 색상 인식 함수 (Contour 기반 필터링, 빨간색 우선)
+
+        Args:
+            hsv_image: HSV 형식의 이미지 (numpy array) 또는 get_frame() 프레임
             green_bound: 초록색 HSV 범위 [h_lower, h_upper, s_lower, s_upper, v_lower, v_upper]
                         기본값: [30, 80, 20, 255, 100, 255]
             red_bound: 빨간색 HSV 범위 [h_lower, h_upper, s_lower, s_upper, v_lower, v_upper]
                       기본값: [160, 180, 90, 255, 200, 255]
+            roi: 신호등을 찾을 영역 (x, y, w, h). None이면 전체
+            scale: 처리 배율 (0~1]. 최소 면적(100px)은 원본 해상도 기준으로 유지
 
         Returns:
             0: 인식되지 않음
@@ -342,30 +713,10 @@ class Findee:
             print("HSV 범위 배열은 6개의 요소를 가져야 합니다.")
             return 0
 
-        green_lower = np.array([green_bound[0], green_bound[2], green_bound[4]])
-        green_upper = np.array([green_bound[1], green_bound[3], green_bound[5]])
-        green_mask = cv2.inRange(hsv_image, green_lower, green_upper)
-
-        red_lower = np.array([red_bound[0], red_bound[2], red_bound[4]])
-        red_upper = np.array([red_bound[1], red_bound[3], red_bound[5]])
-        red_mask = cv2.inRange(hsv_image, red_lower, red_upper)
-
-        def get_largest_contour_area(mask):
-            contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            if not contours:
-                return 0
-            largest_contour = max(contours, key=cv2.contourArea)
-            return cv2.contourArea(largest_contour)
-
-        green_area = get_largest_contour_area(green_mask)
-        red_area = get_largest_contour_area(red_mask)
-        min_area = 100
-
-        if red_area >= min_area:
-            return 2
-        elif green_area >= min_area:
-            return 1
-        else:
+        try:
+            return _traffic_light(_as_hsv(hsv_image), green_bound, red_bound, 100, roi, scale)
+        except (ValueError, TypeError) as e:
+            print(e)
             return 0
 
     def cleanup(self):
@@ -394,6 +745,7 @@ class Findee:
         if hasattr(self, '_motor') and self._motor is not None:
             self._motor.cleanup()
             self._motor = None
+        self.stop_pipelines()
         if hasattr(self, '_camera') and self._camera is not None:
             self._camera.cleanup()
             self._camera = None
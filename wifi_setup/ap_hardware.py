@@ -8,8 +8,6 @@ import threading
 import time
 from typing import Callable, Optional
 
-import cv2
-
 _lock = threading.Lock()
 _motor = None
 _camera = None
@@ -64,13 +62,14 @@ def _loop() -> None:
             if frame_skip >= 1 and camera and not mock:
                 frame_skip = 0
                 try:
-                    frame = camera.get_frame()
-                    if frame is not None:
-                        ok, buf = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 55])
-                        if ok:
+                    ref = camera.get_frame_ref("lores")
+                    if ref is not None:
+                        with ref:
+                            jpg = camera.encode_jpeg(ref.array, 55)
+                        if jpg is not None:
                             emit(
                                 "ap_camera_frame",
-                                {"jpeg": base64.b64encode(buf.tobytes()).decode("ascii")},
+                                {"jpeg": base64.b64encode(jpg).decode("ascii")},
                                 room=sid,
                             )
                 except Exception:
@@ -103,7 +102,7 @@ def start_session(emit_fn: Callable[..., None], sid: str) -> tuple[bool, str]:
             _motor = _MotorUltrasonic()
             _motor.gpio_init()
             _camera = _Camera()
-            _camera.init()
+            _camera.init("vga_qvga")
         except Exception as e:
             _cleanup_hw()
             return False, str(e)